@@ -27,6 +27,39 @@ log_error() {
     echo -e "${RED}[ERROR]${NC} $1" >&2
 }
 
+# ============================================================================
+# Performance Tracing
+# ============================================================================
+
+# With ARCKIT_PROFILE set (to anything but 0), trace_begin/trace_end append
+# Chrome trace events to $ARCKIT_PROFILE_FILE (default arckit-bash-trace.json)
+# for chrome://tracing or ui.perfetto.dev. The file uses the JSON array
+# format, whose closing bracket is optional, so each run simply appends.
+# Timestamps come from $EPOCHREALTIME (bash 5+), so tracing forks nothing;
+# older shells skip it.
+ARCKIT_TRACE_FILE=""
+if [[ -n "${ARCKIT_PROFILE:-}" && "$ARCKIT_PROFILE" != "0" && -n "${EPOCHREALTIME:-}" ]]; then
+    ARCKIT_TRACE_FILE="${ARCKIT_PROFILE_FILE:-arckit-bash-trace.json}"
+    [[ -s "$ARCKIT_TRACE_FILE" ]] || echo "[" > "$ARCKIT_TRACE_FILE"
+fi
+
+_trace_event() {
+    local name="${2//\\/\\\\}"
+    name="${name//\"/\\\"}"
+    printf '{"name":"%s","cat":"%s","ph":"%s","ts":%s,"pid":%d,"tid":%d},\n' \
+        "$name" "${0##*/}" "$1" "${EPOCHREALTIME/[.,]/}" "$$" "$$" >> "$ARCKIT_TRACE_FILE"
+}
+
+# Open a named span, e.g. trace_begin "scan $project_name"
+trace_begin() {
+    [[ -z "$ARCKIT_TRACE_FILE" ]] || _trace_event B "$1"
+}
+
+# Close the innermost open span
+trace_end() {
+    [[ -z "$ARCKIT_TRACE_FILE" ]] || _trace_event E "${1:-}"
+}
+
 # Find the repository root
 find_repo_root() {
     local current_dir="$PWD"
@@ -56,7 +89,7 @@ get_next_project_number() {
         if [[ -d "$dir" ]]; then
             local basename="$(basename "$dir")"
             if [[ "$basename" =~ ^([0-9]{3})- ]]; then
-                local num="${BASH_REMATCH[1]}"
+                local num="$((10#${BASH_REMATCH[1]}))"
                 if ((num > max_num)); then
                     max_num=$num
                 fi
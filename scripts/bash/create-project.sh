@@ -25,6 +25,11 @@ Examples:
 
 Interactive Mode:
     If --name is not provided, the script will prompt you for a project name.
+
+Environment:
+    ARCKIT_CLI    Command used to allocate the project number (default: arckit).
+                  Set it to an empty string to number projects by scanning
+                  projects/ instead.
 EOF
     exit 1
 }
@@ -99,6 +104,17 @@ if [[ -z "$PROJECT_NAME" ]]; then
     fi
 fi
 
+# Let the CLI allocate the number from its registry when it is installed,
+# so concurrent creators never pick the same one
+ARCKIT_CLI="${ARCKIT_CLI-arckit}"
+if [[ -n "$ARCKIT_CLI" ]] && command -v "$ARCKIT_CLI" >/dev/null 2>&1; then
+    ARCKIT_ARGS=(projects create --name "$PROJECT_NAME" --force --root "$REPO_ROOT")
+    if [[ "$OUTPUT_JSON" == "true" ]]; then
+        ARCKIT_ARGS+=(--json)
+    fi
+    exec "$ARCKIT_CLI" "${ARCKIT_ARGS[@]}"
+fi
+
 # Get next project number
 PROJECT_NUMBER="$(get_next_project_number "$REPO_ROOT")"
 log_info "Project number: $PROJECT_NUMBER"
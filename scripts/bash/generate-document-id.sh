@@ -29,7 +29,8 @@ if [ -z "$DOC_TYPE" ]; then
 fi
 
 # Ensure PROJECT_ID is zero-padded to 3 digits
-PROJECT_ID_PADDED=$(printf "%03d" "$PROJECT_ID")
+# (10# so that leading zeros are not read as octal: 042 stays 42)
+PROJECT_ID_PADDED=$(printf "%03d" "$((10#$PROJECT_ID))")
 
 # Generate document ID
 DOC_ID="ARC-${PROJECT_ID_PADDED}-${DOC_TYPE}-v${VERSION}"
@@ -196,9 +196,11 @@ if [[ "$JSON_MODE" == "true" ]]; then
     echo "  \"project_count\": $PROJECT_COUNT,"
     echo "  \"projects\": ["
 
+    trace_begin "list projects"
     first_project=true
     for project_dir in "$PROJECTS_DIR"/*; do
         if [[ -d "$project_dir" ]]; then
+            trace_begin "${project_dir##*/}"
             if [[ "$first_project" == "true" ]]; then
                 first_project=false
             else
@@ -229,8 +231,10 @@ if [[ "$JSON_MODE" == "true" ]]; then
             echo "        \"vendors\": $(check_artifact "$project_dir" "vendors/")"
             echo "      }"
             echo -n "    }"
+            trace_end
         fi
     done
+    trace_end
 
     echo ""
     echo "  ]"
@@ -246,8 +250,10 @@ echo "Repository: $REPO_ROOT"
 echo "Projects found: $PROJECT_COUNT"
 echo ""
 
+trace_begin "list projects"
 for project_dir in "$PROJECTS_DIR"/*; do
     if [[ -d "$project_dir" ]]; then
+        trace_begin "${project_dir##*/}"
         project_name=$(basename "$project_dir")
         project_number=$(get_project_number_from_dir "$project_dir" || echo "")
         vendor_count=$(count_vendors "$project_dir")
@@ -323,8 +329,10 @@ for project_dir in "$PROJECTS_DIR"/*; do
 
             echo ""
         fi
+        trace_end
     fi
 done
+trace_end
 
 echo ""
 echo "Legend:"
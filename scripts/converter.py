@@ -1,56 +1,23 @@
-import os
-import re
+"""Deprecated: use `arckit build-commands --target gemini` instead.
 
-def convert_claude_to_gemini():
-    claude_dir = '.claude/commands/'
-    gemini_dir = '.gemini/commands/arckit'
-
-    if not os.path.exists(gemini_dir):
-        os.makedirs(gemini_dir)
-
-    for filename in os.listdir(claude_dir):
-        if filename.endswith('.md'):
-            claude_path = os.path.join(claude_dir, filename)
-            
-            with open(claude_path, 'r') as f:
-                content = f.read()
+Kept so existing workflows that run `python scripts/converter.py` from the
+repository root keep working; it now delegates to the incremental compiler in
+arckit_cli, which also fixes TOML escaping of descriptions.
+"""
 
-            # Extract frontmatter and prompt
-            description = ''
-            prompt = content
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) > 1:
-                    frontmatter = parts[1]
-                    prompt = parts[2].strip()
-                    desc_match = re.search(r'description:\s*(.*)', frontmatter)
-                    if desc_match:
-                        description = desc_match.group(1).strip()
-                        # Remove surrounding quotes if present (from YAML)
-                        if description.startswith('"') and description.endswith('"'):
-                            description = description[1:-1]
-                        elif description.startswith("'") and description.endswith("'"):
-                            description = description[1:-1]
+import sys
 
-            # Prepare TOML content
-            # The prompt needs to be enclosed in triple quotes and properly escaped.
-            prompt_formatted = '"""\n' + prompt.replace('\\', '\\\\').replace('"', '\\"') + '\n"""'
 
-            # Replace $ARGUMENTS with {{args}}
-            prompt_formatted = prompt_formatted.replace('$ARGUMENTS', '{{args}}')
-
-            # Use triple quotes for description to handle special characters
-            description_formatted = '"""\n' + description + '\n"""'
-
-            toml_content = f'description = {description_formatted}\nprompt = {prompt_formatted}\n'
+def convert_claude_to_gemini():
+    from arckit_cli.compiler import build_commands
 
-            # Create new filename
-            new_filename = filename.replace('arckit.', '').replace('.md', '.toml')
-            gemini_path = os.path.join(gemini_dir, new_filename)
+    report = build_commands(".", targets=("gemini",))
+    for key in report.built:
+        print(f"Converted {key}")
+    for key, error in report.errors.items():
+        print(f"Failed {key}: {error}", file=sys.stderr)
+    return not report.errors
 
-            with open(gemini_path, 'w') as f:
-                f.write(toml_content)
-            print(f"Converted {claude_path} to {gemini_path}")
 
 if __name__ == '__main__':
-    convert_claude_to_gemini()
+    sys.exit(0 if convert_claude_to_gemini() else 1)
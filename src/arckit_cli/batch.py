@@ -0,0 +1,219 @@
+"""Provision many ArcKit projects at once from a YAML or CSV manifest.
+
+The bundled data paths are resolved and every asset is read exactly once in
+the parent process; worker processes receive the contents through the pool
+initializer and only write files. Each project produces a summary record and
+a failure in one project never stops the others.
+
+Manifest formats::
+
+    # portfolio.yaml
+    defaults:
+      ai: claude
+    projects:
+      - name: payments-modernisation
+      - name: hr-platform
+        ai: gemini
+        no_git: true
+
+    # portfolio.csv
+    name,ai,no_git
+    payments-modernisation,claude,
+    hr-platform,gemini,true
+"""
+
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import AGENT_CONFIG
+
+TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+
+
+class ManifestError(ValueError):
+    """Raised when a batch manifest cannot be read."""
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """One project to create."""
+
+    name: str
+    ai: str = "claude"
+    no_git: bool = False
+
+
+def _as_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+
+def _spec_from_row(row: dict, defaults: dict, line: int) -> ProjectSpec:
+    merged = {**defaults, **{k: v for k, v in row.items() if v not in (None, "")}}
+    name = str(merged.get("name") or "").strip()
+    if not name:
+        raise ManifestError(f"entry {line}: missing project name")
+    # Names become directories under the base directory and must stay inside it
+    if "/" in name or "\\" in name or name in (".", "..") or Path(name).is_absolute():
+        raise ManifestError(f"entry {line}: project name '{name}' must be a plain directory name, not a path")
+    ai = str(merged.get("ai") or "claude").strip().lower()
+    if ai not in AGENT_CONFIG:
+        raise ManifestError(f"entry {line}: invalid AI assistant '{ai}' (choose from {', '.join(AGENT_CONFIG)})")
+    return ProjectSpec(name=name, ai=ai, no_git=_as_bool(merged.get("no_git")))
+
+
+def load_project_specs(path: Path, default_ai: str = None) -> list:
+    """Read project specs from a ``.yaml``/``.yml`` or ``.csv`` manifest.
+
+    Settings are merged in order: the manifest's ``defaults``, then
+    ``default_ai`` (the command line ``--ai``) when given, then each entry.
+    """
+    path = Path(path)
+    defaults = {}
+    suffix = path.suffix.lower()
+
+    if suffix in (".yaml", ".yml"):
+        import yaml
+
+        try:
+            data = yaml.safe_load(path.read_text()) or []
+        except yaml.YAMLError as e:
+            raise ManifestError(f"invalid YAML manifest: {e}") from None
+        if isinstance(data, dict):
+            manifest_defaults = data.get("defaults") or {}
+            if not isinstance(manifest_defaults, dict):
+                raise ManifestError("'defaults' must be a mapping")
+            defaults.update(manifest_defaults)
+            data = data.get("projects") or []
+        if not isinstance(data, list):
+            raise ManifestError("YAML manifest must be a list of projects or a mapping with a 'projects' list")
+        rows = [row if isinstance(row, dict) else {"name": row} for row in data]
+    elif suffix == ".csv":
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        raise ManifestError(f"unsupported manifest type '{path.suffix}' (expected .yaml, .yml or .csv)")
+
+    if default_ai:
+        defaults["ai"] = default_ai
+    specs = [_spec_from_row(row, defaults, line) for line, row in enumerate(rows, start=1)]
+    names = [spec.name for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ManifestError(f"duplicate project names: {', '.join(duplicates)}")
+    return specs
+
+
+# Per-worker state, populated once by _init_worker
+_assets = None
+_contents = None
+
+
+def _init_worker(assets: dict, contents: dict):
+    global _assets, _contents
+    _assets = assets
+    _contents = contents
+
+    # Workers report through their summary record, not the console
+    from .ui import console
+
+    console.quiet = True
+
+
+def _provision(spec: ProjectSpec, base_dir: str) -> dict:
+    from .git import init_git_repo, is_git_repo
+    from .installer import MANIFEST_FILE, install, write_manifest
+    from .scaffold import project_directories, project_readme, write_codex_environment
+    from .tools import check_tool
+
+    start = time.perf_counter()
+    project_path = (Path(base_dir) / spec.name).resolve()
+    summary = {
+        "name": spec.name,
+        "path": str(project_path),
+        "ai": spec.ai,
+        "status": "ok",
+        "error": None,
+        "files_written": 0,
+        "bytes_written": 0,
+        "git": "skipped",
+        "timings": {},
+    }
+    timings = summary["timings"]
+
+    def lap(step, since):
+        now = time.perf_counter()
+        timings[step] = round(now - since, 4)
+        return now
+
+    try:
+        if project_path.exists():
+            raise FileExistsError(f"Directory '{spec.name}' already exists")
+
+        t = time.perf_counter()
+        for directory in project_directories(spec.ai):
+            (project_path / directory).mkdir(parents=True, exist_ok=True)
+        t = lap("structure", t)
+
+        entries = _assets[spec.ai]
+        report = install(entries, project_path, workers=4, contents=_contents)
+        write_manifest(entries, project_path / MANIFEST_FILE)
+        (project_path / "README.md").write_text(project_readme(spec.name, spec.ai))
+        summary["files_written"] = report.files_copied + 2
+        summary["bytes_written"] = report.bytes_copied
+        t = lap("assets", t)
+
+        if not spec.no_git and check_tool("git") and not is_git_repo(project_path):
+            summary["git"] = "initialized" if init_git_repo(project_path, fresh=True) else "failed"
+        t = lap("git", t)
+
+        if spec.ai == "codex":
+            write_codex_environment(project_path)
+            summary["files_written"] += 2
+    except Exception as e:
+        summary["status"] = "error"
+        summary["error"] = f"{type(e).__name__}: {e}"
+
+    timings["total"] = round(time.perf_counter() - start, 4)
+    return summary
+
+
+def provision_projects(specs, data_paths: dict, jobs: int = None, base_dir: Path = None, on_result=None) -> list:
+    """Create every project in ``specs`` concurrently and return their summaries.
+
+    ``on_result`` is called with each summary as soon as its project finishes.
+    Summaries are returned in manifest order.
+    """
+    from .installer import build_manifest, load_contents
+    from .scaffold import asset_groups
+
+    base_dir = str(base_dir or Path.cwd())
+    assets = {}
+    for ai in sorted({spec.ai for spec in specs}):
+        groups = asset_groups(data_paths, ai)
+        assets[ai] = build_manifest((src, pattern, prefix) for _, src, pattern, prefix in groups)
+    contents = {}
+    for entries in assets.values():
+        contents.update(load_contents(entry for entry in entries if entry.path not in contents))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(specs) or 1))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(assets, contents)) as pool:
+        futures = {pool.submit(_provision, spec, base_dir): spec for spec in specs}
+        for future in as_completed(futures):
+            spec = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed); report and carry on
+                summary = {"name": spec.name, "ai": spec.ai, "status": "error",
+                           "error": f"{type(e).__name__}: {e}"}
+            results[spec.name] = summary
+            if on_result:
+                on_result(summary)
+    return [results[spec.name] for spec in specs]
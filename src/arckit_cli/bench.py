@@ -0,0 +1,450 @@
+"""Benchmark suite behind ``arckit bench``.
+
+Synthetic workspaces of each requested size are generated from the bundled
+templates. Projects are spread across the lifecycle, so early ones have a
+few artifacts and later ones most of them, with vendors and Wardley maps
+mixed in. The key operations are then timed over several rounds. Results
+are keyed ``operation@size`` (``@-`` for operations that do not depend on
+the workspace) and can be saved as a baseline. A later run compared with
+that baseline flags an operation as regressed when its median is slower by
+more than the threshold *and* by more than a noise floor in milliseconds.
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import span
+
+BASELINE_VERSION = 1
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_ROUNDS = 3
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 2.0
+
+# Artifact -> bundled template, in the order a project usually produces them
+ARTIFACT_TEMPLATES = [
+    ("stakeholder-drivers.md", "stakeholder-drivers-template.md"),
+    ("risk-register.md", "risk-register-template.md"),
+    ("requirements.md", "requirements-template.md"),
+    ("sobc.md", "sobc-template.md"),
+    ("research-findings.md", "research-findings-template.md"),
+    ("data-model.md", "data-model-template.md"),
+    ("wardley-maps/current-state.md", "wardley-map-template.md"),
+    ("sow.md", "sow-template.md"),
+    ("evaluation-criteria.md", "evaluation-criteria-template.md"),
+]
+
+
+class BenchError(RuntimeError):
+    """Raised for an unusable baseline or benchmark configuration."""
+
+
+@dataclass
+class Workspace:
+    """A generated workspace: repository root, projects and how big it came out."""
+
+    root: Path
+    size: int
+    project_dirs: list = field(default_factory=list)
+    files: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass
+class Operation:
+    """A timed operation; ``sized`` ones run once per workspace size.
+
+    ``setup`` runs untimed before every round (to make a cold start cold);
+    ``warmup`` runs the operation once, untimed, before the rounds.
+    """
+
+    name: str
+    run: object
+    sized: bool = True
+    setup: object = None
+    warmup: bool = True
+
+
+@dataclass
+class Result:
+    operation: str
+    size: int = None
+    samples: list = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.operation}@{self.size if self.size is not None else '-'}"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def to_json(self) -> dict:
+        return {
+            "operation": self.operation,
+            "size": self.size,
+            "rounds": len(self.samples),
+            "median_ms": round(self.median, 3),
+            "min_ms": round(min(self.samples), 3),
+            "max_ms": round(max(self.samples), 3),
+        }
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline_ms: float = None
+    current_ms: float = None
+    status: str = "ok"
+
+    @property
+    def ratio(self):
+        if self.baseline_ms and self.current_ms is not None:
+            return self.current_ms / self.baseline_ms
+        return None
+
+    def to_json(self) -> dict:
+        ratio = self.ratio
+        return {"key": self.key, "baseline_ms": self.baseline_ms, "current_ms": round(self.current_ms, 3),
+                "ratio": round(ratio, 3) if ratio is not None else None, "status": self.status}
+
+
+def generate_workspace(root: Path, size: int, templates_dir: Path) -> Workspace:
+    """Write ``size`` projects with filled-in template artifacts under ``root``."""
+    start = time.perf_counter()
+    root = Path(root)
+    workspace = Workspace(root, size)
+    (root / ".arckit" / "memory").mkdir(parents=True, exist_ok=True)
+    (root / ".arckit" / "memory" / "architecture-principles.md").write_text(
+        "# Architecture Principles\n\n## 1. Cloud first\n\n## 2. Open standards\n", encoding="utf-8")
+    shutil.copytree(templates_dir, root / ".arckit" / "templates", dirs_exist_ok=True)
+    templates = {name: (Path(templates_dir) / name).read_text(encoding="utf-8")
+                 for _, name in ARTIFACT_TEMPLATES if (Path(templates_dir) / name).is_file()}
+
+    for i in range(1, size + 1):
+        number = f"{i:03d}" if i < 1000 else str(i)
+        name = f"Synthetic Project {i}"
+        project_dir = root / "projects" / f"{number}-synthetic-project-{i}"
+        (project_dir / "vendors").mkdir(parents=True)
+        (project_dir / "final").mkdir()
+        # Between one and all artifacts, spread evenly across the projects
+        produced = 1 + (i * 7) % len(ARTIFACT_TEMPLATES)
+        for artifact, template in ARTIFACT_TEMPLATES[:produced]:
+            if template not in templates:
+                continue
+            text = (templates[template].replace("[PROJECT_ID]", number)
+                    .replace("[PROJECT_NAME]", name).replace("[VERSION]", "1.0"))
+            path = project_dir / artifact
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+            workspace.files += 1
+            workspace.bytes += len(text)
+        if i % 3 == 0:
+            vendor = project_dir / "vendors" / "acme-ltd"
+            vendor.mkdir()
+            proposal = f"# Acme Ltd proposal for {name}\n\n## Approach\n\nWe meet FR-001 and NFR-S-001.\n"
+            (vendor / "proposal.md").write_text(proposal, encoding="utf-8")
+            workspace.files += 1
+            workspace.bytes += len(proposal)
+        workspace.project_dirs.append(project_dir)
+    workspace.elapsed = time.perf_counter() - start
+    return workspace
+
+
+def _middle_project(workspace: Workspace) -> Path:
+    return workspace.project_dirs[len(workspace.project_dirs) // 2]
+
+
+def _fullest_project(workspace: Workspace) -> Path:
+    # The project number whose artifact count wraps round to the full set
+    for project_dir in workspace.project_dirs:
+        if len(list(project_dir.glob("*.md"))) >= len(ARTIFACT_TEMPLATES) - 1:
+            return project_dir
+    return workspace.project_dirs[-1]
+
+
+def _list_scan(workspace: Workspace):
+    from .workspace import list_projects
+
+    list_projects(workspace.root, use_index=False)
+
+
+def _list_indexed(workspace: Workspace):
+    from .workspace import list_projects
+
+    list_projects(workspace.root)
+
+
+def _check(workspace: Workspace):
+    from .workspace import available_docs, prerequisites_json
+
+    project_dir = _middle_project(workspace)
+    prerequisites_json(workspace.root, project_dir, available_docs(project_dir))
+
+
+def _index_refresh(workspace: Workspace):
+    from .index import connect, refresh
+
+    conn = connect(workspace.root)
+    try:
+        refresh(conn, workspace.root)
+    finally:
+        conn.close()
+
+
+def _drop_index(workspace: Workspace):
+    from .index import INDEX_FILE
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{workspace.root / INDEX_FILE}{suffix}").unlink(missing_ok=True)
+
+
+def _index_search(workspace: Workspace):
+    from .index import connect, search
+
+    conn = connect(workspace.root)
+    try:
+        search(conn, "security requirements", limit=20)
+    finally:
+        conn.close()
+
+
+def _mdcache_load(workspace: Workspace, cache_dir: Path = None):
+    from .mdcache import MdCache
+
+    cache = MdCache(cache_dir)
+    for project_dir in workspace.project_dirs:
+        path = project_dir / "requirements.md"
+        if path.exists():
+            cache.load(path).sections
+    cache.save()
+    cache.clear()
+
+
+def _mdcache_cold(workspace: Workspace):
+    _mdcache_load(workspace)
+
+
+def _mdcache_disk(workspace: Workspace):
+    _mdcache_load(workspace, workspace.root / ".arckit" / "cache" / "bench-markdown")
+
+
+def _lint(workspace: Workspace):
+    from .lint import lint_projects
+
+    lint_projects(workspace.project_dirs, workspace.root)
+
+
+def _trace(workspace: Workspace):
+    from .mdcache import MdCache
+    from .trace import build_index
+
+    build_index(_fullest_project(workspace), MdCache.for_repo(workspace.root))
+
+
+def _create(workspace: Workspace):
+    from .workspace import create_project
+
+    create_project(workspace.root, "Bench created project")
+
+
+def _allocate(workspace: Workspace):
+    from .registry import Registry
+
+    Registry(workspace.root).allocate_project("bench")
+
+
+def _startup(_workdir: Path):
+    subprocess.run([sys.executable, "-c", "import sys; from arckit_cli import main; "
+                    "sys.argv = ['arckit', 'projects', '--help']; main()"],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+
+def _probe_data_paths(_workdir: Path):
+    from .paths import resolve_data_root
+
+    resolve_data_root(use_cache=False)
+
+
+def _scaffold(workdir: Path):
+    from .installer import MANIFEST_FILE, build_manifest, install, write_manifest
+    from .paths import get_data_paths
+    from .scaffold import asset_groups, project_directories
+
+    project_path = workdir / "init"
+    shutil.rmtree(project_path, ignore_errors=True)
+    for directory in project_directories("claude"):
+        (project_path / directory).mkdir(parents=True, exist_ok=True)
+    entries = build_manifest((src, pattern, prefix)
+                             for _, src, pattern, prefix in asset_groups(get_data_paths(), "claude"))
+    install(entries, project_path)
+    write_manifest(entries, project_path / MANIFEST_FILE)
+
+
+def _git_bootstrap(workdir: Path):
+    from .git import init_git_repo
+
+    project_path = workdir / "init"
+    shutil.rmtree(project_path / ".git", ignore_errors=True)
+    init_git_repo(project_path, fresh=True)
+
+
+def operations() -> list:
+    """Every benchmarked operation, in the order they run."""
+    ops = [
+        Operation("cli.startup", _startup, sized=False, warmup=False),
+        Operation("paths.probe", _probe_data_paths, sized=False),
+        Operation("init.scaffold", _scaffold, sized=False),
+    ]
+    if shutil.which("git"):
+        ops.append(Operation("init.git", _git_bootstrap, sized=False))
+    return ops + [
+        Operation("projects.list.scan", _list_scan),
+        Operation("projects.list.indexed", _list_indexed),
+        Operation("projects.check", _check),
+        Operation("index.refresh.cold", _index_refresh, setup=_drop_index, warmup=False),
+        Operation("index.refresh.warm", _index_refresh),
+        Operation("index.search", _index_search),
+        Operation("mdcache.parse", _mdcache_cold, warmup=False),
+        Operation("mdcache.disk", _mdcache_disk),
+        Operation("trace.project", _trace),
+        Operation("lint.workspace", _lint),
+        Operation("registry.allocate", _allocate),
+        Operation("projects.create", _create),
+    ]
+
+
+def select(ops: list, only=()) -> list:
+    """Operations whose name contains any of ``only`` (all of them when empty)."""
+    if not only:
+        return ops
+    chosen = [op for op in ops if any(pattern in op.name for pattern in only)]
+    if not chosen:
+        raise BenchError(f"no operation matches {', '.join(only)}")
+    return chosen
+
+
+def time_operation(op: Operation, target, rounds: int, size: int = None) -> Result:
+    result = Result(op.name, size)
+    if op.warmup:
+        op.run(target)
+    for _ in range(rounds):
+        if op.setup:
+            op.setup(target)
+        with span(f"bench {op.name}", cat="bench", size=size):
+            start = time.perf_counter()
+            op.run(target)
+            result.samples.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def run(sizes=DEFAULT_SIZES, rounds: int = DEFAULT_ROUNDS, only=(), workdir: Path = None,
+        on_workspace=None, on_result=None) -> list:
+    """Generate the workspaces and time every selected operation; returns :class:`Result` list.
+
+    Workspaces are made under ``workdir`` (kept) or a temporary directory
+    (removed afterwards). ``on_workspace`` and ``on_result`` are progress
+    callbacks.
+    """
+    from .paths import get_data_paths
+    from .ui import console
+
+    ops = select(operations(), only)
+    templates_dir = get_data_paths()["templates"]
+    if not templates_dir.is_dir():
+        raise BenchError(f"bundled templates not found at {templates_dir}")
+
+    results = []
+    # Operations print through the shared console; keep it quiet except for progress
+    quiet = console.quiet
+
+    def report(callback, value):
+        if callback:
+            console.quiet = quiet
+            callback(value)
+            console.quiet = True
+
+    with tempfile.TemporaryDirectory(prefix="arckit-bench-") as tmp:
+        base = Path(workdir) if workdir else Path(tmp)
+        base.mkdir(parents=True, exist_ok=True)
+        console.quiet = True
+        try:
+            for op in (op for op in ops if not op.sized):
+                results.append(time_operation(op, base, rounds))
+                report(on_result, results[-1])
+            sized = [op for op in ops if op.sized]
+            for size in sizes if sized else ():
+                root = base / f"workspace-{size}"
+                shutil.rmtree(root, ignore_errors=True)
+                workspace = generate_workspace(root, size, templates_dir)
+                report(on_workspace, workspace)
+                for op in sized:
+                    results.append(time_operation(op, workspace, rounds, size))
+                    report(on_result, results[-1])
+        finally:
+            console.quiet = quiet
+    return results
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_baseline(results: list, path: Path):
+    data = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": environment(),
+        "results": {result.key: result.to_json() for result in results},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+def load_baseline(path: Path) -> dict:
+    """``{key: median_ms}`` from a baseline written by :func:`save_baseline`."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        raise BenchError(f"baseline {path} not found") from None
+    except ValueError as e:
+        raise BenchError(f"baseline {path} is not valid JSON: {e}") from None
+    if data.get("version") != BASELINE_VERSION or not isinstance(data.get("results"), dict):
+        raise BenchError(f"baseline {path} was written by an incompatible arckit version")
+    return {key: entry["median_ms"] for key, entry in data["results"].items()}
+
+
+def compare(results: list, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list:
+    """Compare medians with a baseline; statuses are ok, regressed, improved or new."""
+    comparisons = []
+    for result in results:
+        comparison = Comparison(result.key, baseline.get(result.key), result.median)
+        if comparison.baseline_ms is None:
+            comparison.status = "new"
+        else:
+            delta = comparison.current_ms - comparison.baseline_ms
+            if delta > min_delta_ms and comparison.current_ms > comparison.baseline_ms * (1 + threshold):
+                comparison.status = "regressed"
+            elif -delta > min_delta_ms and comparison.current_ms < comparison.baseline_ms * (1 - threshold):
+                comparison.status = "improved"
+        comparisons.append(comparison)
+    return comparisons
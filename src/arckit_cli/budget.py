@@ -0,0 +1,296 @@
+"""Offline input-token estimates and context packing for ArcKit commands.
+
+A command's input is its prompt, the templates the prompt names, and the
+project artifacts it consumes according to the dependency graph. Tokens are
+estimated with a regex pre-tokenizer modelled on BPE tokenizers (words,
+digit groups, punctuation runs and newlines). It is an approximation meant
+for budgeting rather than exact counts, and needs no network access or
+tokenizer download. Counts are cached per file by content hash.
+
+``pack_context`` trims the templates and artifacts to a target budget,
+keeping whole sections and preferring those whose heading or requirement
+IDs match what the caller asked for.
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TOKENIZER_VERSION = 1
+CACHE_FILE = ".arckit/cache/token-counts.json"
+
+PROMPT_LOCATIONS = [
+    ".claude/commands/arckit.{name}.md",
+    ".codex/prompts/arckit.{name}.md",
+    ".gemini/commands/arckit/{name}.toml",
+]
+TEMPLATE_REF_RE = re.compile(r"templates/([\w.-]+-template\.md)")
+
+# Letters, digit groups of up to three, punctuation runs, whitespace runs
+_PIECE_RE = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]+|_+|\s+")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the BPE token count of ``text``.
+
+    Common words are a single token and long words split roughly every six
+    characters; a leading space merges into the following word, as it does in
+    BPE vocabularies, while newlines and other whitespace runs cost one token.
+    Punctuation runs such as ``**`` or ``---`` cost about one token per two
+    characters.
+    """
+    tokens = 0
+    for piece in _PIECE_RE.findall(text):
+        first = piece[0]
+        if first.isalpha():
+            tokens += 1 + (len(piece) - 1) // 6
+        elif first.isdigit():
+            tokens += 1
+        elif first.isspace():
+            if "\n" in piece or len(piece) > 1:
+                tokens += 1
+        else:
+            tokens += (len(piece) + 1) // 2
+    return tokens
+
+
+class TokenCache:
+    """Token counts keyed by content hash, persisted between runs."""
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path) if path else None
+        self.counts = {}
+        self.dirty = False
+        if self.path:
+            try:
+                data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == TOKENIZER_VERSION:
+                self.counts = data.get("counts", {})
+
+    def count(self, text: str) -> int:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        tokens = self.counts.get(digest)
+        if tokens is None:
+            tokens = self.counts[digest] = count_tokens(text)
+            self.dirty = True
+        return tokens
+
+    def save(self):
+        if not (self.path and self.dirty):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": TOKENIZER_VERSION, "counts": self.counts}))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+        self.dirty = False
+
+
+class BudgetError(ValueError):
+    """Raised when a command's inputs cannot be located."""
+
+
+@dataclass
+class InputFile:
+    """One file a command reads."""
+
+    role: str  # "prompt", "template" or "artifact"
+    path: Path
+    label: str
+    text: str
+    tokens: int = 0
+    source: str = ""  # dependency level ("M", "R", "O") for artifacts
+
+    @property
+    def lines(self) -> int:
+        return self.text.count("\n") + (0 if self.text.endswith("\n") or not self.text else 1)
+
+
+@dataclass
+class Estimate:
+    """Input-token estimate for running a command in a project."""
+
+    command: str
+    project: str
+    files: list = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(f.tokens for f in self.files)
+
+    def by_role(self) -> dict:
+        totals = {}
+        for f in self.files:
+            totals[f.role] = totals.get(f.role, 0) + f.tokens
+        return totals
+
+
+def find_prompt(command: str, repo_root: Path = None) -> Path:
+    """Locate the prompt for ``command`` in the workspace or the ArcKit install."""
+    from .paths import resolve_data_root, source_root
+
+    roots = [root for root in (repo_root, resolve_data_root().root, source_root()) if root]
+    for root in roots:
+        for location in PROMPT_LOCATIONS:
+            path = Path(root) / location.format(name=command)
+            if path.is_file():
+                return path
+    raise BudgetError(f"No prompt found for command '{command}'")
+
+
+def _read(path: Path) -> str:
+    return Path(path).read_text(encoding="utf-8", errors="replace")
+
+
+def estimate(command: str, project_dir: Path, repo_root: Path, graph, cache: TokenCache = None) -> Estimate:
+    """Estimate the input tokens of ``command`` run against ``project_dir``."""
+    from .graph import LEVELS, read_project
+    from .template import find_template
+
+    cache = cache or TokenCache()
+    if command not in graph.dependencies:
+        raise BudgetError(f"Unknown command '{command}' (not in the dependency matrix)")
+    project_dir = Path(project_dir)
+    result = Estimate(command=command, project=project_dir.name)
+
+    prompt_path = find_prompt(command, repo_root)
+    prompt = _read(prompt_path)
+    result.files.append(InputFile("prompt", prompt_path, f"arckit.{command}", prompt))
+
+    for name in dict.fromkeys(TEMPLATE_REF_RE.findall(prompt)):
+        path = find_template(name, repo_root)
+        if path:
+            result.files.append(InputFile("template", path, f".arckit/templates/{name}", _read(path)))
+
+    state = read_project(project_dir, repo_root)
+    for producer, level in graph.inputs(command, LEVELS).items():
+        for relative in state.outputs(producer):
+            path = state.absolute(relative)
+            label = relative[1:] if relative.startswith("/") else relative
+            result.files.append(InputFile("artifact", path, label, _read(path), source=level))
+
+    for f in result.files:
+        f.tokens = cache.count(f.text)
+    return result
+
+
+@dataclass
+class Section:
+    """A heading and the text up to the next split point."""
+
+    heading: str
+    level: int
+    text: str
+    tokens: int = 0
+    score: int = 0
+
+
+def split_sections(text: str, max_level: int = 3) -> list:
+    """Split markdown into sections at headings of ``max_level`` or above.
+
+    Text before the first heading is a level-0 section. Headings inside
+    fenced code blocks are ignored.
+    """
+    from .mdcache import parse
+
+    # mdcache sections are contiguous: each heading starts where the one before ends
+    data = text.encode("utf-8")
+    sections = [Section("", 0, "")]
+    start = heading = 0
+    for level, title, _, _, _, _, end, _ in parse(data):
+        if 0 < level <= max_level:
+            sections[-1].text = data[start:heading].decode("utf-8")
+            sections.append(Section(title, level, ""))
+            start = heading
+        heading = end
+    sections[-1].text = data[start:].decode("utf-8")
+    return [s for s in sections if s.text]
+
+
+def _score(section: Section, focus: list, ids: list) -> int:
+    heading = section.heading.lower()
+    score = 0
+    if any(term.lower() in heading for term in focus):
+        score += 100
+    if ids:
+        found = sum(1 for requirement_id in ids if re.search(rf"\b{re.escape(requirement_id)}\b", section.text))
+        score += 50 * found
+    return score
+
+
+@dataclass
+class Pack:
+    """A trimmed context bundle."""
+
+    text: str
+    tokens: int
+    target: int
+    kept: int
+    dropped: int
+
+
+def _marker(section: Section) -> str:
+    heading = f"{'#' * section.level} {section.heading}\n\n" if section.level else ""
+    return f"{heading}_[omitted: ~{section.tokens} tokens]_\n\n"
+
+
+def pack_context(result: Estimate, target: int, focus=(), ids=()) -> Pack:
+    """Build a bundle of the command's templates and artifacts within ``target`` tokens.
+
+    The prompt is counted against the budget but not included. Sections are
+    admitted greedily: document titles and preambles first, then by relevance
+    (matching ``focus`` headings, then requirement ``ids``), with mandatory
+    artifacts and templates ahead of recommended and optional ones, and
+    otherwise in document order. Dropped sections are replaced by a short
+    marker.
+    """
+    focus, ids = list(focus), list(ids)
+    prompt_tokens = sum(f.tokens for f in result.files if f.role == "prompt")
+    remaining = target - prompt_tokens
+
+    documents = [f for f in result.files if f.role != "prompt"]
+    priority = {"M": 0, "": 1, "R": 2, "O": 3}
+    candidates = []
+    split = []
+    for doc_number, f in enumerate(documents):
+        sections = split_sections(f.text)
+        split.append(sections)
+        header = f"\n## File: {f.label}\n\n"
+        remaining -= count_tokens(header)
+        for number, section in enumerate(sections):
+            section.tokens = count_tokens(section.text)
+            section.score = _score(section, focus, ids)
+            if section.level <= 1:
+                # Titles and preambles give the structure; admit them first
+                section.score += 1000
+            # Reserve room for the marker that replaces a dropped section
+            marker = count_tokens(_marker(section))
+            remaining -= marker
+            candidates.append((-section.score, priority.get(f.source, 1), doc_number, number, section, marker))
+
+    kept = set()
+    for _, _, doc_number, number, section, marker in sorted(candidates, key=lambda c: c[:4]):
+        if section.tokens - marker <= remaining:
+            kept.add((doc_number, number))
+            remaining -= section.tokens - marker
+
+    out = [f"# Context bundle: /arckit.{result.command} for {result.project}\n"]
+    dropped = 0
+    for doc_number, (f, sections) in enumerate(zip(documents, split)):
+        out.append(f"\n## File: {f.label}\n\n")
+        for number, section in enumerate(sections):
+            if (doc_number, number) in kept:
+                out.append(section.text)
+            else:
+                dropped += 1
+                out.append(_marker(section))
+    text = "".join(out)
+    return Pack(text=text, tokens=prompt_tokens + count_tokens(text), target=target,
+                kept=len(kept), dropped=dropped)
@@ -0,0 +1,85 @@
+"""Typer application and lazy subcommand registry for the ArcKit CLI."""
+
+import importlib
+import sys
+
+import typer
+from typer.core import TyperGroup
+
+# Subcommand name -> module in ``arckit_cli.commands`` defining a Typer ``app``.
+# Modules are imported only when their command is resolved, so a command never
+# pays for the dependencies of another.
+COMMANDS = {
+    "init": "init",
+    "upgrade": "upgrade",
+    "check": "check",
+    "doctor": "doctor",
+    "build-commands": "build_commands",
+    "projects": "projects",
+    "graph": "graph",
+    "trace": "trace",
+    "budget": "budget",
+    "template": "template",
+    "index": "index",
+    "search": "search",
+    "lint": "lint",
+    "marketplace": "marketplace",
+    "vendors": "vendors",
+    "bench": "bench",
+    "wardley": "wardley",
+    "publish": "publish",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx):
+        names = list(super().list_commands(ctx))
+        return names + [name for name in COMMANDS if name not in names]
+
+    def invoke(self, ctx):
+        # Before the subcommand is resolved, so its import is profiled too
+        if ctx.params.get("profile"):
+            from .profiling import enable
+
+            enable()
+        return super().invoke(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in COMMANDS:
+            from .profiling import span
+
+            with span(f"import commands.{COMMANDS[cmd_name]}", cat="startup"):
+                module = importlib.import_module(f"arckit_cli.commands.{COMMANDS[cmd_name]}")
+            command = typer.main.get_command(module.app)
+            command.name = cmd_name
+            self.commands[cmd_name] = command
+        return command
+
+
+app = typer.Typer(
+    name="arckit",
+    help="Enterprise Architecture Governance & Vendor Procurement Toolkit",
+    add_completion=False,
+    cls=LazyGroup,
+)
+
+
+@app.callback()
+def callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False, "--profile", help="Record timing spans and write a Chrome trace to arckit-trace.json (or set ARCKIT_PROFILE=1)"
+    ),
+):
+    """Show banner when no subcommand is provided."""
+    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
+        from rich.align import Align
+
+        from .ui import console, show_banner
+
+        show_banner()
+        console.print(Align.center("[dim]Run 'arckit --help' for usage information[/dim]"))
+        console.print()
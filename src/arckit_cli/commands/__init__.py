@@ -0,0 +1,6 @@
+"""ArcKit subcommands.
+
+Each module defines a ``typer.Typer`` named ``app`` and is imported only when
+its command is invoked (see ``arckit_cli.cli``). Keep module-level imports
+light; defer heavy dependencies to the code paths that need them.
+"""
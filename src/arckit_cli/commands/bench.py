@@ -0,0 +1,103 @@
+"""``arckit bench`` - time key operations on synthetic workspaces."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+STATUS_STYLES = {"ok": "dim", "new": "cyan", "improved": "green", "regressed": "red"}
+
+
+@app.command()
+def bench(
+    sizes: str = typer.Option("10,100,1000", "--sizes", help="Comma-separated workspace sizes, in projects"),
+    rounds: int = typer.Option(3, "--rounds", "-r", min=1, help="Timed rounds per operation (the median is reported)"),
+    only: list[str] = typer.Option([], "--only", help="Only operations whose name contains this (repeatable)"),
+    baseline: Path = typer.Option(None, "--baseline", help="Compare with a baseline saved by --save"),
+    save: Path = typer.Option(None, "--save", help="Save the results as a baseline file"),
+    threshold: float = typer.Option(25.0, "--threshold", help="Percentage slowdown over the baseline that counts as a regression"),
+    min_delta: float = typer.Option(2.0, "--min-delta", help="Ignore differences smaller than this many milliseconds"),
+    workdir: Path = typer.Option(None, "--workdir", help="Generate workspaces here and keep them (default: a temporary directory)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Benchmark workspace operations on generated 10/100/1000-project workspaces.
+
+    Exits with status 1 when --baseline is given and any operation regressed
+    by more than --threshold percent (and --min-delta milliseconds).
+    """
+    from ..bench import BenchError, compare, environment, load_baseline, run, save_baseline
+
+    try:
+        size_list = [int(size) for size in sizes.split(",") if size.strip()]
+    except ValueError:
+        console.print(f"[red]Error:[/red] --sizes must be comma-separated integers, got '{sizes}'")
+        raise typer.Exit(1)
+    if not size_list or min(size_list) < 1:
+        console.print("[red]Error:[/red] --sizes needs at least one size of 1 or more")
+        raise typer.Exit(1)
+
+    try:
+        reference = load_baseline(baseline) if baseline else None
+    except BenchError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    def on_workspace(workspace):
+        if not json_output:
+            console.print(f"[cyan]Workspace of {workspace.size} projects[/cyan] [dim]({workspace.files:,} files, "
+                          f"{workspace.bytes / 1e6:.1f} MB, generated in {workspace.elapsed:.1f}s)[/dim]")
+
+    def on_result(result):
+        if not json_output:
+            console.print(f"  {result.key:<32} {result.median:>10.2f} ms  "
+                          f"[dim](min {min(result.samples):.2f}, max {max(result.samples):.2f})[/dim]", highlight=False)
+
+    try:
+        results = run(size_list, rounds, only, workdir, on_workspace=on_workspace, on_result=on_result)
+    except BenchError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    comparisons = compare(results, reference, threshold / 100, min_delta) if reference is not None else []
+    regressed = [comparison for comparison in comparisons if comparison.status == "regressed"]
+    if save:
+        save_baseline(results, save)
+
+    if json_output:
+        output = {"environment": environment(), "rounds": rounds, "results": [r.to_json() for r in results]}
+        if reference is not None:
+            output["comparison"] = [comparison.to_json() for comparison in comparisons]
+            output["regressed"] = len(regressed)
+        print(json.dumps(output, indent=2))
+    else:
+        if reference is not None:
+            from rich.table import Table
+
+            table = Table(title=f"Compared with {baseline} (threshold {threshold:g}%, noise floor {min_delta:g} ms)")
+            table.add_column("Operation")
+            table.add_column("Baseline ms", justify="right")
+            table.add_column("Current ms", justify="right")
+            table.add_column("Change", justify="right")
+            table.add_column("Status")
+            for comparison in comparisons:
+                ratio = comparison.ratio
+                style = STATUS_STYLES[comparison.status]
+                table.add_row(
+                    comparison.key,
+                    f"{comparison.baseline_ms:.2f}" if comparison.baseline_ms is not None else "-",
+                    f"{comparison.current_ms:.2f}",
+                    f"{(ratio - 1) * 100:+.0f}%" if ratio is not None else "-",
+                    f"[{style}]{comparison.status}[/{style}]",
+                )
+            console.print()
+            console.print(table)
+        if save:
+            console.print(f"[green]✓[/green] Baseline saved to {save}")
+        if regressed:
+            console.print(f"[red]{len(regressed)} operation(s) regressed[/red]")
+    if regressed:
+        raise typer.Exit(1)
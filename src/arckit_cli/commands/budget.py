@@ -0,0 +1,81 @@
+"""``arckit budget`` - estimate the input tokens of a command, offline."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def budget(
+    command: str = typer.Argument(..., help="ArcKit command (e.g. sobc, requirements, research)"),
+    project: str = typer.Argument(..., help="Project number or name (e.g. 001 or payment)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    pack: bool = typer.Option(False, "--pack", help="Produce a trimmed context bundle within --target tokens"),
+    target: int = typer.Option(24000, "--target", help="Token budget for --pack (prompt included)"),
+    focus: list[str] = typer.Option([], "--section", "-s", help="Heading text to prefer when packing (repeatable)"),
+    ids: list[str] = typer.Option([], "--id", help="Requirement ID to prefer when packing, e.g. FR-3 (repeatable)"),
+    output: Path = typer.Option(None, "--output", "-o", help="Write the --pack bundle to this file"),
+):
+    """Estimate input tokens for a command's prompt, templates and project artifacts."""
+    from ..budget import CACHE_FILE, BudgetError, TokenCache, estimate, pack_context
+    from ..graph import GraphError, find_matrix, load_graph
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root
+
+    command = command.removeprefix("/").removeprefix("arckit.")
+    try:
+        repo_root = find_repo_root()
+        project_dir = find_project_dir(repo_root, project)
+        graph = load_graph(find_matrix(repo_root))
+        cache = TokenCache(repo_root / CACHE_FILE)
+        result = estimate(command, project_dir, repo_root, graph, cache)
+    except (WorkspaceError, GraphError, BudgetError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    cache.save()
+
+    if pack:
+        bundle = pack_context(result, target, focus=focus, ids=ids)
+        summary = (f"Packed ~{bundle.tokens:,} of ~{result.total:,} tokens (target {target:,}): "
+                   f"{bundle.kept} sections kept, {bundle.dropped} omitted")
+        if output:
+            output.write_text(bundle.text)
+            console.print(f"[green]✓[/green] Wrote {output}. {summary}")
+        else:
+            # The bundle goes to stdout; the summary must not end up in it
+            print(bundle.text)
+            typer.echo(summary, err=True)
+        if bundle.tokens > target:
+            raise typer.Exit(2)
+        return
+
+    if json_output:
+        print(json.dumps({
+            "command": result.command,
+            "project": result.project,
+            "total_tokens": result.total,
+            "by_role": result.by_role(),
+            "files": [
+                {"role": f.role, "path": f.label, "lines": f.lines, "tokens": f.tokens, "dependency": f.source or None}
+                for f in result.files
+            ],
+        }, indent=2))
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"/arckit.{result.command} on {result.project}", show_edge=False)
+    table.add_column("Role", style="cyan")
+    table.add_column("File")
+    table.add_column("Lines", justify="right")
+    table.add_column("Tokens", justify="right")
+    for f in result.files:
+        role = f"{f.role} ({f.source})" if f.source else f.role
+        table.add_row(role, f.label, f"{f.lines:,}", f"{f.tokens:,}")
+    console.print(table)
+    console.print(f"\n[bold]Estimated input:[/bold] ~{result.total:,} tokens "
+                  + ", ".join(f"{role} {tokens:,}" for role, tokens in result.by_role().items()))
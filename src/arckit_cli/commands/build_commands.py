@@ -0,0 +1,58 @@
+"""``arckit build-commands`` - generate Gemini and Codex commands from Claude sources."""
+
+from pathlib import Path
+from typing import List
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command("build-commands")
+def build_commands(
+    root: Path = typer.Option(Path("."), "--root", help="Repository root containing .claude/, .gemini/ and .codex/"),
+    source: Path = typer.Option(None, "--source", help="Claude commands directory (default: <root>/.claude/commands)"),
+    target: List[str] = typer.Option(["gemini", "codex"], "--target", "-t", help="Output format(s): gemini, codex"),
+    force: bool = typer.Option(False, "--force", help="Re-render every command, ignoring the build cache"),
+    check: bool = typer.Option(False, "--check", help="Write nothing; exit 1 if any output is out of date"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Parallel conversions (default: CPU count + 4)"),
+):
+    """
+    Compile Claude Code commands into Gemini CLI TOML and Codex CLI prompts.
+
+    Only commands whose source changed since the last build are regenerated.
+
+    Examples:
+        arckit build-commands
+        arckit build-commands --target gemini
+        arckit build-commands --check
+    """
+    from ..compiler import TARGETS, build_commands as compile_commands
+
+    unknown = [t for t in target if t not in TARGETS]
+    if unknown:
+        console.print(f"[red]Error:[/red] Unknown target '{unknown[0]}'. Choose from: {', '.join(TARGETS)}")
+        raise typer.Exit(1)
+
+    source_dir = source or root / ".claude" / "commands"
+    if not source_dir.is_dir():
+        console.print(f"[red]Error:[/red] Claude commands not found at {source_dir}")
+        raise typer.Exit(1)
+
+    report = compile_commands(root, source_dir, targets=target, force=force, dry_run=check, jobs=jobs)
+
+    for key in report.built:
+        console.print(f"[yellow]{'✗ out of date' if check else '✓ built'}[/yellow] {key}")
+    for output in report.removed:
+        console.print(f"[yellow]{'✗ stale' if check else '✓ removed'}[/yellow] {output}")
+    for key, error in report.errors.items():
+        console.print(f"[red]✗[/red] {error}")
+
+    console.print(
+        f"\n{len(report.built)} {'out of date' if check else 'built'}, "
+        f"{len(report.unchanged)} unchanged, {len(report.removed)} removed, {len(report.errors)} failed"
+    )
+    if report.errors or (check and (report.built or report.removed)):
+        raise typer.Exit(1)
@@ -0,0 +1,29 @@
+"""``arckit check`` - verify that the tools ArcKit relies on are installed."""
+
+import typer
+
+from ..tools import check_tool
+from ..ui import console, show_banner
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def check():
+    """Check that all required tools are installed."""
+    show_banner()
+    console.print("[bold]Checking for installed tools...[/bold]\n")
+
+    tools = {
+        "git": "Version control",
+        "claude": "Claude Code",
+        "code": "Visual Studio Code",
+    }
+
+    for tool, description in tools.items():
+        if check_tool(tool):
+            console.print(f"[green]✓[/green] {description} ({tool})")
+        else:
+            console.print(f"[red]✗[/red] {description} ({tool}) - not found")
+
+    console.print("\n[bold green]ArcKit CLI is ready to use![/bold green]")
@@ -0,0 +1,63 @@
+"""``arckit doctor`` - diagnose how ArcKit is installed."""
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def doctor(
+    paths: bool = typer.Option(False, "--paths", help="Report how the bundled data directory was resolved"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore the cached data path and probe again"),
+    http_cache: bool = typer.Option(False, "--http-cache", help="Report HTTP cache size, hit rate and latency"),
+    clear_http_cache: bool = typer.Option(False, "--clear-http-cache", help="Empty the HTTP cache and its counters"),
+):
+    """Diagnose the ArcKit installation."""
+    if not (paths or http_cache or clear_http_cache):
+        console.print("Nothing to check. Use [cyan]--paths[/cyan] to report data path resolution "
+                      "or [cyan]--http-cache[/cyan] for HTTP cache statistics.")
+        raise typer.Exit(0)
+    if http_cache or clear_http_cache:
+        _report_http_cache(clear_http_cache)
+    if not paths:
+        return
+
+    from ..paths import resolve_data_root
+
+    resolution = resolve_data_root(use_cache=not no_cache)
+
+    console.print(f"[bold]Data root:[/bold] {resolution.root}")
+    console.print(f"[bold]Resolved by:[/bold] {resolution.probe} in {resolution.elapsed * 1000:.2f} ms\n")
+
+    console.print("[bold]Probes tried:[/bold]")
+    for probe, root, outcome in resolution.attempts:
+        marker = "[green]✓[/green]" if outcome == "found" else "[red]✗[/red]" if outcome.startswith("error") else "[dim]-[/dim]"
+        console.print(f"  {marker} {probe:<14} {root if root else ''} [dim]{outcome}[/dim]")
+
+    console.print("\n[bold]Data paths:[/bold]")
+    for name, path in resolution.paths.items():
+        marker = "[green]✓[/green]" if path.exists() else "[yellow]![/yellow]"
+        console.print(f"  {marker} {name}: {path}")
+
+
+def _report_http_cache(clear: bool):
+    from ..httpcache import HttpCache
+
+    cache = HttpCache()
+    try:
+        if clear:
+            cache.clear()
+            console.print(f"[green]✓[/green] Cleared HTTP cache in {cache.root}\n")
+        stats = cache.stats()
+    finally:
+        cache.close()
+
+    console.print(f"[bold]HTTP cache:[/bold] {stats['path']}")
+    console.print(f"  {stats['entries']:,} entries, {stats['bytes'] / 1048576:.1f} of "
+                  f"{stats['max_bytes'] / 1048576:.0f} MB")
+    console.print(f"  {stats['requests']:,} requests: {stats['hits']:,} fresh hits, "
+                  f"{stats['revalidated']:,} revalidated, {stats['misses']:,} fetched, "
+                  f"{stats['stale']:,} served stale, {stats['errors']:,} failed")
+    console.print(f"  hit rate {stats['hit_rate']:.0%}, mean latency {stats['mean_latency_ms']:.1f} ms\n")
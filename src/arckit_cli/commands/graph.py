@@ -0,0 +1,168 @@
+"""``arckit graph`` - query the command dependency graph against projects."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+MATRIX_OPTION = typer.Option(None, "--matrix", help="Dependency matrix to use (default: DEPENDENCY-MATRIX.md)")
+OPTIONAL_OPTION = typer.Option(False, "--include-optional", help="Also follow optional (O) dependencies")
+JSON_OPTION = typer.Option(False, "--json", help="Output in JSON format")
+
+
+@app.callback()
+def graph():
+    """Query the command dependency graph (DEPENDENCY-MATRIX.md)."""
+
+
+def _load(matrix: Path):
+    from ..graph import GraphError, find_matrix, load_graph
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        repo_root = find_repo_root()
+    except WorkspaceError:
+        repo_root = None
+    try:
+        return repo_root, load_graph(matrix or find_matrix(repo_root))
+    except (GraphError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _project_root(repo_root: Path) -> Path:
+    if repo_root is None:
+        console.print("[red]Error:[/red] Not in an ArcKit project (no .arckit directory found)")
+        raise typer.Exit(1)
+    return repo_root
+
+
+def _project(repo_root: Path, prefix: str) -> Path:
+    from ..workspace import WorkspaceError, find_project_dir
+
+    try:
+        return find_project_dir(_project_root(repo_root), prefix)
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _levels(include_optional: bool):
+    from ..graph import DEFAULT_LEVELS, LEVELS
+
+    return LEVELS if include_optional else DEFAULT_LEVELS
+
+
+@app.command()
+def ready(
+    project: str = typer.Argument(..., help="Project number or name (e.g. 001 or payment)"),
+    show_all: bool = typer.Option(False, "--all", help="Also list blocked commands and their missing inputs"),
+    json_output: bool = JSON_OPTION,
+    matrix: Path = MATRIX_OPTION,
+):
+    """List the commands whose mandatory inputs exist in a project."""
+    from ..graph import read_project, ready as evaluate
+
+    repo_root, dependency_graph = _load(matrix)
+    project_dir = _project(repo_root, project)
+    result = evaluate(dependency_graph, read_project(project_dir, repo_root))
+
+    if json_output:
+        print(json.dumps({
+            "project": project_dir.name,
+            "ready": result.ready,
+            "produced": result.produced,
+            "blocked": result.blocked,
+        }, indent=2))
+        return
+
+    console.print(f"[bold]{project_dir.name}[/bold] - commands with all mandatory inputs:")
+    for command in result.ready:
+        if command in result.produced:
+            console.print(f"  [green]✓[/green] {command} [dim](already produced)[/dim]")
+        else:
+            console.print(f"  [cyan]○[/cyan] {command}")
+    if show_all and result.blocked:
+        console.print("\n[bold]Blocked:[/bold]")
+        for command, missing in result.blocked.items():
+            console.print(f"  [red]✗[/red] {command} [dim](needs {', '.join(missing)})[/dim]")
+
+
+@app.command()
+def stale(
+    project: str = typer.Argument(None, help="Project number or name (default: every project)"),
+    use_hash: bool = typer.Option(False, "--hash", help="Compare content hashes instead of modification times"),
+    include_optional: bool = OPTIONAL_OPTION,
+    json_output: bool = JSON_OPTION,
+    matrix: Path = MATRIX_OPTION,
+):
+    """List artifacts older than their upstream inputs."""
+    from ..graph import HashStamps, read_project, stale as evaluate
+    from ..workspace import list_project_dirs
+
+    repo_root, dependency_graph = _load(matrix)
+    project_dirs = [_project(repo_root, project)] if project else list_project_dirs(_project_root(repo_root))
+    stamps = HashStamps(repo_root) if use_hash else None
+    levels = _levels(include_optional)
+
+    report = {}
+    for project_dir in project_dirs:
+        state = read_project(project_dir, repo_root)
+        artifacts = evaluate(dependency_graph, state, levels=levels, stamps=stamps)
+        if artifacts:
+            report[project_dir.name] = artifacts
+    if stamps:
+        stamps.save()
+
+    if json_output:
+        print(json.dumps({
+            name: [
+                {"command": a.command, "outputs": a.outputs, "changed_inputs": a.changed_inputs}
+                for a in artifacts
+            ]
+            for name, artifacts in report.items()
+        }, indent=2))
+        return
+
+    if not report:
+        console.print("[green]✓[/green] No stale artifacts")
+        return
+    for name, artifacts in report.items():
+        console.print(f"[bold]{name}[/bold]")
+        for artifact in artifacts:
+            console.print(
+                f"  [yellow]![/yellow] {artifact.command} [dim]({', '.join(artifact.outputs)})[/dim]"
+                f" <- {', '.join(artifact.changed_inputs)}"
+            )
+
+
+@app.command()
+def order(
+    project: str = typer.Option(None, "--project", "-p", help="Only schedule commands not yet produced in this project"),
+    include_optional: bool = OPTIONAL_OPTION,
+    json_output: bool = JSON_OPTION,
+    matrix: Path = MATRIX_OPTION,
+):
+    """Print a topological schedule; commands on the same step can run in parallel."""
+    from ..graph import GraphError, OUTPUTS, read_project, schedule
+
+    repo_root, dependency_graph = _load(matrix)
+    done = ()
+    if project:
+        state = read_project(_project(repo_root, project), repo_root)
+        done = {node for node in OUTPUTS if state.outputs(node)}
+    try:
+        steps = schedule(dependency_graph, levels=_levels(include_optional), done=done)
+    except GraphError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps(steps, indent=2))
+        return
+    for number, step in enumerate(steps, start=1):
+        console.print(f"[cyan]{number:>2}.[/cyan] {', '.join(step)}")
@@ -0,0 +1,74 @@
+"""``arckit index`` - maintain the workspace index in ``.arckit/index.sqlite``."""
+
+import json
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+
+def _describe(stats) -> str:
+    return (f"{stats.projects} projects, {stats.documents} files "
+            f"(+{len(stats.added)} ~{len(stats.changed)} -{len(stats.removed)}) "
+            f"in {stats.elapsed * 1000:.1f} ms")
+
+
+@app.command()
+def index(
+    watch: bool = typer.Option(False, "--watch", help="Keep running and update the index as files change"),
+    interval: float = typer.Option(2.0, "--interval", help="Seconds between checks with --watch"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Drop and re-read every file"),
+    project: str = typer.Option(None, "--project", "-p", help="With --json, only list this project's files"),
+    json_output: bool = typer.Option(False, "--json", help="Print the indexed projects and documents as JSON"),
+):
+    """Update the workspace index of projects, artifacts, document IDs and hashes."""
+    import sqlite3
+    import time
+
+    from ..index import connect, documents, find_project, refresh
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        repo_root = find_repo_root()
+        conn = connect(repo_root)
+        stats = refresh(conn, repo_root, rebuild=rebuild)
+    except (WorkspaceError, sqlite3.Error, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        name = None
+        if project:
+            path = find_project(conn, project)
+            if path is None:
+                console.print(f"[red]Error:[/red] No project found matching: {project}")
+                raise typer.Exit(1)
+            name = path.name
+        projects = [dict(row) for row in conn.execute("SELECT * FROM projects ORDER BY name")]
+        print(json.dumps({
+            "repository_root": str(repo_root),
+            "projects": [p for p in projects if name is None or p["name"] == name],
+            "documents": documents(conn, name),
+        }, indent=2))
+        return
+
+    console.print(f"[green]✓[/green] Indexed {_describe(stats)}")
+    if not watch:
+        return
+
+    console.print(f"[cyan]Watching {repo_root / 'projects'} every {interval:g}s (Ctrl+C to stop)[/cyan]")
+    try:
+        while True:
+            time.sleep(interval)
+            stats = refresh(conn, repo_root)
+            if stats.modified:
+                console.print(f"[dim]{time.strftime('%H:%M:%S')}[/dim] {_describe(stats)}")
+                for label, paths in (("+", stats.added), ("~", stats.changed), ("-", stats.removed)):
+                    for path in paths:
+                        console.print(f"  {label} {path}", highlight=False)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching[/dim]")
+    finally:
+        conn.close()
@@ -0,0 +1,227 @@
+"""``arckit init`` - scaffold a new ArcKit project."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from ..config import AGENT_CONFIG
+from ..git import init_git_repo, is_git_repo
+from ..installer import MANIFEST_FILE, build_manifest, format_rate, install, write_manifest
+from ..scaffold import asset_groups, project_directories, project_readme, write_codex_environment
+from ..paths import get_data_paths
+from ..tools import check_tool
+from ..ui import console, show_banner
+
+app = typer.Typer(add_completion=False)
+
+
+def create_project_structure(project_path: Path, ai_assistant: str):
+    """Create the basic ArcKit project structure."""
+
+    console.print("[cyan]Creating project structure...[/cyan]")
+
+    for directory in project_directories(ai_assistant):
+        (project_path / directory).mkdir(parents=True, exist_ok=True)
+
+    console.print("[green]✓[/green] Project structure created")
+
+    return project_path
+
+
+def init_batch(manifest_path: Path, default_ai: str, jobs: int, summary_file: Path):
+    """Create all projects in a manifest concurrently and report a JSON summary."""
+    import json
+
+    from ..batch import ManifestError, load_project_specs, provision_projects
+
+    if default_ai and default_ai not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{default_ai}'")
+        raise typer.Exit(1)
+
+    try:
+        specs = load_project_specs(manifest_path, default_ai)
+    except (OSError, ManifestError) as e:
+        console.print(f"[red]Error:[/red] Cannot read manifest {manifest_path}: {e}")
+        raise typer.Exit(1)
+
+    err_console = Console(stderr=True)
+    err_console.print(f"[cyan]Provisioning {len(specs)} projects from[/cyan] {manifest_path}")
+
+    def report(summary):
+        if summary["status"] == "ok":
+            err_console.print(f"[green]✓[/green] {summary['name']} ({summary['timings']['total']:.2f}s)")
+        else:
+            err_console.print(f"[red]✗[/red] {summary['name']}: {summary['error']}")
+
+    summaries = provision_projects(specs, get_data_paths(), jobs=jobs, on_result=report)
+    failed = sum(1 for summary in summaries if summary["status"] != "ok")
+
+    output = json.dumps({"projects": summaries, "failed": failed}, indent=2)
+    if summary_file:
+        summary_file.write_text(output + "\n")
+        err_console.print(f"[dim]Summary written to {summary_file}[/dim]")
+    else:
+        print(output)
+
+    err_console.print(f"[bold]{len(summaries) - failed} created, {failed} failed[/bold]")
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def init(
+    project_name: str = typer.Argument(None, help="Name for your new project directory (optional, use '.' for current directory)"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, codex"),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    here: bool = typer.Option(False, "--here", help="Initialize project in the current directory"),
+    from_manifest: Path = typer.Option(None, "--from", help="Create every project listed in a YAML or CSV manifest"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Worker processes for --from (default: CPU count)"),
+    summary_file: Path = typer.Option(None, "--summary", help="Write the --from JSON summary to this file instead of stdout"),
+):
+    """
+    Initialize a new ArcKit project for enterprise architecture governance.
+
+    This command will:
+    1. Create project directory structure
+    2. Copy templates for architecture principles, requirements, SOW, etc.
+    3. Set up AI assistant commands
+    4. Initialize git repository (optional)
+
+    Examples:
+        arckit init my-architecture-project
+        arckit init my-project --ai claude
+        arckit init . --ai gemini
+        arckit init --here --ai claude
+        arckit init --from portfolio.yaml --ai claude --jobs 8
+    """
+
+    if from_manifest:
+        if project_name or here:
+            console.print("[red]Error:[/red] Cannot combine --from with a project name or --here")
+            raise typer.Exit(1)
+        init_batch(from_manifest, ai_assistant, jobs, summary_file)
+        return
+
+    show_banner()
+
+    if project_name == ".":
+        here = True
+        project_name = None
+
+    if here and project_name:
+        console.print("[red]Error:[/red] Cannot specify both project name and --here flag")
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print("[red]Error:[/red] Must specify either a project name or use '.' / --here flag")
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+    else:
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            console.print(f"[red]Error:[/red] Directory '{project_name}' already exists")
+            raise typer.Exit(1)
+
+    console.print(f"[cyan]Initializing ArcKit project:[/cyan] {project_name}")
+    console.print(f"[cyan]Location:[/cyan] {project_path}")
+
+    # Check git
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
+
+    # Select AI assistant
+    if not ai_assistant:
+        console.print("\n[cyan]Select your AI assistant:[/cyan]")
+        console.print("1. claude (Claude Code)")
+        console.print("2. gemini (Gemini CLI)")
+        console.print("3. codex (OpenAI Codex CLI)")
+
+        choice = typer.prompt("Enter choice", default="1")
+        ai_map = {"1": "claude", "2": "gemini", "3": "codex"}
+        ai_assistant = ai_map.get(choice, "claude")
+
+    if ai_assistant not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'")
+        console.print(f"Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {AGENT_CONFIG[ai_assistant]['name']}")
+
+    # Create project structure
+    create_project_structure(project_path, ai_assistant)
+
+    # Copy templates from installed package or source
+    console.print("[cyan]Setting up templates...[/cyan]")
+
+    data_paths = get_data_paths()
+    templates_src = data_paths["templates"]
+    scripts_src = data_paths["scripts"]
+
+    console.print(f"[dim]Debug: Resolved data paths:[/dim]")
+    console.print(f"[dim]  templates: {templates_src}[/dim]")
+    console.print(f"[dim]  scripts: {scripts_src}[/dim]")
+
+    groups = asset_groups(data_paths, ai_assistant)
+    for description, src, _, _ in groups:
+        if src.exists():
+            console.print(f"[dim]Copying {description} from: {src}[/dim]")
+        else:
+            console.print(f"[yellow]Warning: {description.capitalize()} not found at {src}[/yellow]")
+
+    manifest = build_manifest((src, pattern, prefix) for _, src, pattern, prefix in groups)
+    report = install(manifest, project_path)
+    write_manifest(manifest, project_path / MANIFEST_FILE)
+
+    for description, _, _, prefix in groups:
+        count = sum(1 for entry in manifest if entry.path.startswith(prefix + "/"))
+        if count:
+            console.print(f"[green]✓[/green] Installed {count} {description}")
+
+    console.print(f"[dim]Copied {format_rate(report)}; {report.files_skipped} already up to date[/dim]")
+    console.print("[green]✓[/green] Templates configured")
+
+    # Create README
+    (project_path / "README.md").write_text(project_readme(project_name, ai_assistant))
+    console.print("[green]✓[/green] README created")
+
+    # Initialize git if requested
+    if should_init_git and not is_git_repo(project_path):
+        init_git_repo(project_path, fresh=not here)
+
+    # Create .envrc for Codex projects
+    if ai_assistant == "codex":
+        console.print("[cyan]Setting up Codex environment...[/cyan]")
+
+        write_codex_environment(project_path)
+
+        console.print("[green]✓[/green] Codex environment configured (.envrc created)")
+
+    # Success message
+    console.print("\n[bold green]✓ ArcKit project initialized successfully![/bold green]\n")
+
+    next_steps = [
+        f"1. Navigate to project: [cyan]cd {project_name if not here else '.'}[/cyan]",
+    ]
+
+    # Add Codex-specific setup steps
+    if ai_assistant == "codex":
+        next_steps.append("2. Set up CODEX_HOME environment variable:")
+        next_steps.append("   [cyan]RECOMMENDED[/cyan]: Install direnv and run [cyan]direnv allow[/cyan]")
+        next_steps.append("   Alternative: Run [cyan]export CODEX_HOME=\"$PWD/.codex\"[/cyan]")
+        next_steps.append(f"3. Start Codex: [cyan]{ai_assistant}[/cyan]")
+        next_steps.append("4. Establish architecture principles: [cyan]/arckit.principles[/cyan]")
+        next_steps.append("5. Create your first project: [cyan]/arckit.requirements[/cyan]")
+    else:
+        next_steps.append(f"2. Start your AI assistant: [cyan]{ai_assistant}[/cyan]")
+        next_steps.append("3. Establish architecture principles: [cyan]/arckit.principles[/cyan]")
+        next_steps.append("4. Create your first project: [cyan]/arckit.requirements[/cyan]")
+
+    console.print(Panel("\n".join(next_steps), title="Next Steps", border_style="cyan"))
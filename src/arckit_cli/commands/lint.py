@@ -0,0 +1,93 @@
+"""``arckit lint`` - deterministic governance checks across project artifacts."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+LEVEL_STYLES = {"error": "red", "warning": "yellow", "note": "cyan"}
+
+
+@app.command()
+def lint(
+    projects: list[str] = typer.Argument(None, help="Project numbers or names (default: every project)"),
+    rules: list[str] = typer.Option([], "--rule", "-r", help="Only run this rule, by id or name (repeatable)"),
+    disabled: list[str] = typer.Option([], "--disable", help="Skip this rule, by id or name (repeatable)"),
+    output_format: str = typer.Option("text", "--format", "-f", help="Output format: text, json or sarif"),
+    output: Path = typer.Option(None, "--output", "-o", help="Write the findings to this file"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Worker processes (default: CPU count)"),
+    list_rules: bool = typer.Option(False, "--list-rules", help="List the available rules and exit"),
+):
+    """Check artifacts for missing sections, placeholders, bad and duplicate IDs.
+
+    Exits with status 1 when any error-level finding is reported.
+    """
+    from ..lint import RULES, lint_projects, select_rules, to_json, to_sarif, to_text
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root, list_project_dirs
+
+    if output_format not in ("text", "json", "sarif"):
+        console.print(f"[red]Error:[/red] Unknown format '{output_format}' (use text, json or sarif)")
+        raise typer.Exit(1)
+    try:
+        rule_ids = select_rules(rules, disabled)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if list_rules:
+        for rule_id in sorted(RULES):
+            rule = RULES[rule_id]
+            style = LEVEL_STYLES[rule.level]
+            console.print(f"[bold]{rule.id}[/bold] {rule.name} [{style}]{rule.level}[/{style}]"
+                          f"\n       [dim]{rule.description}[/dim]")
+        return
+
+    try:
+        repo_root = find_repo_root()
+        project_dirs = ([find_project_dir(repo_root, project) for project in projects]
+                        if projects else list_project_dirs(repo_root))
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if not project_dirs:
+        console.print("[yellow]No projects to lint[/yellow]")
+        return
+
+    report = lint_projects(project_dirs, repo_root, rule_ids, jobs=jobs)
+    counts = report.counts()
+
+    if output_format == "text" and not output:
+        current = None
+        for finding in report.findings:
+            if finding.path != current:
+                current = finding.path
+                console.print(f"\n[bold]{finding.path}[/bold]", highlight=False)
+            style = LEVEL_STYLES[finding.level]
+            console.print(f"  {finding.line:>5}  [{style}]{finding.level:<7}[/{style}] "
+                          f"[dim]{finding.rule}[/dim]  {finding.message}", highlight=False)
+    else:
+        if output_format == "sarif":
+            from ..paths import _package_version
+
+            text = json.dumps(to_sarif(report, _package_version()), indent=2) + "\n"
+        elif output_format == "json":
+            text = json.dumps(to_json(report), indent=2) + "\n"
+        else:
+            text = to_text(report)
+        if output:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(text, encoding="utf-8")
+        else:
+            print(text, end="")
+
+    if output or output_format == "text":
+        where = f" → {output}" if output else ""
+        console.print(f"\n{len(report.projects)} projects, {report.files} files: "
+                      f"[red]{counts['error']} errors[/red], [yellow]{counts['warning']} warnings[/yellow] "
+                      f"in {report.elapsed * 1000:.0f} ms{where}", highlight=False)
+    if counts["error"]:
+        raise typer.Exit(1)
@@ -0,0 +1,110 @@
+"""``arckit marketplace`` - offline Digital Marketplace catalogue."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+STORE_OPTION = typer.Option(None, "--store", help="Catalogue store directory (default: user cache, or $ARCKIT_MARKETPLACE_DIR)")
+
+
+@app.callback()
+def marketplace():
+    """Keep a local copy of G-Cloud/DOS catalogues and search it offline."""
+
+
+@app.command()
+def sync(
+    urls: list[str] = typer.Argument(None, help="Catalogue export URLs to add (CSV, JSON or JSON lines, optionally gzipped)"),
+    framework: str = typer.Option(None, "--framework", help="Framework name for services whose export does not say, e.g. G-Cloud 14"),
+    force: bool = typer.Option(False, "--force", help="Download and reload even if unchanged"),
+    store: Path = STORE_OPTION,
+):
+    """Download new or changed catalogue exports; every known source is revalidated."""
+    from ..marketplace import MarketplaceError, store_dir
+    from ..marketplace import sync as sync_catalogues
+
+    def report(result):
+        if result.error:
+            console.print(f"  [red]✗[/red] {result.url} [dim]{result.error}[/dim]", highlight=False)
+        elif result.status == "not-modified":
+            console.print(f"  [dim]=[/dim] {result.url} [dim]not modified ({result.services:,} services)[/dim]",
+                          highlight=False)
+        else:
+            console.print(f"  [green]✓[/green] {result.url} [dim]{result.status}, {result.bytes_received:,} bytes, "
+                          f"{result.services:,} services in {result.elapsed:.1f}s[/dim]", highlight=False)
+
+    try:
+        results = sync_catalogues(urls or (), store, framework=framework, force=force, on_result=report)
+    except (MarketplaceError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    failed = sum(1 for result in results if result.error)
+    console.print(f"[green]✓[/green] Catalogue in {store_dir(store)}: {len(results) - failed} sources up to date"
+                  + (f", [red]{failed} failed[/red] (run again to resume)" if failed else ""))
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(None, help='Words, "phrases", prefix* or AND/OR/NOT'),
+    lot: str = typer.Option(None, "--lot", "-l", help="Only this lot, e.g. 'Cloud hosting'"),
+    capabilities: list[str] = typer.Option([], "--capability", "-c", help="Require this capability or feature (repeatable)"),
+    framework: str = typer.Option(None, "--framework", help="Only this framework, e.g. 'G-Cloud 14'"),
+    max_price: float = typer.Option(None, "--max-price", help="Starting price at most this"),
+    min_price: float = typer.Option(None, "--min-price", help="Price range reaching at least this"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum number of results"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    store: Path = STORE_OPTION,
+):
+    """Search the local catalogue by text, lot, capability and price."""
+    import sqlite3
+    import time
+
+    from rich.markup import escape
+
+    from ..marketplace import MarketplaceError
+    from ..marketplace import search as search_catalogue
+
+    start = time.perf_counter()
+    try:
+        services = search_catalogue(store, query, lot=lot, capabilities=capabilities, framework=framework,
+                                    max_price=max_price, min_price=min_price, limit=limit)
+    except MarketplaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except sqlite3.OperationalError as e:
+        console.print(f"[red]Error:[/red] Invalid search query: {e}")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - start
+
+    if json_output:
+        print(json.dumps({"query": query, "results": [s.to_json() for s in services],
+                          "elapsed_ms": round(elapsed * 1000, 1)}, indent=2))
+        return
+    if not services:
+        console.print("[yellow]No matching services[/yellow]")
+        return
+    for service in services:
+        if service.price_min is None:
+            price = "price on request"
+        else:
+            price = f"£{service.price_min:,.2f}"
+            if service.price_max and service.price_max != service.price_min:
+                price += f" to £{service.price_max:,.2f}"
+            if service.price_unit:
+                price += f" per {service.price_unit}"
+        console.print(f"[bold cyan]{escape(service.name or service.id)}[/bold cyan] "
+                      f"[dim]({escape(service.supplier or 'unknown supplier')})[/dim]")
+        console.print(f"  {escape(' · '.join(p for p in (service.framework, service.lot) if p))}"
+                      f"{' · ' if service.framework or service.lot else ''}{escape(price)}")
+        if service.snippet:
+            console.print(f"  [dim]{escape(service.snippet)}[/dim]")
+        if service.url:
+            console.print(f"  {escape(service.url)}", highlight=False)
+    console.print(f"\n[dim]{len(services)} services in {elapsed * 1000:.1f} ms[/dim]")
@@ -0,0 +1,327 @@
+"""``arckit projects`` - inspect the projects in an ArcKit repository."""
+
+import json
+import sys
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+# The [LEVEL] prefixes common.sh writes to stderr
+LOG_STYLES = {"INFO": "blue", "SUCCESS": "green", "WARNING": "yellow", "ERROR": "red"}
+
+
+def log(level: str, message: str):
+    from rich.markup import escape
+
+    from ..ui import err_console
+
+    err_console.print(f"[{LOG_STYLES[level]}]\\[{level}][/{LOG_STYLES[level]}] {escape(message)}", highlight=False, soft_wrap=True)
+
+
+def _repo_root(root: Path = None) -> Path:
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        return Path(root).resolve() if root else find_repo_root()
+    except WorkspaceError as e:
+        log("ERROR", str(e))
+        raise typer.Exit(1)
+
+
+@app.callback()
+def projects():
+    """Inspect the projects in this ArcKit repository."""
+
+
+@app.command("list")
+def list_command(
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed artifact status"),
+    root: Path = typer.Option(None, "--root", help="Repository root (default: nearest directory containing .arckit)"),
+    no_index: bool = typer.Option(False, "--no-index", help="Rescan every project instead of using the project index"),
+):
+    """List all projects with their artifact status, like list-projects.sh."""
+    from ..workspace import (
+        ARTIFACTS,
+        WorkspaceError,
+        find_repo_root,
+        get_projects_dir,
+        list_projects,
+        status_emoji,
+    )
+
+    try:
+        repo_root = Path(root).resolve() if root else find_repo_root()
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    projects_dir = get_projects_dir(repo_root)
+
+    statuses = list_projects(repo_root, use_index=not no_index) if projects_dir.is_dir() else []
+
+    if json_output:
+        if not statuses:
+            print(json.dumps({"projects": []}))
+            return
+        print(json.dumps({
+            "repository_root": str(repo_root),
+            "projects_dir": str(projects_dir),
+            "project_count": len(statuses),
+            "projects": [status.to_json() for status in statuses],
+        }, indent=2, ensure_ascii=False))
+        return
+
+    if not projects_dir.is_dir():
+        console.print("[yellow]No projects directory found[/yellow]\n")
+        console.print("Run: /arckit.init to initialize an ArcKit repository")
+        return
+    if not statuses:
+        console.print("No projects found\n")
+        console.print("Run: /arckit.create to create a new project")
+        return
+
+    out = [
+        "ArcKit Projects",
+        "===============",
+        "",
+        f"Repository: {repo_root}",
+        f"Projects found: {len(statuses)}",
+        "",
+    ]
+    for status in statuses:
+        percentage = status.completion_percentage
+        out.append(f"{status_emoji(percentage)} [{status.number}] {status.name} ({percentage}% complete)")
+        if verbose:
+            out.append(f"    Path: {status.path}")
+            out.append("    Artifacts:")
+            for key, _, label in ARTIFACTS:
+                if key == "vendors":
+                    present = status.vendor_count > 0
+                    label = f"{label} ({status.vendor_count})" if present else label
+                else:
+                    present = status.artifacts[key]
+                out.append(f"      {'✓' if present else '✗'} {label}")
+            out.append("")
+    out += [
+        "",
+        "Legend:",
+        "  ✅ Complete (100%)",
+        "  🟢 Mostly complete (75-99%)",
+        "  🟡 In progress (50-74%)",
+        "  🟠 Started (25-49%)",
+        "  🔴 Not started (0-24%)",
+    ]
+    # Plain print: project names are not Rich markup
+    print("\n".join(out))
+
+
+@app.command("create")
+def create_command(
+    name: str = typer.Option(None, "--name", help="Name of the project (prompted for if omitted)"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON for AI agent consumption"),
+    force: bool = typer.Option(False, "--force", help="Skip the architecture principles check (not recommended)"),
+    root: Path = typer.Option(None, "--root", help="Repository root (default: nearest directory containing .arckit)"),
+):
+    """Create the next numbered project, like create-project.sh."""
+    from ..workspace import create_project, create_project_json, has_principles
+
+    repo_root = _repo_root(root)
+    if not force:
+        if not has_principles(repo_root):
+            for line in ("Prerequisites not met: architecture-principles.md not found",
+                         "Before creating a project, you must define architecture principles", "",
+                         "Run: /arckit.principles", "", "Or use --force to skip this check (not recommended)"):
+                log("ERROR", line)
+            raise typer.Exit(1)
+        log("SUCCESS", "Prerequisites check passed")
+
+    if not name:
+        if json_output:
+            log("ERROR", "Project name is required in JSON mode")
+            print('{"error": "Project name is required", "success": false}')
+            raise typer.Exit(1)
+        log("INFO", "Interactive mode: Creating a new ArcKit project")
+        print()
+        name = typer.prompt("Enter project name", default="", show_default=False)
+        if not name:
+            log("ERROR", "Project name cannot be empty")
+            raise typer.Exit(1)
+
+    from ..registry import RegistryError
+
+    try:
+        project = create_project(repo_root, name)
+    except (RegistryError, OSError) as e:
+        log("ERROR", str(e))
+        raise typer.Exit(1)
+    log("INFO", f"Project number: {project.number}")
+    log("INFO", f"Creating project: {project.path.name}")
+    log("SUCCESS", f"Created project directory: {project.path}")
+    log("SUCCESS", "Project created successfully")
+
+    if json_output:
+        print(create_project_json(project))
+        return
+    log("INFO", f"Project directory: {project.path}")
+    print()
+    log("INFO", "Next steps:")
+    for number, step in enumerate(project.next_steps, start=1):
+        log("INFO", f"  {number}. {step}")
+
+
+@app.command("check")
+def check_command(
+    project: str = typer.Option(None, "--project", help="Project number or name prefix"),
+    required: list[str] = typer.Option([], "--require-file", help="Require this file to exist (repeatable)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    paths_only: bool = typer.Option(False, "--paths-only", help="Only output path variables (no validation)"),
+    list_all: bool = typer.Option(False, "--list-projects", help="List all available projects"),
+    root: Path = typer.Option(None, "--root", help="Repository root (default: nearest directory containing .arckit)"),
+):
+    """Report workspace paths and a project's artifacts, like check-prerequisites.sh.
+
+    Exits with status 1 when the project or a required file is missing.
+    """
+    from ..workspace import (
+        WorkspaceError,
+        available_docs,
+        find_project_dir,
+        list_project_dirs,
+        prerequisites_json,
+        project_number,
+        workspace_paths,
+    )
+
+    repo_root = _repo_root(root)
+    paths = workspace_paths(repo_root)
+
+    def print_project_list():
+        project_dirs = list_project_dirs(repo_root)
+        if not project_dirs:
+            print("No projects found")
+            return
+        print("Available projects:")
+        for project_dir in project_dirs:
+            print(f"  - {project_dir.name}")
+
+    if list_all:
+        print_project_list()
+        return
+
+    if paths_only:
+        lines = [f"{key}: {value}" for key, value in paths.items()]
+        if project:
+            try:
+                project_dir = find_project_dir(repo_root, project)
+                lines += [f"PROJECT_DIR: {project_dir}", f"PROJECT_NUMBER: {project_number(project_dir.name)}"]
+            except WorkspaceError:
+                pass
+        print("\n".join(lines))
+        return
+
+    project_dir = None
+    if project:
+        try:
+            project_dir = find_project_dir(repo_root, project)
+        except WorkspaceError as e:
+            log("ERROR", str(e))
+            raise typer.Exit(1)
+    docs = available_docs(project_dir) if project_dir else []
+
+    missing = [name for name in required if not ((project_dir or repo_root) / name).is_file()]
+    if not json_output:
+        for name in missing:
+            log("ERROR", f"Required file not found: {name}")
+
+    if json_output:
+        print(prerequisites_json(repo_root, project_dir, docs))
+    else:
+        out = ["ArcKit Environment:", "===================", "", "Repository:"]
+        out += [f"  {key}: {value}" for key, value in paths.items()]
+        out.append("")
+        if project_dir:
+            out += ["Project:", f"  PROJECT_DIR: {project_dir}",
+                    f"  PROJECT_NUMBER: {project_number(project_dir.name)}", "", "Available Artifacts:"]
+            out += [f"  ✓ {doc}" for doc in docs] or ["  (no artifacts found)"]
+            print("\n".join(out))
+        else:
+            out += ["Project: (not specified)", "", "Use --project <prefix> to specify a project"]
+            print("\n".join(out))
+            print_project_list()
+    sys.stdout.flush()
+    if missing:
+        raise typer.Exit(1)
+
+
+@app.command("document-id")
+def document_id_command(
+    project: str = typer.Argument(..., help="Project number, e.g. 001 or 42"),
+    doc_type: str = typer.Argument(..., help="Document type code, e.g. REQ, HLD, ATRS"),
+    version: str = typer.Argument("1.0", help="Document version (the initial one with --register)"),
+    register: bool = typer.Option(False, "--register", help="Record the document in the registry; prints its current ID if already there"),
+    bump: bool = typer.Option(False, "--bump", help="Move a registered document to its next minor version"),
+    major: bool = typer.Option(False, "--major", help="With --bump, move to the next major version"),
+    root: Path = typer.Option(None, "--root", help="Repository root (default: nearest directory containing .arckit)"),
+):
+    """Print a document ID such as ARC-001-REQ-v1.0, like generate-document-id.sh.
+
+    With --register or --bump the ID is allocated through the registry in
+    .arckit/registry, so concurrent callers always see distinct versions.
+    """
+    from ..registry import Registry, RegistryError
+    from ..workspace import WorkspaceError, document_id
+
+    try:
+        if bump:
+            print(Registry(_repo_root(root)).bump_version(project, doc_type, major=major))
+        elif register:
+            print(Registry(_repo_root(root)).register_document(project, doc_type, version))
+        else:
+            print(document_id(project, doc_type, version))
+    except (WorkspaceError, RegistryError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(1)
+
+
+@app.command("registry")
+def registry_command(
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    rebuild: bool = typer.Option(False, "--rebuild", help="Regenerate the registry state from its journal"),
+    history: int = typer.Option(0, "--log", help="Show the last N journal entries"),
+    root: Path = typer.Option(None, "--root", help="Repository root (default: nearest directory containing .arckit)"),
+):
+    """Show the project number and document ID registry."""
+    from collections import deque
+
+    from ..registry import Registry, RegistryError
+
+    registry = Registry(_repo_root(root))
+    try:
+        status = registry.rebuild() if rebuild else registry.status()
+        entries = list(deque(registry.entries(), maxlen=history)) if history > 0 else []
+    except (RegistryError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if json_output:
+        print(json.dumps({**status, "log": entries} if history > 0 else status, indent=2))
+        return
+    if rebuild:
+        console.print("[green]✓[/green] Registry rebuilt from its journal")
+    if not status["initialised"]:
+        console.print(f"[dim]No registry yet; the first allocation will start at {status['next_project']}[/dim]")
+        return
+    console.print(f"[bold]Registry:[/bold] {status['path']}")
+    console.print(f"  Last project:  {status['last_project']} (next {status['next_project']})")
+    console.print(f"  Documents:     {status['documents']}")
+    console.print(f"  Journal:       {status['entries']} entries, {status['log_bytes']:,} bytes")
+    if status["pending_bytes"]:
+        console.print(f"  [yellow]{status['pending_bytes']} journal bytes not yet applied "
+                      "(replayed on the next allocation)[/yellow]")
+    for entry in entries:
+        detail = entry.get("number") or f"ARC-{entry.get('project')}-{entry.get('type')}-v{entry.get('version')}"
+        console.print(f"  [dim]{entry['seq']:>6}  {entry['at']}  pid {entry['pid']:<7}[/dim] {entry['op']:<8} {detail}")
@@ -0,0 +1,71 @@
+"""``arckit publish`` - assemble project artifacts into a board pack in final/."""
+
+import json
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+FORMAT_CHOICES = {"all": ("html", "md"), "html": ("html",), "md": ("md",)}
+
+
+@app.command()
+def publish(
+    projects: list[str] = typer.Argument(None, help="Project numbers or names (default: every project)"),
+    output_format: str = typer.Option("all", "--format", "-f", help="Pack format: html, md or all"),
+    force: bool = typer.Option(False, "--force", help="Re-render every section and rewrite the packs"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Worker processes (default: CPU count)"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Publish each project's documents, in dependency order, as final/board-pack.html and .md.
+
+    Only sections whose source files changed are re-rendered; projects with
+    no changes are left untouched. Exits with status 1 if any project fails.
+    """
+    from ..publish import BUNDLE_FILES, PublishError, publish_projects
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root, list_project_dirs
+
+    if output_format not in FORMAT_CHOICES:
+        console.print(f"[red]Error:[/red] Unknown format '{output_format}' (use html, md or all)")
+        raise typer.Exit(1)
+    try:
+        repo_root = find_repo_root()
+        project_dirs = ([find_project_dir(repo_root, project) for project in projects]
+                        if projects else list_project_dirs(repo_root))
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if not project_dirs:
+        console.print("[yellow]No projects to publish[/yellow]")
+        return
+
+    try:
+        results = publish_projects(project_dirs, repo_root, FORMAT_CHOICES[output_format], force, jobs)
+    except PublishError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    failed = [result for result in results if result.error]
+
+    if json_output:
+        print(json.dumps({"projects": [result.to_json() for result in results], "failed": len(failed)}, indent=2))
+    else:
+        for result in results:
+            if result.error:
+                console.print(f"[red]✗[/red] {result.project}: {result.error}", highlight=False)
+                continue
+            where = ", ".join(result.written) if result.written else "up to date"
+            mark = "[green]✓[/green]" if result.written else "[dim]=[/dim]"
+            console.print(f"{mark} {result.project} [dim]{result.sections} sections ({result.rebuilt} rendered, "
+                          f"{result.reused} cached), {result.requirements} requirements, "
+                          f"{result.elapsed * 1000:.0f} ms[/dim] → {where}", highlight=False)
+        if len(results) > 1:
+            written = sum(1 for result in results if result.written)
+            console.print(f"\n{len(results)} projects: {written} published, "
+                          f"{len(results) - written - len(failed)} up to date, [red]{len(failed)} failed[/red]",
+                          highlight=False)
+        elif results[0].written and "html" in FORMAT_CHOICES[output_format]:
+            console.print(f"[dim]Open {results[0].project}/{BUNDLE_FILES['html']} in a browser[/dim]", highlight=False)
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,85 @@
+"""``arckit search`` - full-text search over every project's artifacts."""
+
+import json
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(None, help='Words, "phrases", prefix*, heading:word, AND/OR/NOT'),
+    project: str = typer.Option(None, "--project", "-p", help="Only this project (number or name)"),
+    artifact: str = typer.Option(None, "--type", "-t", help="Only this artifact type, e.g. hld-review or requirements"),
+    requirement: str = typer.Option(None, "--requirement", "-r", help="Only sections mentioning this requirement ID"),
+    document: str = typer.Option(None, "--document", "-d", help="Only this document ID (version optional)"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum number of results"),
+    no_refresh: bool = typer.Option(False, "--no-refresh", help="Query the index as it is, without checking for changed files"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Search headings and text of all project documents, ranked with snippets."""
+    import sqlite3
+    import time
+
+    from rich.markup import escape
+
+    if not (query or project or artifact or requirement or document):
+        console.print("[red]Error:[/red] Give a search query or at least one filter")
+        raise typer.Exit(1)
+
+    from ..index import MATCH_END, MATCH_START, connect, find_project, refresh
+    from ..index import search as search_index
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        repo_root = find_repo_root()
+        conn = connect(repo_root)
+        if not no_refresh:
+            refresh(conn, repo_root)
+    except (WorkspaceError, sqlite3.Error, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    name = None
+    if project:
+        path = find_project(conn, project)
+        if path is None:
+            console.print(f"[red]Error:[/red] No project found matching: {project}")
+            raise typer.Exit(1)
+        name = path.name
+
+    start = time.perf_counter()
+    try:
+        hits = search_index(conn, query, project=name, artifact=artifact, requirement=requirement,
+                            document=document, limit=limit)
+    except sqlite3.OperationalError as e:
+        console.print(f"[red]Error:[/red] Invalid search query: {e}")
+        raise typer.Exit(1)
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - start
+
+    if json_output:
+        print(json.dumps({
+            "query": query,
+            "results": [hit.to_json() for hit in hits],
+            "elapsed_ms": round(elapsed * 1000, 1),
+        }, indent=2))
+        return
+
+    if not hits:
+        console.print(f"[yellow]No matches for[/yellow] {escape(query or 'these filters')}")
+        return
+    for hit in hits:
+        label = " · ".join(part for part in (hit.document_id, hit.artifact) if part)
+        console.print(f"[bold cyan]{escape(hit.path)}:{hit.line}[/bold cyan]"
+                      + (f" [dim]{escape(label)}[/dim]" if label else ""))
+        if hit.heading:
+            console.print(f"  [bold]{escape(hit.heading)}[/bold]")
+        snippet = escape(" ".join(hit.snippet.split()))
+        if snippet:
+            console.print("  " + snippet.replace(MATCH_START, "[yellow]").replace(MATCH_END, "[/yellow]"))
+    console.print(f"\n[dim]{len(hits)} results in {elapsed * 1000:.1f} ms[/dim]")
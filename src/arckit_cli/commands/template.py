@@ -0,0 +1,182 @@
+"""``arckit template`` - inspect templates and generate documents in chunks."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+DEPTH_OPTION = typer.Option(1, "--depth", "-d", help="Chunk at sections of this depth (1 = top-level sections)")
+
+
+@app.callback()
+def template():
+    """Split templates into sections and merge separately generated sections."""
+
+
+def _load(name: str):
+    from ..template import TemplateError, load_template
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        repo_root = find_repo_root()
+    except WorkspaceError:
+        repo_root = None
+    try:
+        return repo_root, load_template(name, repo_root)
+    except (TemplateError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _project(repo_root: Path, project: str) -> Path:
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root
+
+    try:
+        return find_project_dir(repo_root or find_repo_root(), project)
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _end(section) -> int:
+    # The title section spans the whole document; report only its preamble
+    return section.body_end if section.id == "0" else section.end
+
+
+@app.command()
+def sections(
+    name: str = typer.Argument(..., help="Template name, e.g. sobc or requirements-template.md"),
+    depth: int = DEPTH_OPTION,
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """List a template's heading tree and the chunks it splits into at --depth."""
+    from ..budget import count_tokens
+    from ..template import chunks
+
+    _, parsed = _load(name)
+    plan = chunks(parsed, depth)
+    chunk_ids = {chunk.id for chunk in plan}
+
+    if json_output:
+        print(json.dumps({
+            "template": parsed.name,
+            "depth": depth,
+            "sections": [
+                {"id": s.id, "title": s.title, "level": s.level, "start_line": s.start + 1, "end_line": _end(s),
+                 "tokens": count_tokens(parsed.text(s.start, _end(s)))}
+                for s in parsed.sections() if s.title
+            ],
+            "chunks": [
+                {"id": c.id, "title": c.title, "file": c.file_name, "start_line": c.start + 1, "end_line": c.end,
+                 "tokens": count_tokens(parsed.text(c.start, c.end))}
+                for c in plan
+            ],
+        }, indent=2))
+        return
+
+    console.print(f"[bold]{parsed.name}[/bold] ({len(parsed.lines)} lines, {len(plan)} chunks at depth {depth})\n")
+    for section in parsed.sections():
+        if not section.title or section.depth > depth + 1:
+            continue
+        marker = "[cyan]■[/cyan]" if section.id in chunk_ids else " "
+        indent = "  " * max(section.depth - 1, 0)
+        tokens = count_tokens(parsed.text(section.start, _end(section)))
+        console.print(f"{marker} {indent}[bold]{section.id:<6}[/bold] {section.title} "
+                      f"[dim](lines {section.start + 1}-{_end(section)}, ~{tokens:,} tokens)[/dim]", highlight=False)
+    console.print("\n[dim]■ = chunk boundary; render a chunk with 'arckit template render NAME --section ID'[/dim]")
+
+
+@app.command()
+def render(
+    name: str = typer.Argument(..., help="Template name, e.g. sobc or requirements-template.md"),
+    section_keys: list[str] = typer.Option([], "--section", "-s", help="Section id, slug or title (repeatable)"),
+    project: str = typer.Option(None, "--project", "-p", help="Fill [PROJECT_ID]/[PROJECT_NAME] from this project"),
+    values: list[str] = typer.Option([], "--set", help="Fill another placeholder: KEY=VALUE (repeatable)"),
+    depth: int = DEPTH_OPTION,
+    output: Path = typer.Option(None, "--output", "-o", help="Write to this file instead of stdout"),
+):
+    """Print the template text of whole sections, or of the whole template."""
+    from ..template import TemplateError, chunks, fill_placeholders, sections_dir
+    from ..workspace import project_number
+
+    repo_root, parsed = _load(name)
+    placeholders = {}
+    project_dir = None
+    if project:
+        project_dir = _project(repo_root, project)
+        placeholders["PROJECT_ID"] = project_number(project_dir.name)
+        placeholders["PROJECT_NAME"] = project_dir.name[len(placeholders["PROJECT_ID"]) + 1:] or project_dir.name
+    for value in values:
+        key, sep, text = value.partition("=")
+        if not sep:
+            console.print(f"[red]Error:[/red] --set expects KEY=VALUE, got '{value}'")
+            raise typer.Exit(1)
+        placeholders[key.strip().strip("[]")] = text
+
+    plan = {chunk.id: chunk for chunk in chunks(parsed, depth)}
+    pieces = []
+    files = []
+    try:
+        for key in section_keys:
+            section = parsed.find(key)
+            # A chunk boundary renders the chunk, so the output matches what merge expects
+            chunk = plan.get(section.id)
+            if chunk:
+                pieces.append(parsed.text(chunk.start, chunk.end))
+                files.append(chunk.file_name)
+            else:
+                pieces.append(parsed.section_text(section))
+    except TemplateError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    text = fill_placeholders("".join(pieces) if section_keys else "".join(parsed.lines), placeholders)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text)
+        console.print(f"[green]✓[/green] Wrote {output}")
+    else:
+        print(text, end="")
+    if project_dir and files:
+        target = sections_dir(project_dir, parsed)
+        typer.echo("Save generated content as: " + ", ".join(str(target / f) for f in files), err=True)
+
+
+@app.command()
+def merge(
+    name: str = typer.Argument(..., help="Template name, e.g. sobc or requirements-template.md"),
+    project: str = typer.Option(..., "--project", "-p", help="Project number or name"),
+    depth: int = DEPTH_OPTION,
+    sections_from: Path = typer.Option(None, "--from", help="Directory of generated chunks (default: PROJECT/.sections/DOC)"),
+    output: Path = typer.Option(None, "--output", "-o", help="Destination (default: PROJECT/<doc>.md)"),
+    clean: bool = typer.Option(False, "--clean", help="Remove the chunk files after a successful merge"),
+):
+    """Stitch separately generated section files into the final document atomically."""
+    import shutil
+
+    from ..template import TemplateError, artifact_name, merge_chunks, sections_dir
+
+    repo_root, parsed = _load(name)
+    project_dir = _project(repo_root, project)
+    chunk_dir = sections_from or sections_dir(project_dir, parsed)
+    destination = output or project_dir / artifact_name(parsed)
+
+    try:
+        result = merge_chunks(parsed, chunk_dir, destination, depth)
+    except (TemplateError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    for warning in result.warnings:
+        console.print(f"[yellow]![/yellow] {warning}")
+    console.print(f"[green]✓[/green] Merged {result.chunks} sections into {result.path} ({result.bytes_written:,} bytes)")
+    if clean:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        try:
+            chunk_dir.parent.rmdir()
+        except OSError:
+            pass
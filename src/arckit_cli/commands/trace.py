@@ -0,0 +1,52 @@
+"""``arckit trace`` - build a requirements traceability matrix without an LLM."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+FORMATS = ("markdown", "json")
+
+
+@app.command()
+def trace(
+    project: str = typer.Argument(..., help="Project number or name (e.g. 001 or payment)"),
+    output_format: str = typer.Option("markdown", "--format", "-f", help="Output format: markdown or json"),
+    output: Path = typer.Option(None, "--output", "-o", help="Write to this file instead of stdout"),
+    gaps_only: bool = typer.Option(False, "--gaps-only", help="Only report coverage gaps and orphan references"),
+):
+    """Trace requirement IDs (BR-, FR-, NFR-, INT-) across a project's documents."""
+    from ..mdcache import MdCache
+    from ..trace import build_index, render_markdown, to_json
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root
+
+    if output_format not in FORMATS:
+        console.print(f"[red]Error:[/red] Invalid format '{output_format}'. Choose from: {', '.join(FORMATS)}")
+        raise typer.Exit(1)
+    try:
+        repo_root = find_repo_root()
+        project_dir = find_project_dir(repo_root, project)
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    index = build_index(project_dir, MdCache.for_repo(repo_root))
+    if output_format == "json":
+        data = to_json(index)
+        if gaps_only:
+            data["requirements"] = [r for r in data["requirements"] if r["status"] != "covered"]
+        text = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    else:
+        text = render_markdown(index, gaps_only=gaps_only)
+
+    if output:
+        output.write_text(text)
+        summary = index.summary()
+        console.print(f"[green]✓[/green] Wrote {output} ({summary['requirements']} requirements, "
+                      f"{summary['coverage_percentage']}% covered, {summary['gap']} gaps)")
+    else:
+        print(text, end="" if text.endswith("\n") else "\n")
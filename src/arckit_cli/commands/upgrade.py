@@ -0,0 +1,73 @@
+"""``arckit upgrade`` - bring installed templates, scripts and commands up to date."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+ACTION_STYLES = {"add": "green", "update": "cyan", "remove": "red", "conflict": "yellow", "keep": "dim"}
+
+
+@app.command()
+def upgrade(
+    paths: list[Path] = typer.Argument(None, help="ArcKit project directories (default: current directory)"),
+    dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Report the change set without writing anything"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant the projects use (default: detect per project)"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Projects upgraded concurrently"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Update installed assets to this release without overwriting local edits.
+
+    Uses the install manifest written by ``arckit init`` as the common base:
+    files changed upstream but untouched locally are updated, locally edited
+    files are kept and the new version is written beside them as
+    ``<file>.arckit-new``.
+    """
+    import time
+
+    from ..config import AGENT_CONFIG
+    from ..paths import get_data_paths
+    from ..upgrade import CONFLICT_SUFFIX, upgrade_projects
+
+    if ai_assistant and ai_assistant not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'")
+        raise typer.Exit(1)
+    paths = paths or [Path.cwd()]
+
+    def report(result):
+        if json_output:
+            return
+        if result.error:
+            console.print(f"[red]✗[/red] {result.path}: {result.error}", highlight=False)
+            return
+        counts = result.counts()
+        summary = ", ".join(f"{counts[action]} {action}" for action in counts if counts[action]) or "up to date"
+        note = "" if result.has_manifest else " [yellow](no install manifest; edited files treated as conflicts)[/yellow]"
+        console.print(f"[green]✓[/green] {result.path} [dim]({result.ai})[/dim]: {summary}{note}", highlight=False)
+        if dry_run or len(paths) == 1:
+            for change in result.changes:
+                style = ACTION_STYLES[change.action]
+                suffix = f" [dim](new version in *{CONFLICT_SUFFIX})[/dim]" if change.action == "conflict" else ""
+                console.print(f"    [{style}]{change.action:<8}[/{style}] {change.path}{suffix}", highlight=False)
+
+    start = time.perf_counter()
+    reports = upgrade_projects(paths, get_data_paths(), ai=ai_assistant, dry_run=dry_run, jobs=jobs, on_result=report)
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for result in reports if result.error)
+
+    if json_output:
+        print(json.dumps({"dry_run": dry_run, "projects": [r.to_json() for r in reports], "failed": failed,
+                          "elapsed_ms": round(elapsed * 1000, 1)}, indent=2))
+    else:
+        changed = sum(1 for result in reports if result.changes)
+        conflicts = sum(result.counts()["conflict"] for result in reports)
+        console.print(f"\n{len(reports)} projects, {changed} {'to change' if dry_run else 'changed'}"
+                      + (f", [yellow]{conflicts} conflicts[/yellow] to review" if conflicts else "")
+                      + (f", [red]{failed} failed[/red]" if failed else "")
+                      + f" in {elapsed * 1000:.0f} ms", highlight=False)
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,134 @@
+"""``arckit vendors`` - ingest vendor proposals and score criterion coverage."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console, err_console
+
+app = typer.Typer(add_completion=False)
+
+JOBS_OPTION = typer.Option(None, "--jobs", "-j", help="Worker processes for extraction (default: CPU count)")
+
+
+@app.callback()
+def vendors():
+    """Build vendor proposal corpora and a deterministic coverage matrix."""
+
+
+def _project(project: str):
+    from ..workspace import WorkspaceError, find_project_dir, find_repo_root
+
+    try:
+        repo_root = find_repo_root()
+        return repo_root, find_project_dir(repo_root, project)
+    except WorkspaceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _ingest(repo_root: Path, project_dir: Path, jobs: int, rebuild: bool = False):
+    from ..vendors import ingest
+
+    try:
+        corpora, stats = ingest(project_dir, repo_root, jobs=jobs, rebuild=rebuild)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if not corpora:
+        console.print(f"[red]Error:[/red] No vendor directories in {project_dir / 'vendors'}")
+        raise typer.Exit(1)
+    for path, reason in stats.skipped:
+        err_console.print(f"[yellow]![/yellow] Skipped {path}: {reason}", highlight=False)
+    return corpora, stats
+
+
+@app.command()
+def ingest(
+    project: str = typer.Argument(..., help="Project number or name"),
+    jobs: int = JOBS_OPTION,
+    rebuild: bool = typer.Option(False, "--rebuild", help="Ignore the cache and extract every file again"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Extract every vendor's proposal files into a cached per-vendor corpus."""
+    from ..vendors import CACHE_DIR
+
+    repo_root, project_dir = _project(project)
+    corpora, stats = _ingest(repo_root, project_dir, jobs, rebuild)
+
+    if json_output:
+        print(json.dumps({
+            "project": project_dir.name,
+            "cache": f"{CACHE_DIR}/{project_dir.name}",
+            "vendors": [
+                {"name": name, "files": len(corpus.files), "bytes": corpus.bytes,
+                 "sections": sum(1 for _ in corpus.sections()), "requirement_ids": len(corpus.ids)}
+                for name, corpus in sorted(corpora.items())
+            ],
+            "files": stats.files,
+            "extracted": stats.extracted,
+            "bytes_read": stats.bytes_read,
+            "skipped": [{"path": path, "reason": reason} for path, reason in stats.skipped],
+            "elapsed_ms": round(stats.elapsed * 1000, 1),
+        }, indent=2))
+        return
+
+    for name, corpus in sorted(corpora.items()):
+        if corpus.files:
+            console.print(f"  [bold]{name}[/bold]: {len(corpus.files)} files, {corpus.bytes:,} bytes, "
+                          f"{len(corpus.ids)} requirement IDs cited", highlight=False)
+        else:
+            console.print(f"  [yellow]![/yellow] [bold]{name}[/bold]: no proposal files (.md or .txt)",
+                          highlight=False)
+    console.print(f"[green]✓[/green] {stats.vendors} vendors, {stats.files} files "
+                  f"({stats.extracted} extracted, {stats.bytes_read:,} bytes read"
+                  + (f", [yellow]{len(stats.skipped)} skipped[/yellow]" if stats.skipped else "")
+                  + f") in {stats.elapsed * 1000:.0f} ms")
+
+
+@app.command()
+def score(
+    project: str = typer.Argument(..., help="Project number or name"),
+    output_format: str = typer.Option("markdown", "--format", "-f", help="Output format: markdown or json"),
+    output: Path = typer.Option(None, "--output", "-o", help="Write to this file instead of stdout"),
+    criteria_file: Path = typer.Option(None, "--criteria", help="Evaluation criteria markdown (default: project's, else the template)"),
+    jobs: int = JOBS_OPTION,
+):
+    """Score keyword and requirement-ID coverage of each criterion per vendor."""
+    from ..mdcache import MdCache
+    from ..trace import build_index
+    from ..vendors import VendorError, load_criteria, parse_criteria, render_markdown, to_json
+    from ..vendors import score as score_matrix
+
+    if output_format not in ("markdown", "json"):
+        console.print(f"[red]Error:[/red] Unknown format '{output_format}' (use markdown or json)")
+        raise typer.Exit(1)
+
+    repo_root, project_dir = _project(project)
+    try:
+        if criteria_file:
+            criteria, source = parse_criteria(criteria_file.read_text(encoding="utf-8")), criteria_file
+            if not criteria:
+                raise VendorError(f"no evaluation subcriteria found in {criteria_file}")
+        else:
+            criteria, source = load_criteria(project_dir, repo_root)
+    except (VendorError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    corpora, _ = _ingest(repo_root, project_dir, jobs)
+    requirements = build_index(project_dir, MdCache.for_repo(repo_root)).requirements
+    matrix = score_matrix(project_dir, corpora, criteria, requirements)
+    try:
+        matrix.criteria_source = str(Path(source).relative_to(repo_root))
+    except ValueError:
+        matrix.criteria_source = str(source)
+
+    text = json.dumps(to_json(matrix), indent=2) + "\n" if output_format == "json" else render_markdown(matrix)
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text, encoding="utf-8")
+        console.print(f"[green]✓[/green] Wrote {output} ({len(matrix.ambiguous())} ambiguous cells to review)")
+    else:
+        print(text, end="")
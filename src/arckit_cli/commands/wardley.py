@@ -0,0 +1,211 @@
+"""``arckit wardley`` - check, render and compare Wardley maps."""
+
+import json
+from pathlib import Path
+
+import typer
+
+from ..ui import console
+
+app = typer.Typer(add_completion=False)
+
+LEVEL_STYLES = {"error": "red", "warning": "yellow", "note": "cyan"}
+
+
+@app.callback()
+def wardley():
+    """Check, render and compare the Wardley maps in project wardley-maps/ folders."""
+
+
+def _display(path: Path) -> str:
+    try:
+        return str(Path(path).resolve().relative_to(Path.cwd()))
+    except ValueError:
+        return str(path)
+
+
+def _load_maps(paths: list) -> list:
+    """Maps from the given files/directories, or from every project's wardley-maps/."""
+    from ..wardley import WardleyError, find_map_files, load, workspace_map_files
+    from ..workspace import WorkspaceError, find_repo_root
+
+    try:
+        files = find_map_files(paths) if paths else workspace_map_files(find_repo_root())
+        return [wmap for path in files for wmap in load(path)]
+    except (WardleyError, WorkspaceError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def check(
+    paths: list[Path] = typer.Argument(None, help="Map files or directories (default: every project's wardley-maps/)"),
+    strict: bool = typer.Option(False, "--strict", help="Treat warnings as errors"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Validate maps: syntax, coordinates, undefined components, cycles, orphans.
+
+    Exits with status 1 when any error is reported (or any warning, with --strict).
+    """
+    from rich.markup import escape
+
+    from ..wardley import check as check_map
+
+    maps = _load_maps(paths)
+    results = [(wmap, check_map(wmap)) for wmap in maps]
+    counts = {"error": 0, "warning": 0}
+    for _, problems in results:
+        for problem in problems:
+            counts[problem.level] += 1
+
+    if json_output:
+        print(json.dumps({
+            "maps": [{"path": _display(wmap.path), "block": wmap.block, "title": wmap.title,
+                      "components": len(wmap.components), "links": len(wmap.links),
+                      "problems": [problem.to_json() for problem in problems]}
+                     for wmap, problems in results],
+            "summary": {"maps": len(maps), "errors": counts["error"], "warnings": counts["warning"]},
+        }, indent=2))
+    else:
+        if not maps:
+            console.print("[yellow]No Wardley maps found[/yellow]")
+            return
+        for wmap, problems in results:
+            name = _display(wmap.path) + (f" (map {wmap.block})" if wmap.block > 1 else "")
+            if not problems:
+                console.print(f"[green]✓[/green] {name} [dim]{escape(wmap.title)}[/dim]", highlight=False)
+                continue
+            console.print(f"\n[bold]{name}[/bold] [dim]{escape(wmap.title)}[/dim]", highlight=False)
+            for problem in problems:
+                style = LEVEL_STYLES[problem.level]
+                console.print(f"  {problem.line:>5}  [{style}]{problem.level:<7}[/{style}] "
+                              f"[dim]{problem.code}[/dim]  {escape(problem.message)}", highlight=False)
+        console.print(f"\n{len(maps)} maps: [red]{counts['error']} errors[/red], "
+                      f"[yellow]{counts['warning']} warnings[/yellow]", highlight=False)
+    if counts["error"] or (strict and counts["warning"]):
+        raise typer.Exit(1)
+
+
+@app.command()
+def render(
+    paths: list[Path] = typer.Argument(None, help="Map files or directories (default: every project's wardley-maps/)"),
+    output: Path = typer.Option(None, "--output", "-o", help="Write the SVGs to this directory (default: beside each map)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Render every map, ignoring .arckit/cache/wardley"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Render maps to SVG, reusing cached renders of unchanged maps.
+
+    A markdown file holding several maps gets one <name>-N.svg per map.
+    """
+    from rich.markup import escape
+
+    from ..wardley import RenderCache, output_path, write_if_changed
+    from ..workspace import WorkspaceError, find_repo_root
+
+    maps = _load_maps(paths)
+    try:
+        cache = RenderCache() if no_cache else RenderCache.for_repo(find_repo_root())
+    except WorkspaceError:
+        cache = RenderCache()
+
+    counts = {}
+    for wmap in maps:
+        counts[wmap.path] = counts.get(wmap.path, 0) + 1
+    written = []
+    for wmap in maps:
+        target = output_path(wmap, counts[wmap.path], output)
+        try:
+            changed = write_if_changed(target, cache.render(wmap))
+        except OSError as e:
+            console.print(f"[red]Error:[/red] cannot write {target}: {e}")
+            raise typer.Exit(1)
+        written.append({"map": _display(wmap.path), "block": wmap.block, "svg": _display(target),
+                        "changed": changed})
+        if not json_output:
+            mark = "[green]✓[/green]" if changed else "[dim]=[/dim]"
+            console.print(f"{mark} {_display(target)} [dim]{escape(wmap.title)}[/dim]", highlight=False)
+
+    if json_output:
+        print(json.dumps({"rendered": written, "cache": cache.stats}, indent=2))
+    elif maps:
+        console.print(f"\n{len(maps)} maps: {sum(item['changed'] for item in written)} written, "
+                      f"{cache.stats['hits']} from cache", highlight=False)
+    else:
+        console.print("[yellow]No Wardley maps found[/yellow]")
+
+
+@app.command()
+def diff(
+    old: Path = typer.Argument(..., help="The earlier map file (or the only file, with --rev)"),
+    new: Path = typer.Argument(None, help="The later map file"),
+    rev: str = typer.Option(None, "--rev", help="Compare OLD as of this git revision with its working copy"),
+    block: int = typer.Option(None, "--map", min=1, help="Only compare the Nth map in each file"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+):
+    """Compare two versions of a map: components added, removed, renamed and moved.
+
+    Moves report the evolution stage before and after, so
+    "Product -> Commodity" shows which components the map now treats as
+    commodities. Maps are paired by position within each file.
+    """
+    from ..git import GitError, run_git
+    from ..wardley import WardleyError, diff as diff_maps, extract, load, parse
+
+    if (new is None) == (rev is None):
+        console.print("[red]Error:[/red] Give two map files, or one file and --rev")
+        raise typer.Exit(1)
+    try:
+        if rev is not None:
+            text = run_git(old.resolve().parent, "show", f"{rev}:./{old.name}")
+            label = Path(f"{old}@{rev}")
+            before = ([parse(text, label)] if old.suffix.lower() != ".md" else
+                      [parse(body, label, n, first) for n, (first, body) in enumerate(extract(text), start=1)])
+            after = load(old)
+        else:
+            before, after = load(old), load(new)
+    except (GitError, WardleyError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if block is not None:
+        before, after = before[block - 1:block], after[block - 1:block]
+    if not before or not after:
+        console.print("[red]Error:[/red] No Wardley map to compare" + (f" (map {block})" if block else ""))
+        raise typer.Exit(1)
+
+    diffs = [diff_maps(a, b) for a, b in zip(before, after)]
+    if json_output:
+        print(json.dumps({"diffs": [d.to_json() for d in diffs],
+                          "unpaired": abs(len(before) - len(after))}, indent=2))
+        return
+
+    for result in diffs:
+        console.print(f"[bold]{result.old.label}[/bold] → [bold]{result.new.label}[/bold]", highlight=False)
+        if not result.changed:
+            console.print("  [dim]no changes[/dim]")
+            continue
+        if result.old.title != result.new.title:
+            console.print(f"  [cyan]~ title[/cyan]    {result.old.title} → {result.new.title}", highlight=False)
+        for component in result.added:
+            console.print(f"  [green]+ added[/green]    {component.name} [{component.visibility:g}, "
+                          f"{component.maturity:g}] [dim]{result.new.stage(component.maturity)}[/dim]", highlight=False)
+        for component in result.removed:
+            console.print(f"  [red]- removed[/red]  {component.name}", highlight=False)
+        for before_component, after_component in result.renamed:
+            console.print(f"  [cyan]~ renamed[/cyan]  {before_component.name} → {after_component.name}", highlight=False)
+        for before_component, after_component in result.moved:
+            old_stage = result.old.stage(before_component.maturity)
+            new_stage = result.new.stage(after_component.maturity)
+            stage = f"  [yellow]{old_stage} → {new_stage}[/yellow]" if old_stage != new_stage else ""
+            console.print(f"  [cyan]~ moved[/cyan]    {after_component.name} [{before_component.visibility:g}, "
+                          f"{before_component.maturity:g}] → [{after_component.visibility:g}, "
+                          f"{after_component.maturity:g}]{stage}", highlight=False)
+        for source, target in result.links_added:
+            console.print(f"  [green]+ link[/green]     {source} -> {target}", highlight=False)
+        for source, target in result.links_removed:
+            console.print(f"  [red]- link[/red]     {source} -> {target}", highlight=False)
+        for name, was, now in result.evolves:
+            was_text = f"{was:g}" if was is not None else "none"
+            now_text = f"{now:g}" if now is not None else "none"
+            console.print(f"  [cyan]~ evolve[/cyan]   {name} {was_text} → {now_text}", highlight=False)
+    if len(before) != len(after):
+        console.print(f"[yellow]{abs(len(before) - len(after))} map(s) have no counterpart to compare[/yellow]")
@@ -0,0 +1,253 @@
+"""Compile Claude Code slash commands into Gemini CLI and Codex CLI formats.
+
+Each ``.claude/commands/arckit.<name>.md`` source is parsed once and emitted
+to every target:
+
+- Gemini: ``.gemini/commands/arckit/<name>.toml`` (``$ARGUMENTS`` becomes
+  ``{{args}}``)
+- Codex: ``.codex/prompts/arckit.<name>.md`` (frontmatter and prompt as-is)
+
+A content-hash cache records the source and output hashes of every build, so
+only commands whose source (or generated output) changed are rebuilt. Every
+Gemini output is parsed back with ``tomllib`` and compared with the values it
+was generated from before it is written.
+"""
+
+import hashlib
+import json
+import os
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Bump when the generated output format changes so every command is rebuilt
+COMPILER_VERSION = 1
+
+SOURCE_DIR = ".claude/commands"
+SOURCE_PATTERN = "arckit.*.md"
+CACHE_FILE = ".arckit/cache/build-commands.json"
+
+TARGETS = {
+    "gemini": lambda name: f".gemini/commands/arckit/{name}.toml",
+    "codex": lambda name: f".codex/prompts/arckit.{name}.md",
+}
+
+
+class CompileError(ValueError):
+    """Raised when a command cannot be compiled into valid output."""
+
+
+@dataclass
+class CommandSource:
+    """A parsed Claude command."""
+
+    name: str
+    path: Path
+    text: str
+    description: str = ""
+    frontmatter: dict = field(default_factory=dict)
+    body: str = ""
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.text.encode()).hexdigest()
+
+
+@dataclass
+class BuildReport:
+    """What a build did."""
+
+    built: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    errors: dict = field(default_factory=dict)
+
+
+def _unquote(value: str) -> str:
+    """Strip YAML scalar quotes, undoing the escapes each quote style allows."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    return value
+
+
+def split_frontmatter(text: str) -> tuple:
+    """Return ``(frontmatter, body)`` for command text.
+
+    Frontmatter is read as flat ``key: value`` lines, which is all ArcKit
+    commands use; nested YAML values are kept as their raw text.
+    """
+    frontmatter = {}
+    body = text.strip()
+    if text.startswith("---"):
+        parts = text.split("---", 2)
+        if len(parts) == 3:
+            for line in parts[1].splitlines():
+                key, sep, value = line.partition(":")
+                if sep and key.strip() and not key.startswith((" ", "\t")):
+                    frontmatter[key.strip()] = _unquote(value)
+            body = parts[2].strip()
+    return frontmatter, body
+
+
+def parse_command(path: Path) -> CommandSource:
+    """Parse a command file's frontmatter and prompt body."""
+    path = Path(path)
+    text = path.read_text()
+    name = path.name[len("arckit."):-len(".md")] if path.name.startswith("arckit.") else path.stem
+    frontmatter, body = split_frontmatter(text)
+    return CommandSource(name=name, path=path, text=text, description=frontmatter.get("description", ""),
+                         frontmatter=frontmatter, body=body)
+
+
+def _toml_escape(value: str) -> str:
+    """Escape ``value`` for a TOML multi-line basic string."""
+    out = []
+    for char in value:
+        if char == "\\":
+            out.append("\\\\")
+        elif char == '"':
+            out.append('\\"')
+        elif char == "\n" or char == "\t":
+            out.append(char)
+        elif ord(char) < 0x20 or ord(char) == 0x7F:
+            out.append(f"\\u{ord(char):04x}")
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def render_gemini(command: CommandSource) -> str:
+    """Render a command as Gemini CLI TOML and verify it round-trips."""
+    prompt = command.body.replace("$ARGUMENTS", "{{args}}")
+    content = (
+        f'description = """\n{_toml_escape(command.description)}\n"""\n'
+        f'prompt = """\n{_toml_escape(prompt)}\n"""\n'
+    )
+    try:
+        parsed = tomllib.loads(content)
+    except tomllib.TOMLDecodeError as e:
+        raise CompileError(f"{command.path.name}: generated invalid TOML: {e}") from e
+    if parsed.get("description") != command.description + "\n" or parsed.get("prompt") != prompt + "\n":
+        raise CompileError(f"{command.path.name}: generated TOML does not round-trip")
+    return content
+
+
+def render_codex(command: CommandSource) -> str:
+    """Render a command as a Codex CLI prompt; the Claude format is compatible as-is."""
+    return command.text
+
+
+RENDERERS = {"gemini": render_gemini, "codex": render_codex}
+
+
+def _sha256_file(path: Path):
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _load_cache(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != COMPILER_VERSION:
+        return {}
+    return data.get("commands", {})
+
+
+def _save_cache(path: Path, commands: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": COMPILER_VERSION, "commands": commands}, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _is_fresh(record: dict, source_hash: str, outputs: dict, root: Path) -> bool:
+    if not record or record.get("source") != source_hash:
+        return False
+    recorded = record.get("outputs", {})
+    if set(recorded) != set(outputs):
+        return False
+    return all(_sha256_file(root / output) == digest for output, digest in recorded.items())
+
+
+def _compile_one(source_path: Path, root: Path, targets, record: dict, force: bool, dry_run: bool):
+    """Compile one source unless its cache record is fresh; return (record, built)."""
+    command = parse_command(source_path)
+    source_hash = command.sha256
+    outputs = {TARGETS[target](command.name): target for target in targets}
+    if not force and _is_fresh(record, source_hash, outputs, root):
+        return record, False
+
+    new_record = {"source": source_hash, "outputs": {}}
+    built = False
+    for output, target in outputs.items():
+        content = RENDERERS[target](command)
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        new_record["outputs"][output] = digest
+        # Without a cache hit, an output that already matches is left untouched
+        if _sha256_file(root / output) == digest:
+            continue
+        built = True
+        if not dry_run:
+            destination = root / output
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_text(content)
+    return new_record, built
+
+
+def build_commands(root: Path, source_dir: Path = None, targets=("gemini", "codex"),
+                   force: bool = False, dry_run: bool = False, jobs: int = None) -> BuildReport:
+    """Compile every command under ``source_dir`` for ``targets``.
+
+    With ``dry_run`` nothing is written and ``built`` lists the commands whose
+    outputs are out of date.
+    """
+    root = Path(root)
+    source_dir = Path(source_dir) if source_dir else root / SOURCE_DIR
+    cache_path = root / CACHE_FILE
+    cache = _load_cache(cache_path)
+    targets = tuple(targets)
+    report = BuildReport()
+
+    sources = sorted(source_dir.glob(SOURCE_PATTERN))
+    keys = [source.relative_to(root).as_posix() if source.is_relative_to(root) else str(source)
+            for source in sources]
+
+    def compile_source(item):
+        source, key = item
+        try:
+            return key, _compile_one(source, root, targets, cache.get(key, {}), force, dry_run), None
+        except (OSError, CompileError) as e:
+            return key, None, str(e)
+
+    new_cache = {}
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        for key, result, error in pool.map(compile_source, zip(sources, keys)):
+            if error:
+                report.errors[key] = error
+                if key in cache:
+                    new_cache[key] = cache[key]
+                continue
+            record, built = result
+            new_cache[key] = record
+            (report.built if built else report.unchanged).append(key)
+
+    # Remove outputs whose source command no longer exists
+    for key, record in cache.items():
+        if key in new_cache:
+            continue
+        for output in record.get("outputs", {}):
+            report.removed.append(output)
+            if not dry_run:
+                (root / output).unlink(missing_ok=True)
+
+    if not dry_run:
+        _save_cache(cache_path, new_cache)
+    return report
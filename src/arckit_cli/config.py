@@ -0,0 +1,23 @@
+"""Static configuration shared by ArcKit commands."""
+
+# Agent configuration for ArcKit
+AGENT_CONFIG = {
+    "claude": {
+        "name": "Claude Code",
+        "folder": ".claude/",
+        "install_url": "https://docs.anthropic.com/en/docs/claude-code/setup",
+        "requires_cli": True,
+    },
+    "gemini": {
+        "name": "Gemini CLI",
+        "folder": ".gemini/",
+        "install_url": "https://github.com/google-gemini/gemini-cli",
+        "requires_cli": True,
+    },
+    "codex": {
+        "name": "OpenAI Codex CLI",
+        "folder": ".codex/",
+        "install_url": "https://developers.openai.com/codex/cli/",
+        "requires_cli": True,
+    },
+}
@@ -0,0 +1,236 @@
+"""Git helpers used when initializing ArcKit projects.
+
+Nothing here changes the process working directory: every git invocation
+targets the repository with ``-C``, so the helpers are safe to use from
+threads, worker processes and library code.
+
+A freshly scaffolded project is committed in one pass: after ``git init``, a
+single ``git fast-import`` process receives every file inline on stdin and
+writes the initial commit, and ``git read-tree`` populates the index. That
+replaces a ``git add`` that re-reads and hashes the tree plus a ``git commit``
+that runs hooks.
+"""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from .profiling import span, traced
+from .ui import console
+
+INITIAL_COMMIT_MESSAGE = "Initial commit from ArcKit"
+
+
+class GitError(RuntimeError):
+    """Raised when a git command fails."""
+
+
+def find_git_dir(path: Path = None):
+    """Return the ``.git`` entry governing ``path``, or None.
+
+    Walks up from ``path`` looking for a ``.git`` directory (or the ``.git``
+    file used by worktrees and submodules) instead of spawning git.
+    """
+    path = Path(path or Path.cwd()).resolve()
+    for directory in (path, *path.parents):
+        candidate = directory / ".git"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def is_git_repo(path: Path = None) -> bool:
+    """Check if the specified path is inside a git repository."""
+    if path is None:
+        path = Path.cwd()
+
+    if not path.is_dir():
+        return False
+
+    return find_git_dir(path) is not None
+
+
+def run_git(repo: Path, *args, input: bytes = None) -> str:
+    """Run ``git -C repo <args>`` and return its stdout."""
+    try:
+        with span(f"git {args[0]}", cat="subprocess"):
+            result = subprocess.run(
+                ["git", "-C", str(repo), *args],
+                input=input,
+                capture_output=True,
+                check=True,
+            )
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode(errors="replace").strip().splitlines()
+        raise GitError(f"git {args[0]} failed: {message[-1] if message else e}") from e
+    return result.stdout.decode(errors="replace")
+
+
+def _read_config_user(path: Path) -> dict:
+    """Extract ``user.name``/``user.email`` from a git config file.
+
+    Only plain ``[user]`` sections are understood; anything fancier (includes,
+    conditional includes) makes the caller fall back to asking git.
+    """
+    values = {}
+    try:
+        lines = path.read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return values
+    section = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            section = line.strip("[]").strip().lower()
+            if section.startswith("include"):
+                values["_include"] = True
+            continue
+        if section == "user" and "=" in line:
+            key, value = line.split("=", 1)
+            value = value.split(" #")[0].strip().strip('"')
+            values[key.strip().lower()] = value
+    return values
+
+
+def _timestamp() -> str:
+    now = time.time()
+    offset = time.localtime(now).tm_gmtoff // 60
+    sign = "+" if offset >= 0 else "-"
+    return f"{int(now)} {sign}{abs(offset) // 60:02d}{abs(offset) % 60:02d}"
+
+
+def committer_ident(repo: Path) -> str:
+    """Return ``Name <email> <epoch> <tz>`` for the initial commit.
+
+    Uses the GIT_COMMITTER_* environment or the user's global config when
+    they are simple enough to read directly, otherwise asks ``git var`` so the
+    result (and any "identity unknown" error) matches ``git commit``.
+    """
+    name = os.environ.get("GIT_COMMITTER_NAME")
+    email = os.environ.get("GIT_COMMITTER_EMAIL")
+    if not (name and email):
+        xdg_config = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+        global_config = os.environ.get("GIT_CONFIG_GLOBAL")
+        config = {}
+        for config_path in (xdg_config / "git" / "config",
+                            Path(global_config) if global_config else Path.home() / ".gitconfig"):
+            config.update(_read_config_user(config_path))
+        if config.get("_include") or "GIT_CONFIG_SYSTEM" in os.environ or "GIT_CONFIG_COUNT" in os.environ:
+            config = {}
+        name = name or config.get("name")
+        email = email or config.get("email")
+    if name and email:
+        return f"{name} <{email}> {_timestamp()}"
+    return run_git(repo, "var", "GIT_COMMITTER_IDENT").strip()
+
+
+def _author_ident(committer: str) -> str:
+    name = os.environ.get("GIT_AUTHOR_NAME")
+    email = os.environ.get("GIT_AUTHOR_EMAIL")
+    if name and email:
+        return f"{name} <{email}> {committer.rsplit('>', 1)[1].strip()}"
+    return committer
+
+
+def _quote_path(path: str) -> str:
+    if path.startswith('"') or any(c in path for c in '\\\n'):
+        escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    return path
+
+
+def _worktree_files(project_path: Path):
+    """Yield (relative path, absolute path, mode) for every file to commit."""
+    for directory, dirnames, filenames in os.walk(project_path):
+        if directory == str(project_path) and ".git" in dirnames:
+            dirnames.remove(".git")
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full_path = os.path.join(directory, filename)
+            relative = os.path.relpath(full_path, project_path).replace(os.sep, "/")
+            if os.path.islink(full_path):
+                yield relative, full_path, "120000"
+            else:
+                executable = os.access(full_path, os.X_OK)
+                yield relative, full_path, "100755" if executable else "100644"
+
+
+def fast_import_stream(project_path: Path, ref: str, committer: str, message: str) -> bytes:
+    """Build a ``git fast-import`` stream committing the whole work tree."""
+    message_bytes = message.encode() + b"\n"
+    chunks = [
+        f"commit {ref}\n".encode(),
+        f"author {_author_ident(committer)}\n".encode(),
+        f"committer {committer}\n".encode(),
+        f"data {len(message_bytes)}\n".encode(),
+        message_bytes,
+    ]
+    for relative, full_path, mode in _worktree_files(project_path):
+        if mode == "120000":
+            content = os.readlink(full_path).encode()
+        else:
+            with open(full_path, "rb") as f:
+                content = f.read()
+        chunks.append(f"M {mode} inline {_quote_path(relative)}\n".encode())
+        chunks.append(f"data {len(content)}\n".encode())
+        chunks.append(content)
+        chunks.append(b"\n")
+    chunks.append(b"done\n")
+    return b"".join(chunks)
+
+
+def _head_ref(project_path: Path) -> str:
+    head = (project_path / ".git" / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        raise GitError("HEAD of a new repository is not a symbolic ref")
+    return head[len("ref: "):]
+
+
+@traced("git.bootstrap")
+def bootstrap_repo(project_path: Path, message: str = INITIAL_COMMIT_MESSAGE):
+    """Create a repository at ``project_path`` with every file in one commit.
+
+    Intended for freshly scaffolded projects, whose contents ArcKit wrote
+    itself: ignore rules are not consulted.
+    """
+    project_path = Path(project_path)
+    run_git(project_path, "init", "-q")
+    ref = _head_ref(project_path)
+    stream = fast_import_stream(project_path, ref, committer_ident(project_path), message)
+    # Keep the objects in the pack fast-import writes (below the default unpack
+    # limit it would explode them into loose objects), compress it quickly and
+    # skip the delta search, which finds nothing between distinct files
+    run_git(project_path, "-c", "fastimport.unpackLimit=0", "-c", "pack.compression=1",
+            "fast-import", "--quiet", "--done", "--depth=0", input=stream)
+    run_git(project_path, "read-tree", ref)
+
+
+def commit_all(project_path: Path, message: str = INITIAL_COMMIT_MESSAGE):
+    """Initialise a repository and commit the work tree, honouring ignore rules."""
+    project_path = Path(project_path)
+    run_git(project_path, "init", "-q")
+    run_git(project_path, "add", ".")
+    run_git(project_path, "commit", "-q", "-m", message)
+
+
+def init_git_repo(project_path: Path, fresh: bool = False) -> bool:
+    """Initialize a git repository in the specified path.
+
+    ``fresh`` marks a directory that ArcKit has just created, which can be
+    committed with the single-pass :func:`bootstrap_repo`. Existing
+    directories go through ``git add`` so their ignore rules apply.
+    """
+    try:
+        console.print("[cyan]Initializing git repository...[/cyan]")
+        if fresh:
+            bootstrap_repo(project_path)
+        else:
+            commit_all(project_path)
+        console.print("[green]✓[/green] Git repository initialized")
+        return True
+    except (GitError, OSError) as e:
+        console.print(f"[red]Error initializing git repository:[/red] {e}")
+        return False
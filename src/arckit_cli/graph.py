@@ -0,0 +1,383 @@
+"""Command dependency graph built from ``DEPENDENCY-MATRIX.md``.
+
+The matrix rows are producers and its columns consumers; each cell is ``M``
+(mandatory), ``R`` (recommended) or ``O`` (optional). :data:`OUTPUTS` maps
+every command (and the external HLD/DLD documents) to the files it writes in
+a project, so the graph can be evaluated against a project directory:
+
+- :func:`ready` - commands whose mandatory inputs exist
+- :func:`stale` - artifacts older than (or, with hashing, produced from
+  different contents of) their upstream inputs
+- :func:`schedule` - topological order grouped into levels that can run in
+  parallel
+
+A project is read with one bounded directory walk, so evaluating hundreds of
+projects takes milliseconds each.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+MATRIX_FILE = "DEPENDENCY-MATRIX.md"
+STAMPS_FILE = ".arckit/cache/graph-stamps.json"
+STAMPS_VERSION = 1
+
+LEVELS = ("M", "R", "O")
+DEFAULT_LEVELS = ("M", "R")
+
+# Artifacts written by each command, relative to the project directory.
+# ``/``-prefixed patterns are relative to the repository root.
+OUTPUTS = {
+    "plan": ["project-plan.md"],
+    "principles": [
+        "/.arckit/memory/architecture-principles.md",
+        "/memory/architecture-principles.md",
+        "/templates/architecture-principles.md",
+    ],
+    "stakeholders": ["stakeholder-drivers.md"],
+    "risk": ["risk-register.md"],
+    "sobc": ["sobc.md"],
+    "requirements": ["requirements.md"],
+    "data-model": ["data-model.md"],
+    "research": ["research-findings.md"],
+    "wardley": ["wardley-maps/*.md"],
+    "sow": ["sow.md"],
+    "dos": ["procurement/dos-requirements.md"],
+    "gcloud-search": ["procurement/gcloud-requirements.md"],
+    "gcloud-clarify": ["procurement/gcloud-clarification-questions.md"],
+    "evaluate": ["evaluation-criteria.md", "vendor-comparison.md"],
+    "hld": ["hld.md", "vendors/*/hld.md", "vendors/*/hld-v*.md", "final/approved-hld.md"],
+    "dld": ["dld.md", "vendors/*/dld.md", "vendors/*/dld-v*.md", "final/dld/*.md"],
+    "hld-review": ["vendors/*/hld-review.md", "hld-review-summary.md"],
+    "dld-review": ["vendors/*/dld-review.md"],
+    "backlog": ["backlog.md", "backlog.json"],
+    "diagram": ["diagrams/*.md"],
+    "servicenow": ["servicenow-design.md"],
+    "traceability": ["traceability-matrix.md"],
+    "analyze": ["analysis-report.md"],
+    "service-assessment": ["service-assessment-*-prep.md"],
+    "tcop": ["tcop-assessment.md", "tcop-review.md"],
+    "ai-playbook": ["ai-playbook-assessment.md"],
+    "atrs": ["atrs-record.md"],
+    "secure": ["ukgov-secure-by-design.md"],
+    "mod-secure": ["mod-secure-by-design.md"],
+    "jsp-936": ["jsp-936*.md"],
+}
+
+# Deep enough for final/dld/*.md and vendors/*/hld.md
+_MAX_DEPTH = 3
+
+
+def artifact_for(relative: str):
+    """Return the command (or external document) that produces a project file, or None."""
+    depth = relative.count("/")
+    for node, patterns in OUTPUTS.items():
+        for pattern in patterns:
+            if pattern.startswith("/"):
+                continue
+            if pattern == relative or (
+                "*" in pattern and pattern.count("/") == depth and fnmatch.fnmatchcase(relative, pattern)
+            ):
+                return node
+    return None
+
+
+class GraphError(ValueError):
+    """Raised when the dependency matrix cannot be parsed or ordered."""
+
+
+@dataclass
+class DependencyGraph:
+    """Commands, external inputs and their dependencies."""
+
+    commands: list = field(default_factory=list)
+    externals: list = field(default_factory=list)
+    # consumer -> {producer: "M" | "R" | "O"}
+    dependencies: dict = field(default_factory=dict)
+
+    def inputs(self, command: str, levels=DEFAULT_LEVELS) -> dict:
+        return {
+            producer: level
+            for producer, level in self.dependencies.get(command, {}).items()
+            if level in levels
+        }
+
+
+def _cells(line: str) -> list:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_matrix(text: str) -> DependencyGraph:
+    """Parse the dependency structure matrix table."""
+    columns = None
+    graph = DependencyGraph()
+    for line in text.splitlines():
+        if not line.startswith("|"):
+            if columns is not None and graph.dependencies:
+                break
+            continue
+        cells = _cells(line)
+        if columns is None:
+            if "PRODUCES" in cells[0]:
+                columns = cells[1:]
+                graph.commands = list(columns)
+                graph.dependencies = {column: {} for column in columns}
+            continue
+        if set(cells[0]) <= set("-: "):
+            continue
+
+        producer = cells[0].replace("*", "").strip()
+        if "(external)" in producer:
+            producer = producer.replace("(external)", "").strip().lower()
+            graph.externals.append(producer)
+        elif producer not in graph.dependencies:
+            raise GraphError(f"matrix row '{producer}' has no matching column")
+        if len(cells) - 1 != len(columns):
+            raise GraphError(f"matrix row '{producer}' has {len(cells) - 1} cells, expected {len(columns)}")
+        for consumer, cell in zip(columns, cells[1:]):
+            if cell in LEVELS:
+                graph.dependencies[consumer][producer] = cell
+            elif cell not in ("", "-"):
+                raise GraphError(f"matrix cell {producer}/{consumer} has unknown value '{cell}'")
+
+    if columns is None:
+        raise GraphError("no dependency matrix table found")
+    return graph
+
+
+def find_matrix(repo_root: Path = None) -> Path:
+    """Locate ``DEPENDENCY-MATRIX.md``: the workspace copy, then the bundled one."""
+    if repo_root and (Path(repo_root) / MATRIX_FILE).is_file():
+        return Path(repo_root) / MATRIX_FILE
+    from .paths import resolve_data_root, source_root
+
+    for root in (resolve_data_root().root, source_root()):
+        if (root / MATRIX_FILE).is_file():
+            return root / MATRIX_FILE
+    raise GraphError(f"{MATRIX_FILE} not found")
+
+
+def load_graph(path: Path) -> DependencyGraph:
+    return parse_matrix(Path(path).read_text())
+
+
+def schedule(graph: DependencyGraph, levels=DEFAULT_LEVELS, done=()) -> list:
+    """Group commands into levels; every command's inputs are in earlier levels.
+
+    Commands in ``done`` count as satisfied and are left out. External inputs
+    are never scheduled.
+    """
+    pending = {
+        command: {
+            producer for producer in graph.inputs(command, levels)
+            if producer in graph.dependencies and producer not in done and producer != command
+        }
+        for command in graph.commands if command not in done
+    }
+    order = []
+    while pending:
+        level = sorted(command for command, inputs in pending.items() if not inputs)
+        if not level:
+            raise GraphError(f"dependency cycle between: {', '.join(sorted(pending))}")
+        order.append(level)
+        for command in level:
+            del pending[command]
+        for inputs in pending.values():
+            inputs.difference_update(level)
+    return order
+
+
+@dataclass
+class ProjectState:
+    """Files of one project (and the repository-level artifacts) with their stats."""
+
+    project_dir: Path
+    repo_root: Path
+    # relative path -> (size, mtime_ns); repository-level paths start with "/"
+    files: dict = field(default_factory=dict)
+
+    def outputs(self, node: str) -> list:
+        """Existing files produced by ``node``."""
+        matches = []
+        for pattern in OUTPUTS.get(node, ()):
+            if "*" in pattern:
+                depth = pattern.count("/")
+                matches.extend(
+                    path for path in self.files
+                    if path.count("/") == depth and fnmatch.fnmatchcase(path, pattern)
+                )
+            elif pattern in self.files:
+                matches.append(pattern)
+        return sorted(set(matches))
+
+    def mtime(self, node: str):
+        """Newest mtime (ns) among ``node``'s outputs, or None when it has none."""
+        return max((self.files[path][1] for path in self.outputs(node)), default=None)
+
+    def absolute(self, path: str) -> Path:
+        if path.startswith("/"):
+            return self.repo_root / path[1:]
+        return self.project_dir / path
+
+
+def read_project(project_dir: Path, repo_root: Path) -> ProjectState:
+    """Stat every file in the project (to a bounded depth) in one walk."""
+    state = ProjectState(Path(project_dir), Path(repo_root))
+    stack = [(str(project_dir), "", 0)]
+    while stack:
+        directory, prefix, depth = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    if depth < _MAX_DEPTH - 1:
+                        stack.append((entry.path, f"{prefix}{entry.name}/", depth + 1))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    state.files[prefix + entry.name] = (stat.st_size, stat.st_mtime_ns)
+
+    for patterns in OUTPUTS.values():
+        for pattern in patterns:
+            if pattern.startswith("/"):
+                try:
+                    stat = os.stat(state.repo_root / pattern[1:])
+                except OSError:
+                    continue
+                state.files[pattern] = (stat.st_size, stat.st_mtime_ns)
+    return state
+
+
+@dataclass
+class Readiness:
+    """Which commands can run in a project."""
+
+    ready: list = field(default_factory=list)
+    produced: list = field(default_factory=list)
+    # command -> missing mandatory inputs
+    blocked: dict = field(default_factory=dict)
+
+
+def ready(graph: DependencyGraph, state: ProjectState) -> Readiness:
+    """Classify every command by whether its mandatory inputs exist."""
+    present = {node for node in OUTPUTS if state.outputs(node)}
+    result = Readiness()
+    for command in graph.commands:
+        missing = sorted(producer for producer in graph.inputs(command, ("M",)) if producer not in present)
+        if missing:
+            result.blocked[command] = missing
+        else:
+            result.ready.append(command)
+            if command in present:
+                result.produced.append(command)
+    return result
+
+
+@dataclass
+class StaleArtifact:
+    """An artifact whose inputs changed after it was produced."""
+
+    command: str
+    outputs: list
+    changed_inputs: list
+
+
+class HashStamps:
+    """Input digests recorded for each artifact, plus a file hash cache.
+
+    The first time an artifact (or a regenerated version of it) is seen, the
+    digests of its inputs are recorded; it is stale once any of them differ.
+    File hashes are reused while a file's size and mtime are unchanged.
+    """
+
+    def __init__(self, repo_root: Path):
+        self.path = Path(repo_root) / STAMPS_FILE
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != STAMPS_VERSION:
+            data = {}
+        self.projects = data.get("projects", {})
+        self.hashes = data.get("hashes", {})
+        self.dirty = False
+
+    def _file_hash(self, state: ProjectState, path: str) -> str:
+        absolute = str(state.absolute(path))
+        size, mtime_ns = state.files[path]
+        cached = self.hashes.get(absolute)
+        if cached and cached[0] == size and cached[1] == mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256(Path(absolute).read_bytes()).hexdigest()
+        self.hashes[absolute] = [size, mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def digest(self, state: ProjectState, node: str) -> str:
+        combined = hashlib.sha256()
+        for path in state.outputs(node):
+            combined.update(f"{path}\0{self._file_hash(state, path)}\n".encode())
+        return combined.hexdigest()
+
+    def record(self, project: str, command: str, outputs: str, inputs: dict):
+        self.projects.setdefault(project, {})[command] = {"outputs": outputs, "inputs": inputs}
+        self.dirty = True
+
+    def get(self, project: str, command: str):
+        return self.projects.get(project, {}).get(command)
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": STAMPS_VERSION, "projects": self.projects, "hashes": self.hashes}))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+        self.dirty = False
+
+
+def stale(graph: DependencyGraph, state: ProjectState, levels=DEFAULT_LEVELS, stamps: HashStamps = None) -> list:
+    """Artifacts whose existing inputs changed after they were produced.
+
+    By default an input is newer when its newest file has a later mtime than
+    the artifact's newest file. With ``stamps`` the comparison uses content
+    digests instead, so touched or re-checked-out files do not count.
+    """
+    result = []
+    project = state.project_dir.name
+    for command in graph.commands:
+        outputs = state.outputs(command)
+        if not outputs:
+            continue
+        inputs = [producer for producer in graph.inputs(command, levels) if state.outputs(producer)]
+
+        if stamps is None:
+            produced_at = state.mtime(command)
+            changed = [producer for producer in inputs if state.mtime(producer) > produced_at]
+        else:
+            output_digest = stamps.digest(state, command)
+            input_digests = {producer: stamps.digest(state, producer) for producer in inputs}
+            recorded = stamps.get(project, command)
+            if recorded is None or recorded["outputs"] != output_digest:
+                stamps.record(project, command, output_digest, input_digests)
+                changed = []
+            else:
+                changed = [
+                    producer for producer, digest in input_digests.items()
+                    if recorded["inputs"].get(producer) != digest
+                ]
+
+        if changed:
+            result.append(StaleArtifact(command, outputs, sorted(changed)))
+    return result
@@ -0,0 +1,295 @@
+"""Private on-disk HTTP cache following the RFC 9111 rules a client cache needs.
+
+Responses to ``GET`` are stored per URL in the user cache directory: the
+body as a file, the status, headers, ``Vary`` request headers and timings
+in a SQLite index. :meth:`HttpCache.lookup` returns the stored response
+unless it does not match the request's ``Vary`` headers, and
+:meth:`Entry.state` says whether it is fresh (``max-age``, ``Expires`` or
+the 10% ``Last-Modified`` heuristic) or must be revalidated (stale,
+``no-cache``). ``no-store`` responses are never written.
+
+The cache is bounded by size: whenever it grows past ``max_bytes`` the
+least recently used entries are evicted. Hit, revalidation and latency
+counters are persisted so ``arckit doctor --http-cache`` can report them.
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+CACHE_ENV = "ARCKIT_HTTP_CACHE_DIR"
+INDEX_FILE = "index.sqlite"
+BODIES_DIR = "bodies"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+# RFC 9111 4.2.2: heuristic freshness is a fraction of the time since modification
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 24 * 3600
+# RFC 9110 15.1: statuses cacheable without explicit freshness information, less 206:
+# this cache does not combine partial content, so never stores it (RFC 9111 3.3-3.4)
+HEURISTICALLY_CACHEABLE = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+# Headers of a 304 that must not replace the stored ones (RFC 9111 3.2)
+NOT_UPDATED = {"content-length", "content-encoding", "transfer-encoding", "content-range"}
+COUNTERS = ("requests", "hits", "revalidated", "misses", "stale", "errors", "latency_ms")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    vary TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def cache_dir(path: Path = None) -> Path:
+    if path:
+        return Path(path)
+    if os.environ.get(CACHE_ENV):
+        return Path(os.environ[CACHE_ENV])
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("arckit")) / "http"
+
+
+def parse_cache_control(value: str) -> dict:
+    """``max-age=60, no-cache`` -> ``{"max-age": "60", "no-cache": None}``."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, sep, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if sep else None
+    return directives
+
+
+def _http_date(value: str):
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _seconds(value):
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class Entry:
+    """A stored response."""
+
+    key: str
+    url: str
+    status: int
+    headers: dict
+    vary: dict
+    stored_at: float
+    path: Path
+
+    @property
+    def cache_control(self) -> dict:
+        return parse_cache_control(self.headers.get("cache-control"))
+
+    def freshness_lifetime(self) -> float:
+        directives = self.cache_control
+        max_age = _seconds(directives.get("max-age"))
+        if max_age is not None:
+            return max_age
+        expires = self.headers.get("expires")
+        if expires is not None:
+            expires_at = _http_date(expires)
+            date = _http_date(self.headers.get("date")) or self.stored_at
+            return max(0.0, expires_at - date) if expires_at else 0.0
+        modified = _http_date(self.headers.get("last-modified"))
+        if modified and self.status in HEURISTICALLY_CACHEABLE:
+            date = _http_date(self.headers.get("date")) or self.stored_at
+            return min(HEURISTIC_FRACTION * max(0.0, date - modified), HEURISTIC_MAX_SECONDS)
+        return 0.0
+
+    def age(self, now: float = None) -> float:
+        initial = _seconds(self.headers.get("age")) or 0
+        return initial + max(0.0, (now or time.time()) - self.stored_at)
+
+    def state(self, request_headers: dict = None, now: float = None) -> str:
+        requested = parse_cache_control((request_headers or {}).get("cache-control"))
+        if "no-cache" in self.cache_control or "no-cache" in requested:
+            return STALE
+        lifetime = self.freshness_lifetime()
+        request_max_age = _seconds(requested.get("max-age"))
+        if request_max_age is not None:
+            lifetime = min(lifetime, request_max_age)
+        return FRESH if self.age(now) < lifetime else STALE
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def may_serve_stale(self) -> bool:
+        """Whether this may be served when the origin is unreachable (RFC 9111 4.2.4)."""
+        directives = self.cache_control
+        return "must-revalidate" not in directives and "no-cache" not in directives
+
+    def read(self) -> bytes:
+        return self.path.read_bytes()
+
+
+def storable(status: int, request_headers: dict, response_headers: dict) -> bool:
+    if status == 206 or "range" in request_headers:
+        return False
+    response = parse_cache_control(response_headers.get("cache-control"))
+    request = parse_cache_control(request_headers.get("cache-control"))
+    if "no-store" in response or "no-store" in request or response_headers.get("vary", "").strip() == "*":
+        return False
+    explicit = "max-age" in response or "expires" in response_headers or "public" in response
+    return explicit or status in HEURISTICALLY_CACHEABLE
+
+
+class HttpCache:
+    """Size-bounded LRU store of HTTP responses."""
+
+    def __init__(self, path: Path = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = cache_dir(path)
+        self.max_bytes = max_bytes
+        (self.root / BODIES_DIR).mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.root / INDEX_FILE, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.root / BODIES_DIR / key[:2] / key
+
+    def lookup(self, url: str, request_headers: dict = None):
+        """Stored response for ``url`` matching the request's ``Vary`` headers, or None.
+
+        A ``Range`` request is never answered from the cache, which only
+        holds complete responses.
+        """
+        request_headers = {k.lower(): v for k, v in (request_headers or {}).items()}
+        if "range" in request_headers:
+            return None
+        key = self.key(url)
+        row = self.conn.execute(
+            "SELECT url, status, headers, vary, stored_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        vary = json.loads(row[3])
+        if any(request_headers.get(name) != value for name, value in vary.items()):
+            return None
+        entry = Entry(key, row[0], row[1], json.loads(row[2]), vary, row[4], self._body_path(key))
+        if not entry.path.exists():
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.conn.commit()
+            return None
+        self.conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return entry
+
+    def store(self, url: str, status: int, headers: dict, content: bytes, request_headers: dict = None):
+        headers = {k.lower(): v for k, v in headers.items()}
+        request_headers = {k.lower(): v for k, v in (request_headers or {}).items()}
+        if not storable(status, request_headers, headers):
+            return
+        key = self.key(url)
+        vary = {name.strip().lower(): request_headers.get(name.strip().lower())
+                for name in headers.get("vary", "").split(",") if name.strip()}
+        path = self._body_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries (key, url, status, headers, vary, stored_at, accessed_at, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, status, json.dumps(headers), json.dumps(vary), now, now, len(content)),
+        )
+        self.conn.commit()
+        self.evict()
+
+    def refresh(self, entry: Entry, headers: dict):
+        """Apply a 304 Not Modified: merge its headers and restart the entry's age."""
+        for name, value in headers.items():
+            if name.lower() not in NOT_UPDATED:
+                entry.headers[name.lower()] = value
+        entry.stored_at = time.time()
+        self.conn.execute("UPDATE entries SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                          (json.dumps(entry.headers), entry.stored_at, entry.stored_at, entry.key))
+        self.conn.commit()
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        removed = 0
+        if total <= self.max_bytes:
+            return removed
+        for key, size in self.conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._body_path(key).unlink(missing_ok=True)
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        self.conn.commit()
+        return removed
+
+    def add_counters(self, counts: dict):
+        self.conn.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            [(name, counts.get(name, 0)) for name in COUNTERS],
+        )
+        self.conn.commit()
+
+    def stats(self) -> dict:
+        entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        counters = dict.fromkeys(COUNTERS, 0)
+        counters.update(dict(self.conn.execute("SELECT name, value FROM counters")))
+        served = counters["hits"] + counters["revalidated"]
+        return {
+            "path": str(self.root),
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            **{name: int(counters[name]) for name in COUNTERS if name != "latency_ms"},
+            "hit_rate": round(served / counters["requests"], 3) if counters["requests"] else 0.0,
+            "mean_latency_ms": round(counters["latency_ms"] / counters["requests"], 1) if counters["requests"] else 0.0,
+        }
+
+    def clear(self):
+        for key, in self.conn.execute("SELECT key FROM entries").fetchall():
+            self._body_path(key).unlink(missing_ok=True)
+        self.conn.execute("DELETE FROM entries")
+        self.conn.execute("DELETE FROM counters")
+        self.conn.commit()
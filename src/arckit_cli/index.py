@@ -0,0 +1,371 @@
+"""Persistent workspace index in ``.arckit/index.sqlite``.
+
+Records every project and every file under ``projects/`` with its size,
+mtime, SHA-256, the artifact it represents (per the dependency graph) and,
+for markdown, its document ID (``ARC-NNN-TYPE-vX.Y``). :func:`refresh`
+brings the index up to date incrementally: files are only re-hashed when
+their size or mtime changed, and removed files and projects are dropped.
+``arckit index --json`` and ``arckit search`` answer from it. Project
+lookups and numbering elsewhere read ``projects/`` directly: that is a
+single directory listing, cheaper than bringing the index up to date.
+
+Markdown files are also split at their headings, as parsed by
+:mod:`~arckit_cli.mdcache`, into a full-text index (SQLite FTS5) searched
+by :func:`search`. Sections carry their heading
+path, line, document ID and the requirement IDs they mention; a file's
+sections are only rebuilt when its content hash changes.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import traced
+from .publish import is_bundle
+
+INDEX_FILE = ".arckit/index.sqlite"
+SCHEMA_VERSION = 3
+
+DOCUMENT_ID_RE = re.compile(r"\bARC-(\d{3})-([A-Z0-9]+(?:-[A-Z0-9]+)*)-v(\d+(?:\.\d+)*)\b")
+# Document IDs live in the Document Control table at the top of a document
+DOCUMENT_ID_SCAN_LINES = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    number TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    artifact TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    document_id TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_project ON documents (project);
+CREATE INDEX IF NOT EXISTS documents_document_id ON documents (document_id);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    project TEXT NOT NULL,
+    artifact TEXT,
+    document_id TEXT,
+    heading TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_path ON sections (path);
+CREATE INDEX IF NOT EXISTS sections_project ON sections (project);
+CREATE INDEX IF NOT EXISTS sections_document_id ON sections (document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5 (heading, body, tokenize = 'porter unicode61');
+CREATE TABLE IF NOT EXISTS section_requirements (
+    section INTEGER NOT NULL,
+    requirement_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS section_requirements_id ON section_requirements (requirement_id);
+CREATE INDEX IF NOT EXISTS section_requirements_section ON section_requirements (section);
+"""
+
+# FTS5 snippet markers, replaced by the caller's highlighting
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+QUERY_TOKEN_RE = re.compile(r'"[^"]*"\*?|\S+')
+QUERY_OPERATORS = {"AND", "OR", "NOT"}
+
+
+@dataclass
+class UpdateStats:
+    """What a refresh changed."""
+
+    projects: int = 0
+    documents: int = 0
+    added: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def modified(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def connect(repo_root: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the index of the workspace at ``repo_root``."""
+    path = Path(repo_root) / INDEX_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    elif row["value"] != str(SCHEMA_VERSION):
+        conn.close()
+        path.unlink()
+        return connect(repo_root)
+    return conn
+
+
+def document_id_in(text: str):
+    """First ``ARC-NNN-TYPE-vX.Y`` near the top of a markdown document, or None."""
+    head = text.split("\n", DOCUMENT_ID_SCAN_LINES)[:DOCUMENT_ID_SCAN_LINES]
+    match = DOCUMENT_ID_RE.search("\n".join(head))
+    return match.group(0) if match else None
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def markdown_sections(sections, content: bytes):
+    """Yield ``(heading path, first line, body)`` for the mdcache ``sections`` of ``content``.
+
+    The heading path joins the enclosing headings, e.g. ``Design › Security``.
+    A heading followed directly by a sub-heading is still yielded, with an
+    empty body, so its title stays searchable; text before the first
+    heading only when it is not blank.
+    """
+    for section in sections:
+        body = content[section.start:section.end].decode("utf-8", errors="replace")
+        if section.level or body.strip():
+            yield section.path, section.line, body
+
+
+def _drop_sections(conn: sqlite3.Connection, paths):
+    for path in paths:
+        ids = [(row[0],) for row in conn.execute("SELECT id FROM sections WHERE path = ?", (path,))]
+        if not ids:
+            continue
+        conn.executemany("DELETE FROM sections_fts WHERE rowid = ?", ids)
+        conn.executemany("DELETE FROM section_requirements WHERE section = ?", ids)
+        conn.execute("DELETE FROM sections WHERE path = ?", (path,))
+
+
+def _index_sections(conn: sqlite3.Connection, relative: str, project: str, artifact, document_id,
+                    sections, content: bytes):
+    from .trace import REQUIREMENT_ID_RE
+
+    for heading, line, body in markdown_sections(sections, content):
+        cursor = conn.execute(
+            "INSERT INTO sections (path, project, artifact, document_id, heading, line) VALUES (?, ?, ?, ?, ?, ?)",
+            (relative, project, artifact, document_id, heading, line),
+        )
+        section = cursor.lastrowid
+        conn.execute("INSERT INTO sections_fts (rowid, heading, body) VALUES (?, ?, ?)", (section, heading, body))
+        found = set(REQUIREMENT_ID_RE.findall(heading + "\n" + body))
+        conn.executemany("INSERT INTO section_requirements (section, requirement_id) VALUES (?, ?)",
+                         ((section, requirement_id) for requirement_id in sorted(found)))
+
+
+def _project_files(project_dir: str, prefix: str):
+    """Yield (relative path, absolute path, stat) for every visible file of a project."""
+    stack = [(project_dir, prefix)]
+    while stack:
+        directory, relative = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{relative}{entry.name}/"))
+                elif entry.is_file() and not is_bundle(f"{relative}{entry.name}"[len(prefix):]):
+                    yield f"{relative}{entry.name}", entry.path, entry.stat()
+
+
+@traced("index.refresh")
+def refresh(conn: sqlite3.Connection, repo_root: Path, rebuild: bool = False) -> UpdateStats:
+    """Bring the index up to date with ``projects/``; only changed files are read."""
+    from .graph import artifact_for
+    from .mdcache import MdCache
+    from .workspace import list_project_dirs, project_number
+
+    start = time.perf_counter()
+    repo_root = Path(repo_root)
+    cache = MdCache.for_repo(repo_root)
+    stats = UpdateStats()
+    if rebuild:
+        for table in ("documents", "projects", "sections", "sections_fts", "section_requirements"):
+            conn.execute(f"DELETE FROM {table}")
+
+    known = {row["path"]: (row["size"], row["mtime_ns"], row["sha256"]) for row in
+             conn.execute("SELECT path, size, mtime_ns, sha256 FROM documents")}
+    known_projects = {row["name"] for row in conn.execute("SELECT name FROM projects")}
+    seen = set()
+    projects = []
+
+    for project_dir in list_project_dirs(repo_root):
+        name = project_dir.name
+        projects.append((name, project_number(name), str(project_dir)))
+        for relative, absolute, stat in _project_files(str(project_dir), f"projects/{name}/"):
+            seen.add(relative)
+            previous = known.get(relative)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+            artifact = artifact_for(relative[len(name) + 10:])
+            document_id = content = None
+            if relative.endswith(".md"):
+                with open(absolute, "rb") as f:
+                    content = f.read()
+                sha256 = hashlib.sha256(content).hexdigest()
+                document_id = document_id_in(content.decode("utf-8", errors="replace"))
+            else:
+                sha256 = _sha256(absolute)
+            conn.execute(
+                "INSERT OR REPLACE INTO documents (path, project, artifact, size, mtime_ns, sha256, document_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (relative, name, artifact, stat.st_size, stat.st_mtime_ns, sha256, document_id),
+            )
+            # A touched but unchanged file keeps its sections
+            if previous and previous[2] == sha256:
+                continue
+            if previous:
+                _drop_sections(conn, [relative])
+            if content is not None:
+                _index_sections(conn, relative, name, artifact, document_id,
+                                cache.load(absolute, content).sections, content)
+            (stats.changed if previous else stats.added).append(relative)
+    cache.save()
+
+    stats.removed = sorted(set(known) - seen)
+    conn.executemany("DELETE FROM documents WHERE path = ?", ((path,) for path in stats.removed))
+    _drop_sections(conn, stats.removed)
+    names = {name for name, _, _ in projects}
+    conn.executemany("DELETE FROM projects WHERE name = ?", ((name,) for name in known_projects - names))
+    conn.executemany("INSERT OR REPLACE INTO projects (name, number, path) VALUES (?, ?, ?)", projects)
+    conn.commit()
+
+    stats.projects = len(projects)
+    stats.documents = len(seen)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def find_project(conn: sqlite3.Connection, prefix: str):
+    """Project path by number or name, with ``find_project_dir_by_prefix`` semantics."""
+    row = conn.execute(
+        "SELECT path FROM projects WHERE name = ? OR substr(name, 1, ?) = ? ORDER BY name LIMIT 1",
+        (prefix, len(prefix) + 1, prefix + "-"),
+    ).fetchone()
+    if row is None:
+        row = conn.execute(
+            "SELECT path FROM projects WHERE instr(name, ?) > 0 ORDER BY name LIMIT 1", (prefix,)
+        ).fetchone()
+    return Path(row["path"]) if row else None
+
+
+def documents(conn: sqlite3.Connection, project: str = None) -> list:
+    if project:
+        rows = conn.execute("SELECT * FROM documents WHERE project = ? ORDER BY path", (project,))
+    else:
+        rows = conn.execute("SELECT * FROM documents ORDER BY path")
+    return [dict(row) for row in rows]
+
+
+@dataclass
+class SearchHit:
+    """A ranked section matching a search."""
+
+    path: str
+    project: str
+    artifact: str
+    document_id: str
+    heading: str
+    line: int
+    snippet: str
+    rank: float
+
+    def to_json(self) -> dict:
+        return {
+            "path": self.path,
+            "line": self.line,
+            "project": self.project,
+            "artifact": self.artifact,
+            "document_id": self.document_id,
+            "heading": self.heading,
+            "snippet": " ".join(self.snippet.split()).replace(MATCH_START, "**").replace(MATCH_END, "**"),
+            "rank": round(self.rank, 3),
+        }
+
+
+def fts_query(query: str) -> str:
+    """Turn a user query into FTS5 syntax.
+
+    Words are quoted so ``FR-001`` or ``ARC-001-REQ`` search as phrases rather
+    than being parsed as operators; ``AND``/``OR``/``NOT``, ``"phrases"``,
+    ``prefix*`` and ``heading:word`` keep their FTS5 meaning.
+    """
+    parts = []
+    for token in QUERY_TOKEN_RE.findall(query):
+        if token in QUERY_OPERATORS or token.startswith('"'):
+            parts.append(token)
+            continue
+        column, sep, word = token.partition(":")
+        if not (sep and column in ("heading", "body") and word):
+            column, word = "", token
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            parts.append(f'{column + ":" if column else ""}"{word}"{"*" if prefix else ""}')
+    return " ".join(parts)
+
+
+@traced("index.search")
+def search(conn: sqlite3.Connection, query: str = None, project: str = None, artifact: str = None,
+           requirement: str = None, document: str = None, limit: int = 10) -> list:
+    """Best matching sections for ``query``, ranked by BM25 with headings weighted up.
+
+    Without a query, every section passing the filters is returned in
+    document order. Raises ``sqlite3.OperationalError`` for a query FTS5
+    cannot parse.
+    """
+    columns = "s.path, s.project, s.artifact, s.document_id, s.heading, s.line"
+    if query and query.strip():
+        sql = [
+            f"SELECT {columns}, snippet(sections_fts, 1, '{MATCH_START}', '{MATCH_END}', '…', 16) AS snippet, "
+            f"bm25(sections_fts, 5.0, 1.0) AS rank "
+            f"FROM sections_fts JOIN sections s ON s.id = sections_fts.rowid WHERE sections_fts MATCH ?"
+        ]
+        params = [fts_query(query)]
+        order = "rank"
+    else:
+        sql = [f"SELECT {columns}, substr(sections_fts.body, 1, 160) AS snippet, 0.0 AS rank "
+               f"FROM sections s JOIN sections_fts ON sections_fts.rowid = s.id WHERE 1"]
+        params = []
+        order = "s.path, s.line"
+    if project:
+        sql.append("AND s.project = ?")
+        params.append(project)
+    if artifact:
+        sql.append("AND s.artifact = ?")
+        params.append(artifact)
+    if requirement:
+        sql.append("AND s.id IN (SELECT section FROM section_requirements WHERE requirement_id = ?)")
+        params.append(requirement)
+    if document:
+        # Range rather than substr() so a version-less ID can use the index
+        sql.append("AND (s.document_id = ? OR (s.document_id >= ? AND s.document_id < ?))")
+        params += [document, document + "-v", document + "-w"]
+    sql.append(f"ORDER BY {order} LIMIT ?")
+    params.append(limit)
+    return [SearchHit(**dict(row)) for row in conn.execute(" ".join(sql), params)]
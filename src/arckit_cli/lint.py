@@ -0,0 +1,533 @@
+"""Deterministic governance checks over project artifacts.
+
+Each rule is a small class registered in :data:`RULES`. :func:`lint_project`
+walks every markdown file of a project once, handing each line (with the
+current heading and fence state, from :mod:`~arckit_cli.mdcache`) to every
+enabled rule, then lets rules
+that compare files report at the end of the project. Projects are checked
+in parallel by :func:`lint_projects`, and findings can be written as JSON or
+SARIF so ``/arckit.analyze`` can start from a compact list of mechanical
+problems instead of re-reading every artifact.
+
+Third-party rules are registered with :func:`register`, or from packages
+exposing :class:`Rule` subclasses under the ``arckit.lint_rules`` entry point
+group.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .index import DOCUMENT_ID_RE
+from .profiling import traced
+from .publish import is_bundle
+from .trace import REQUIREMENT_ID_RE, REQUIREMENTS_FILE
+
+ERROR = "error"
+WARNING = "warning"
+NOTE = "note"
+LEVELS = (ERROR, WARNING, NOTE)
+
+ENTRY_POINT_GROUP = "arckit.lint_rules"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+PLACEHOLDER_RE = re.compile(r"\[([A-Z][A-Z0-9_]*(?:\s*[ /_-]\s*[A-Z0-9_]+)*)\](?!\()")
+TYPE_CODE_RE = re.compile(r"ARC-\[PROJECT_ID\]-([A-Z0-9]+(?:-[A-Z0-9]+)*)-v\[VERSION\]")
+VERSION_ROW_RE = re.compile(r"^\|\s*\*\*Version\*\*\s*\|\s*([^|]+?)\s*\|")
+# Document Control sits at the top of every generated document
+DOCUMENT_CONTROL_LINES = 60
+OPTIONAL_SECTION_RE = re.compile(r"optional|if applicable", re.I)
+_BRACKETED_RE = re.compile(r"\[[^\]]*\]|\{[^}]*\}")
+_NUMBERING_RE = re.compile(r"^\s*(?:part\s+[a-z]\s*:|\d+(?:\.\d+)*\.?)\s*")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Artifact (dependency graph node) -> template it is generated from
+TEMPLATES = {
+    "stakeholders": "stakeholder-drivers-template.md",
+    "risk": "risk-register-template.md",
+    "sobc": "sobc-template.md",
+    "requirements": "requirements-template.md",
+    "data-model": "data-model-template.md",
+    "research": "research-findings-template.md",
+    "wardley": "wardley-map-template.md",
+    "sow": "sow-template.md",
+    "hld-review": "hld-review-template.md",
+    "dld-review": "dld-review-template.md",
+    "backlog": "backlog-template.md",
+    "diagram": "architecture-diagram-template.md",
+    "servicenow": "servicenow-design-template.md",
+    "traceability": "traceability-matrix-template.md",
+    "tcop": "uk-gov-tcop-template.md",
+    "ai-playbook": "uk-gov-ai-playbook-template.md",
+    "atrs": "uk-gov-atrs-template.md",
+    "secure": "ukgov-secure-by-design-template.md",
+    "mod-secure": "mod-secure-by-design-template.md",
+    "jsp-936": "jsp-936-template.md",
+    "service-assessment": "service-assessment-prep-template.md",
+}
+# Artifacts whose command writes several files from different templates
+FILE_TEMPLATES = {"evaluation-criteria.md": "evaluation-criteria-template.md"}
+
+
+@dataclass(frozen=True)
+class Finding:
+    """One problem found by a rule."""
+
+    rule: str
+    level: str
+    path: str
+    line: int
+    message: str
+
+    def to_json(self) -> dict:
+        return {"rule": self.rule, "level": self.level, "path": self.path, "line": self.line,
+                "message": self.message}
+
+
+@dataclass
+class TemplateInfo:
+    """What the rules need from a template: its sections and document type code."""
+
+    name: str
+    sections: list
+    type_code: str = None
+
+
+@dataclass
+class FileContext:
+    """The file being streamed, and the state rules see for each line."""
+
+    project: "ProjectContext"
+    path: Path
+    relative: str
+    artifact: str = None
+    template: TemplateInfo = None
+    heading: str = ""
+    heading_line: bool = False
+    in_fence: bool = False
+    headings: list = field(default_factory=list)
+    # From the Document Control table, once streamed past it
+    document_id: str = None
+    document_id_line: int = 0
+
+    @property
+    def display_path(self) -> str:
+        return f"projects/{self.project.name}/{self.relative}"
+
+    def report(self, rule: "Rule", line: int, message: str):
+        self.project.findings.append(Finding(rule.id, rule.level, self.display_path, line, message))
+
+
+@dataclass
+class ProjectContext:
+    name: str
+    path: Path
+    repo_root: Path
+    number: str = ""
+    files: int = 0
+    findings: list = field(default_factory=list)
+
+    def report(self, rule: "Rule", path: str, line: int, message: str):
+        self.findings.append(Finding(rule.id, rule.level, f"projects/{self.name}/{path}", line, message))
+
+
+class Rule:
+    """Base class for lint rules.
+
+    A fresh instance is created for every project, so a rule can keep state
+    across that project's files. Override any of the hooks; ``line`` is
+    called for every line of every markdown file in a single pass.
+    """
+
+    id = ""
+    name = ""
+    level = WARNING
+    description = ""
+
+    def start_file(self, file: FileContext):
+        pass
+
+    def line(self, file: FileContext, number: int, text: str):
+        pass
+
+    def end_file(self, file: FileContext):
+        pass
+
+    def end_project(self, project: ProjectContext):
+        pass
+
+
+RULES = {}
+
+
+def register(rule_class):
+    """Class decorator adding a rule to :data:`RULES`."""
+    if not rule_class.id or rule_class.level not in LEVELS:
+        raise ValueError(f"lint rule {rule_class.__name__} needs an id and a level in {LEVELS}")
+    RULES[rule_class.id] = rule_class
+    return rule_class
+
+
+_plugins_loaded = False
+
+
+def load_plugins():
+    """Register rules published by installed packages under ``arckit.lint_rules``."""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        rule_class = entry_point.load()
+        if rule_class.id not in RULES:
+            register(rule_class)
+
+
+def select_rules(keys=(), disabled=()) -> list:
+    """Rule ids for ``--rule``/``--disable`` keys given as ids or names."""
+    load_plugins()
+    by_key = {}
+    for rule_class in RULES.values():
+        by_key[rule_class.id.lower()] = by_key[rule_class.name.lower()] = rule_class.id
+    unknown = [key for key in (*keys, *disabled) if key.lower() not in by_key]
+    if unknown:
+        raise ValueError(f"unknown lint rule(s): {', '.join(unknown)} (known: {', '.join(sorted(RULES))})")
+    selected = [by_key[key.lower()] for key in keys] or sorted(RULES)
+    skipped = {by_key[key.lower()] for key in disabled}
+    return [rule_id for rule_id in selected if rule_id not in skipped]
+
+
+# --- templates -----------------------------------------------------------------
+
+def normalise_heading(title: str) -> str:
+    """Compare headings ignoring numbering, placeholders, emoji and case."""
+    title = _NUMBERING_RE.sub("", _BRACKETED_RE.sub("", title).lower())
+    return " ".join(_WORD_RE.findall(title))
+
+
+_templates = {}
+
+
+def template_info(name: str, repo_root: Path):
+    """Top-level sections and document type code of a template (cached per process)."""
+    key = (name, str(repo_root))
+    if key not in _templates:
+        from .template import TemplateError, load_template
+
+        try:
+            template = load_template(name, repo_root)
+        except (TemplateError, OSError):
+            _templates[key] = None
+            return None
+        sections = [section.title for section in template.root.children
+                    if not OPTIONAL_SECTION_RE.search(section.title) and normalise_heading(section.title)]
+        match = TYPE_CODE_RE.search("".join(template.lines[:DOCUMENT_CONTROL_LINES]))
+        _templates[key] = TemplateInfo(name, sections, match.group(1) if match else None)
+    return _templates[key]
+
+
+def template_for(relative: str, artifact: str):
+    return FILE_TEMPLATES.get(relative.rsplit("/", 1)[-1]) or TEMPLATES.get(artifact)
+
+
+# --- built-in rules ------------------------------------------------------------
+
+@register
+class MissingSection(Rule):
+    id = "ARC001"
+    name = "missing-section"
+    level = WARNING
+    description = "A top-level section of the artifact's template is missing from the document."
+
+    def end_file(self, file):
+        if not file.template:
+            return
+        present = {normalise_heading(title) for title in file.headings}
+        missing = [title for title in file.template.sections if normalise_heading(title) not in present]
+        if missing:
+            file.report(self, 1, f"Missing {len(missing)} section(s) from {file.template.name}: "
+                                 + "; ".join(missing))
+
+
+@register
+class UnresolvedPlaceholder(Rule):
+    id = "ARC002"
+    name = "unresolved-placeholder"
+    level = WARNING
+    description = "Template placeholder text such as [PROJECT_NAME] was never filled in."
+
+    def line(self, file, number, text):
+        if file.in_fence or "[" not in text:
+            return
+        placeholders = PLACEHOLDER_RE.findall(text)
+        if placeholders:
+            names = ", ".join(dict.fromkeys(f"[{p}]" for p in placeholders))
+            file.report(self, number, f"Unresolved placeholder {names}")
+
+
+@register
+class DuplicateId(Rule):
+    id = "ARC003"
+    name = "duplicate-id"
+    level = ERROR
+    description = "A requirement ID is defined twice, or two files carry the same document ID."
+
+    def __init__(self):
+        self.definitions = {}
+        self.document_ids = {}
+
+    def line(self, file, number, text):
+        if file.heading_line and file.relative == REQUIREMENTS_FILE:
+            for requirement_id in REQUIREMENT_ID_RE.findall(text):
+                first = self.definitions.setdefault(requirement_id, number)
+                if first != number:
+                    file.report(self, number, f"{requirement_id} is already defined at line {first}")
+
+    def end_file(self, file):
+        if file.document_id:
+            self.document_ids.setdefault(file.document_id, []).append(file)
+
+    def end_project(self, project):
+        for document_id, files in self.document_ids.items():
+            for file in files[1:]:
+                file.report(self, file.document_id_line,
+                            f"Document ID {document_id} is also used by {files[0].relative}")
+
+
+@register
+class DanglingRequirement(Rule):
+    id = "ARC004"
+    name = "dangling-requirement"
+    level = WARNING
+    description = "A requirement ID is referenced but never appears in requirements.md."
+
+    def __init__(self):
+        self.defined = set()
+        self.references = {}
+        self.has_requirements = False
+
+    def start_file(self, file):
+        if file.relative == REQUIREMENTS_FILE:
+            self.has_requirements = True
+
+    def line(self, file, number, text):
+        if "-" not in text:
+            return
+        for requirement_id in REQUIREMENT_ID_RE.findall(text):
+            if file.relative == REQUIREMENTS_FILE:
+                self.defined.add(requirement_id)
+            else:
+                self.references.setdefault((requirement_id, file.relative), number)
+
+    def end_project(self, project):
+        if not self.has_requirements:
+            return
+        for (requirement_id, path), number in sorted(self.references.items()):
+            if requirement_id not in self.defined:
+                project.report(self, path, number, f"{requirement_id} is not defined in {REQUIREMENTS_FILE}")
+
+
+@register
+class DocumentIdMismatch(Rule):
+    id = "ARC005"
+    name = "document-id-mismatch"
+    level = ERROR
+    description = "The document ID disagrees with the project number, document type or Version field."
+
+    def start_file(self, file):
+        self.version = None
+
+    def line(self, file, number, text):
+        if self.version is None and number <= DOCUMENT_CONTROL_LINES and text.startswith("|"):
+            match = VERSION_ROW_RE.match(text)
+            if match:
+                self.version = (match.group(1).strip(), number)
+
+    def end_file(self, file):
+        match = DOCUMENT_ID_RE.fullmatch(file.document_id or "")
+        if match is None:
+            return
+        number, type_code, version = match.groups()
+        if file.project.number and number != file.project.number:
+            file.report(self, file.document_id_line,
+                        f"Document ID {match.group(0)} has project number {number}, "
+                        f"but the project is {file.project.number}")
+        expected = file.template.type_code if file.template else None
+        if expected and type_code != expected:
+            file.report(self, file.document_id_line,
+                        f"Document ID {match.group(0)} has type {type_code}, expected {expected} "
+                        f"for {file.template.name}")
+        if self.version and not self.version[0].startswith("["):
+            declared = self.version[0].lstrip("vV")
+            if declared != version:
+                file.report(self, self.version[1],
+                            f"Version field says {self.version[0]} but the document ID is {match.group(0)}")
+
+
+# --- engine --------------------------------------------------------------------
+
+def project_files(project_dir: Path):
+    """Yield relative paths of the project's markdown files in a stable order."""
+    for directory, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        relative_dir = os.path.relpath(directory, project_dir)
+        prefix = "" if relative_dir == "." else relative_dir.replace(os.sep, "/") + "/"
+        for filename in sorted(filenames):
+            if filename.endswith(".md") and not filename.startswith(".") and not is_bundle(prefix + filename):
+                yield prefix + filename
+
+
+@traced("lint.project")
+def lint_project(project_dir: Path, repo_root: Path, rule_ids=None) -> ProjectContext:
+    """Run the rules over one project, walking each markdown file once."""
+    from .graph import artifact_for
+    from .mdcache import MdCache
+    from .workspace import project_number
+
+    load_plugins()
+    cache = MdCache.for_repo(repo_root)
+    project_dir = Path(project_dir)
+    project = ProjectContext(project_dir.name, project_dir, Path(repo_root), project_number(project_dir.name))
+    rules = [RULES[rule_id]() for rule_id in (rule_ids or sorted(RULES))]
+    line_rules = [rule for rule in rules if type(rule).line is not Rule.line]
+
+    # requirements.md first, so cross-file rules know the definitions early
+    paths = sorted(project_files(project_dir), key=lambda p: p != REQUIREMENTS_FILE)
+    for relative in paths:
+        artifact = artifact_for(relative)
+        template = template_for(relative, artifact)
+        file = FileContext(project, project_dir / relative, relative, artifact,
+                           template_info(template, repo_root) if template else None)
+        project.files += 1
+        for rule in rules:
+            rule.start_file(file)
+        try:
+            document = cache.load(file.path)
+            file.headings = document.headings()
+            for number, text, section, in_fence in document.lines():
+                file.in_fence = in_fence
+                file.heading = section.title
+                file.heading_line = bool(section.level) and number == section.line
+                if file.document_id is None and number <= DOCUMENT_CONTROL_LINES and "Document ID" in text:
+                    match = DOCUMENT_ID_RE.search(text)
+                    if match:
+                        file.document_id, file.document_id_line = match.group(0), number
+                for rule in line_rules:
+                    rule.line(file, number, text)
+        except OSError as e:
+            project.findings.append(Finding("ARC000", ERROR, file.display_path, 0, f"Cannot read file: {e}"))
+            continue
+        for rule in rules:
+            rule.end_file(file)
+    cache.save()
+    for rule in rules:
+        rule.end_project(project)
+    project.findings.sort(key=lambda f: (f.path, f.line, f.rule))
+    return project
+
+
+def _lint_worker(args) -> tuple:
+    project_dir, repo_root, rule_ids = args
+    project = lint_project(project_dir, repo_root, rule_ids)
+    return project.name, project.files, project.findings
+
+
+@dataclass
+class LintReport:
+    projects: list = field(default_factory=list)
+    files: int = 0
+    findings: list = field(default_factory=list)
+    rules: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def counts(self) -> dict:
+        counts = {level: 0 for level in LEVELS}
+        for finding in self.findings:
+            counts[finding.level] += 1
+        return counts
+
+
+@traced("lint.projects")
+def lint_projects(project_dirs, repo_root: Path, rule_ids=None, jobs: int = None) -> LintReport:
+    """Lint several projects, in a process pool when there are enough of them."""
+    import time
+
+    start = time.perf_counter()
+    rule_ids = list(rule_ids or select_rules())
+    tasks = [(str(project_dir), str(repo_root), rule_ids) for project_dir in project_dirs]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks) or 1))
+    if jobs > 1 and len(tasks) > 2:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_lint_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    else:
+        results = [_lint_worker(task) for task in tasks]
+
+    report = LintReport(rules=rule_ids)
+    for name, files, findings in results:
+        report.projects.append(name)
+        report.files += files
+        report.findings.extend(findings)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def to_json(report: LintReport) -> dict:
+    return {
+        "tool": "arckit lint",
+        "rules": [{"id": rule_id, "name": RULES[rule_id].name, "level": RULES[rule_id].level}
+                  for rule_id in report.rules],
+        "summary": {"projects": len(report.projects), "files": report.files, **report.counts()},
+        "findings": [finding.to_json() for finding in report.findings],
+    }
+
+
+def to_text(report: LintReport) -> str:
+    """The findings grouped by file, as ``arckit lint`` prints them, without colour."""
+    lines = []
+    current = None
+    for finding in report.findings:
+        if finding.path != current:
+            current = finding.path
+            lines += ["", finding.path]
+        lines.append(f"  {finding.line:>5}  {finding.level:<7} {finding.rule}  {finding.message}")
+    counts = report.counts()
+    lines += ["", f"{len(report.projects)} projects, {report.files} files: "
+                  f"{counts['error']} errors, {counts['warning']} warnings"]
+    return "\n".join(lines).lstrip("\n") + "\n"
+
+
+def to_sarif(report: LintReport, version: str = None) -> dict:
+    """SARIF 2.1.0 log, with paths relative to the workspace root."""
+    index = {rule_id: number for number, rule_id in enumerate(report.rules)}
+    driver = {
+        "name": "arckit lint",
+        "informationUri": "https://github.com/tractorjuice/arc-kit",
+        "rules": [
+            {"id": rule_id, "name": RULES[rule_id].name,
+             "shortDescription": {"text": RULES[rule_id].description},
+             "defaultConfiguration": {"level": RULES[rule_id].level}}
+            for rule_id in report.rules
+        ],
+    }
+    if version:
+        driver["version"] = version
+    results = []
+    for finding in report.findings:
+        result = {
+            "ruleId": finding.rule,
+            "level": finding.level,
+            "message": {"text": finding.message},
+            "locations": [{"physicalLocation": {
+                "artifactLocation": {"uri": finding.path, "uriBaseId": "%SRCROOT%"},
+                "region": {"startLine": max(finding.line, 1)},
+            }}],
+        }
+        if finding.rule in index:
+            result["ruleIndex"] = index[finding.rule]
+        results.append(result)
+    return {"$schema": SARIF_SCHEMA, "version": "2.1.0", "runs": [{"tool": {"driver": driver}, "results": results}]}
@@ -0,0 +1,481 @@
+"""Offline store of Digital Marketplace (G-Cloud/DOS) catalogue exports.
+
+:func:`sync` downloads each configured catalogue export through the shared
+HTTP client and keeps it gzip-compressed in a per-user store, so every
+workspace on the machine shares one copy. Downloads are revalidated with
+``If-None-Match``/``If-Modified-Since`` (an unchanged catalogue costs one
+304 response), and an interrupted transfer resumes from its ``.part`` file
+with a ``Range`` request guarded by ``If-Range``.
+
+Exports may be CSV, JSON (a list, or an object with a ``services`` list) or
+JSON lines, optionally gzipped. Their rows are normalised into a SQLite
+catalogue with an FTS5 index over name, supplier, description and
+capabilities, and plain indexes on lot and price, which :func:`search`
+queries without touching the network.
+"""
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+STORE_ENV = "ARCKIT_MARKETPLACE_DIR"
+SOURCES_FILE = "sources.json"
+CATALOGUE_FILE = "catalogue.sqlite"
+EXPORTS_DIR = "exports"
+CHUNK_SIZE = 1 << 16
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS services (
+    rowid INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    id TEXT NOT NULL,
+    framework TEXT,
+    lot TEXT,
+    supplier TEXT,
+    name TEXT,
+    description TEXT,
+    capabilities TEXT,
+    price_min REAL,
+    price_max REAL,
+    price_unit TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS services_source ON services (source);
+CREATE INDEX IF NOT EXISTS services_lot ON services (lot COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS services_price ON services (price_min);
+CREATE VIRTUAL TABLE IF NOT EXISTS services_fts USING fts5 (
+    name, supplier, description, capabilities, tokenize = 'porter unicode61'
+);
+"""
+
+# Normalised column name -> spellings seen in Digital Marketplace exports and API records
+FIELDS = {
+    "id": ("id", "serviceid"),
+    "name": ("servicename", "name", "title"),
+    "supplier": ("suppliername", "supplier"),
+    "lot": ("lotname", "lot", "lotslug"),
+    "framework": ("frameworkname", "framework", "frameworkslug"),
+    "description": ("servicedescription", "description", "summary"),
+    "capabilities": ("servicefeatures", "features", "servicebenefits", "benefits", "capabilities",
+                     "servicecategories", "categories"),
+    "price_min": ("pricemin", "minprice", "minimumprice"),
+    "price_max": ("pricemax", "maxprice", "maximumprice"),
+    "price_unit": ("priceunit", "unit"),
+    "price": ("price", "pricing", "pricestring"),
+    "url": ("serviceurl", "url", "link"),
+}
+PRICE_RE = re.compile(r"£?\s*(\d[\d,]*(?:\.\d+)?)")
+LIST_SEPARATOR = "; "
+
+
+class MarketplaceError(RuntimeError):
+    """Raised when a catalogue cannot be downloaded or read."""
+
+
+def store_dir(path: Path = None) -> Path:
+    """The catalogue store: ``path``, ``$ARCKIT_MARKETPLACE_DIR`` or the user cache."""
+    if path:
+        return Path(path)
+    if os.environ.get(STORE_ENV):
+        return Path(os.environ[STORE_ENV])
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("arckit")) / "marketplace"
+
+
+def source_key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def load_sources(store: Path) -> dict:
+    try:
+        return json.loads((store / SOURCES_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sources(store: Path, sources: dict):
+    store.mkdir(parents=True, exist_ok=True)
+    tmp = store / f"{SOURCES_FILE}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(sources, indent=2, sort_keys=True))
+    os.replace(tmp, store / SOURCES_FILE)
+
+
+# --- download ------------------------------------------------------------------
+
+@dataclass
+class SyncResult:
+    url: str
+    status: str  # "downloaded", "resumed", "not-modified" or "error"
+    bytes_received: int = 0
+    services: int = 0
+    error: str = None
+    elapsed: float = 0.0
+
+
+def _compress(part: Path, export: Path):
+    """Move a finished download into the store gzip-compressed."""
+    with open(part, "rb") as f:
+        already_gzipped = f.read(2) == b"\x1f\x8b"
+    tmp = export.with_name(f"{export.name}.{os.getpid()}.tmp")
+    if already_gzipped:
+        os.replace(part, tmp)
+    else:
+        with open(part, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+            for block in iter(lambda: src.read(1 << 20), b""):
+                dst.write(block)
+        part.unlink()
+    os.replace(tmp, export)
+
+
+def download(client, url: str, store: Path, record: dict, force: bool = False) -> tuple:
+    """Fetch ``url`` into a staged export beside the current one.
+
+    Returns ``(status, bytes received, staged)`` where status is
+    ``"not-modified"``, ``"downloaded"`` or ``"resumed"``. ``staged`` is
+    None for not-modified; otherwise it holds the new export's path and
+    validators, which ``commit_download`` moves into place and into
+    ``record`` once the export has loaded. Until then the previous export
+    and validators stay current, so a bad export is fetched again.
+    """
+    key = source_key(url)
+    export = store / EXPORTS_DIR / f"{key}.gz"
+    part = store / EXPORTS_DIR / f"{key}.part"
+    export.parent.mkdir(parents=True, exist_ok=True)
+
+    headers = {"Accept-Encoding": "identity"}
+    offset = part.stat().st_size if part.exists() else 0
+    partial = record.get("partial") or {}
+    # If-Range only accepts a strong ETag
+    etag = partial.get("etag")
+    validator = etag if etag and not etag.startswith("W/") else partial.get("last_modified")
+    if offset and validator and not force:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    else:
+        offset = 0
+        if export.exists() and not force:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+
+    with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return "not-modified", 0, None
+        if response.status_code == 416:
+            # Our partial copy no longer fits the remote file; start again
+            part.unlink(missing_ok=True)
+            record.pop("partial", None)
+            return download(client, url, store, record, force=True)
+        response.raise_for_status()
+        resumed = response.status_code == 206
+        validators = {"etag": response.headers.get("etag"),
+                      "last_modified": response.headers.get("last-modified")}
+        record["partial"] = validators
+        received = 0
+        with open(part, "ab" if resumed else "wb") as f:
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                f.write(chunk)
+                received += len(chunk)
+
+    staged = export.with_name(f"{key}.new.gz")
+    _compress(part, staged)
+    record.pop("partial", None)
+    return "resumed" if resumed else "downloaded", received, {
+        **validators, "path": staged, "export": str(export.relative_to(store)),
+        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "bytes": offset + received if resumed else received,
+    }
+
+
+def commit_download(store: Path, record: dict, staged: dict):
+    """Make a loaded staged export the current one and record its validators."""
+    staged = dict(staged)
+    os.replace(staged.pop("path"), store / staged["export"])
+    record.update(staged)
+
+
+# --- parsing -------------------------------------------------------------------
+
+def _normalise_key(key: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(key).lower())
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return LIST_SEPARATOR.join(_text(item) for item in value if item not in (None, ""))
+    if isinstance(value, dict):
+        return LIST_SEPARATOR.join(_text(item) for item in value.values())
+    return str(value).strip()
+
+
+def _number(value):
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = PRICE_RE.search(str(value))
+    return float(match.group(1).replace(",", "")) if match else None
+
+
+def normalise_service(row: dict) -> dict:
+    """Map an export row onto the catalogue columns."""
+    keys = {}
+    for key, value in row.items():
+        keys.setdefault(_normalise_key(key), value)
+
+    def pick(name, join=False):
+        values = [keys[alias] for alias in FIELDS[name] if keys.get(alias) not in (None, "", [])]
+        if join:
+            return LIST_SEPARATOR.join(_text(value) for value in values)
+        return values[0] if values else None
+
+    service = {name: _text(pick(name)) for name in ("id", "name", "supplier", "lot", "framework",
+                                                    "description", "price_unit", "url")}
+    service["capabilities"] = pick("capabilities", join=True)
+    service["price_min"] = _number(pick("price_min"))
+    service["price_max"] = _number(pick("price_max"))
+    price = _text(pick("price"))
+    if price:
+        numbers = [float(n.replace(",", "")) for n in PRICE_RE.findall(price)]
+        if service["price_min"] is None and numbers:
+            service["price_min"] = numbers[0]
+        if service["price_max"] is None and len(numbers) > 1:
+            service["price_max"] = numbers[1]
+        if not service["price_unit"] and " per " in price:
+            service["price_unit"] = price.split(" per ", 1)[1].strip()
+    return service
+
+
+def _rows(data):
+    if isinstance(data, dict):
+        data = next((data[key] for key in ("services", "results", "data") if isinstance(data.get(key), list)), [data])
+    return (row for row in data if isinstance(row, dict))
+
+
+def read_export(path: Path):
+    """Yield raw rows from a stored (gzipped) CSV, JSON or JSON-lines export."""
+    with gzip.open(path, "rb") as f:
+        first = f.read(1 << 12).lstrip()[:1]
+        f.seek(0)
+        if first == b"[":
+            yield from _rows(json.load(f))
+        elif first == b"{":
+            try:
+                # JSON lines, or a whole document on one line
+                for line in f:
+                    if line.strip():
+                        yield from _rows(json.loads(line))
+            except ValueError:
+                f.seek(0)
+                yield from _rows(json.load(f))
+        else:
+            text = io.TextIOWrapper(f, encoding="utf-8-sig", errors="replace", newline="")
+            yield from csv.DictReader(text)
+
+
+# --- catalogue -----------------------------------------------------------------
+
+def connect(store: Path) -> sqlite3.Connection:
+    store.mkdir(parents=True, exist_ok=True)
+    path = store / CATALOGUE_FILE
+    conn = sqlite3.connect(path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+    elif row["value"] != str(SCHEMA_VERSION):
+        conn.close()
+        path.unlink()
+        return connect(store)
+    return conn
+
+
+def load_catalogue(conn: sqlite3.Connection, url: str, export: Path, framework: str = None) -> int:
+    """Replace the services of one source with the rows of its export.
+
+    Runs in one transaction: if the export cannot be read, the source
+    keeps the services it had.
+    """
+    count = 0
+    with conn:
+        old = [(row[0],) for row in conn.execute("SELECT rowid FROM services WHERE source = ?", (url,))]
+        conn.executemany("DELETE FROM services_fts WHERE rowid = ?", old)
+        conn.execute("DELETE FROM services WHERE source = ?", (url,))
+        for row in read_export(export):
+            service = normalise_service(row)
+            if not (service["id"] or service["name"]):
+                continue
+            cursor = conn.execute(
+                "INSERT INTO services (source, id, framework, lot, supplier, name, description, capabilities, "
+                "price_min, price_max, price_unit, url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, service["id"] or service["name"], service["framework"] or framework, service["lot"],
+                 service["supplier"], service["name"], service["description"], service["capabilities"],
+                 service["price_min"], service["price_max"], service["price_unit"], service["url"]),
+            )
+            conn.execute("INSERT INTO services_fts (rowid, name, supplier, description, capabilities) "
+                         "VALUES (?, ?, ?, ?, ?)",
+                         (cursor.lastrowid, service["name"], service["supplier"], service["description"],
+                          service["capabilities"]))
+            count += 1
+    return count
+
+
+def sync(urls=(), store: Path = None, framework: str = None, force: bool = False, client=None,
+         on_result=None) -> list:
+    """Revalidate every known source plus ``urls`` and reload the changed ones.
+
+    New URLs are remembered, so a later ``sync()`` without arguments
+    refreshes everything synced before.
+    """
+    from .net import get_client
+
+    store = store_dir(store)
+    sources = load_sources(store)
+    for url in urls:
+        record = sources.setdefault(url, {})
+        if framework:
+            record["framework"] = framework
+    if not sources:
+        raise MarketplaceError("no catalogue sources; pass the URL of a catalogue export")
+
+    client = client or get_client()
+    conn = connect(store)
+    results = []
+    try:
+        for url, record in sources.items():
+            start = time.perf_counter()
+            result = SyncResult(url, "error")
+            try:
+                result.status, result.bytes_received, staged = download(client, url, store, record, force=force)
+                if staged:
+                    try:
+                        services = load_catalogue(conn, url, staged["path"], record.get("framework"))
+                    except BaseException:
+                        staged["path"].unlink(missing_ok=True)
+                        raise
+                    commit_download(store, record, staged)
+                    record["services"] = services
+                elif force or not conn.execute("SELECT 1 FROM services WHERE source = ? LIMIT 1", (url,)).fetchone():
+                    # Unchanged remotely, but the catalogue lost this source (e.g. a schema rebuild)
+                    record["services"] = load_catalogue(conn, url, store / record["export"], record.get("framework"))
+                result.services = record.get("services", 0)
+            except Exception as e:  # noqa: BLE001 - reported per source, others still sync
+                result.error = f"{type(e).__name__}: {e}"
+            finally:
+                # Keep the validators of a partial download so the next run resumes it
+                save_sources(store, sources)
+            result.elapsed = time.perf_counter() - start
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        conn.close()
+    return results
+
+
+@dataclass
+class Service:
+    id: str
+    framework: str
+    lot: str
+    supplier: str
+    name: str
+    description: str
+    capabilities: str
+    price_min: float
+    price_max: float
+    price_unit: str
+    url: str
+    snippet: str = ""
+    capability_list: list = field(default_factory=list)
+
+    def to_json(self) -> dict:
+        return {
+            "id": self.id, "name": self.name, "supplier": self.supplier, "framework": self.framework,
+            "lot": self.lot, "price_min": self.price_min, "price_max": self.price_max,
+            "price_unit": self.price_unit, "url": self.url, "capabilities": self.capability_list,
+            "snippet": self.snippet,
+        }
+
+
+def _phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search(store: Path = None, query: str = None, lot: str = None, capabilities=(), framework: str = None,
+           max_price: float = None, min_price: float = None, limit: int = 20) -> list:
+    """Query the local catalogue; text matches rank by BM25, otherwise by price.
+
+    Raises ``sqlite3.OperationalError`` for a query FTS5 cannot parse.
+    """
+    from .index import fts_query
+
+    store = store_dir(store)
+    if not (store / CATALOGUE_FILE).exists():
+        raise MarketplaceError(f"no local catalogue in {store}; run 'arckit marketplace sync' first")
+    match = []
+    if query and query.strip():
+        match.append(f"({fts_query(query)})")
+    match += [f"capabilities : {_phrase(capability)}" for capability in capabilities]
+
+    columns = ("s.id, s.framework, s.lot, s.supplier, s.name, s.description, s.capabilities, "
+               "s.price_min, s.price_max, s.price_unit, s.url")
+    if match:
+        sql = [f"SELECT {columns}, snippet(services_fts, 2, '', '', '…', 20) AS snippet, "
+               f"bm25(services_fts, 4.0, 2.0, 1.0, 2.0) AS rank FROM services_fts "
+               f"JOIN services s ON s.rowid = services_fts.rowid WHERE services_fts MATCH ?"]
+        params = [" AND ".join(match)]
+        order = "rank"
+    else:
+        sql = [f"SELECT {columns}, substr(s.description, 1, 160) AS snippet FROM services s WHERE 1"]
+        params = []
+        order = "s.price_min IS NULL, s.price_min, s.name"
+    if lot:
+        sql.append("AND (s.lot = ? COLLATE NOCASE OR s.lot LIKE ?)")
+        params += [lot, f"%{lot}%"]
+    if framework:
+        sql.append("AND s.framework LIKE ?")
+        params.append(f"%{framework}%")
+    if max_price is not None:
+        sql.append("AND s.price_min <= ?")
+        params.append(max_price)
+    if min_price is not None:
+        sql.append("AND COALESCE(s.price_max, s.price_min) >= ?")
+        params.append(min_price)
+    sql.append(f"ORDER BY {order} LIMIT ?")
+    params.append(limit)
+
+    conn = sqlite3.connect(store / CATALOGUE_FILE)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(" ".join(sql), params).fetchall()
+    finally:
+        conn.close()
+    services = []
+    for row in rows:
+        data = {key: row[key] for key in row.keys() if key != "rank"}
+        service = Service(**data)
+        service.capability_list = [c for c in (service.capabilities or "").split(LIST_SEPARATOR) if c]
+        service.snippet = " ".join((service.snippet or "").split())
+        services.append(service)
+    return services
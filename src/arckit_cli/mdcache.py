@@ -0,0 +1,380 @@
+"""Parse-once cache of markdown structure: headings, sections and tables.
+
+Completion checks, traceability, linting, search and publishing all walk
+the same multi-thousand-line artifacts, and all need to know which
+heading each line sits under. :class:`MdCache` parses a file once into a
+compact structure and keeps it in two tiers:
+
+- on disk, as ``marshal`` records under ``.arckit/cache/markdown/``, one
+  file per source directory, keyed by each file's name, size and
+  ``mtime_ns``; when only the mtime changed (a checkout, a copy) the
+  content hash is compared before parsing again. Readers call
+  :meth:`MdCache.save` once they are done, so a project's records are
+  read and written as one file;
+- in memory, in an LRU bounded by the total size of the cached sources.
+
+Only headings, byte offsets and tables are stored. Section text is read
+lazily through a memory map of the source when it is asked for, so
+looking up one section of a large file does not decode the rest;
+:meth:`Document.lines` walks every line with its section for readers
+that scan the whole file.
+
+This is ArcKit's one markdown heading and code fence parser: headings
+are ATX headings indented at most three spaces, and a fence closes only
+on a line of the same character at least as long as the one that opened
+it, as in CommonMark.
+"""
+
+import bisect
+import functools
+import hashlib
+import io
+import itertools
+import marshal
+import mmap
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import traced
+
+CACHE_DIR = ".arckit/cache/markdown"
+CACHE_VERSION = 3
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+HEADING_RE = re.compile(rb"^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*\r?$")
+FENCE_RE = re.compile(rb"^ {0,3}(`{3,}|~{3,})")
+# A line break followed by a line that may be a heading, a fence or a table separator row
+BLOCK_START_RE = re.compile(rb"[\r\n](?: {0,3}(?:#|```|~~~)|[ \t\f\v|:]*-[ \t\f\v|:-]*(?=[\r\n]|\Z))")
+TABLE_SEPARATOR_RE = re.compile(rb"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+CELL_SPLIT_RE = re.compile(r"(?<!\\)\|")
+HEADING_PATH_SEPARATOR = " › "
+
+
+@dataclass(slots=True)
+class Table:
+    """A pipe table: header cells and row cells, with its first line number."""
+
+    line: int
+    header: tuple
+    rows: tuple
+
+    def records(self) -> list:
+        """Rows as ``{header: cell}`` dicts."""
+        return [dict(zip(self.header, row)) for row in self.rows]
+
+
+@dataclass(slots=True)
+class Section:
+    """A heading and the lines up to the next heading of any level.
+
+    ``line`` is the heading's line (1 for text before the first heading,
+    whose level is 0); ``start``/``end`` are byte offsets of the body.
+    """
+
+    level: int
+    title: str
+    path: str
+    line: int
+    end_line: int
+    start: int
+    end: int
+    tables: tuple = ()
+
+
+@dataclass
+class Document:
+    """The cached structure of one markdown file.
+
+    ``records`` are the raw tuples from :func:`parse`; :attr:`sections` are
+    built from them on first use, so loading a cached file costs one
+    ``marshal.loads``.
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    digest: str
+    records: list = field(default_factory=list, repr=False)
+    _map: mmap.mmap = field(default=None, repr=False)
+
+    @functools.cached_property
+    def sections(self) -> list:
+        return build_sections(self.records)
+
+    @property
+    def tables(self) -> list:
+        return [table for section in self.sections for table in section.tables]
+
+    def headings(self) -> list:
+        return [section.title for section in self.sections if section.level]
+
+    def find(self, heading: str):
+        """First section whose title or heading path equals ``heading`` (case-insensitive)."""
+        wanted = heading.strip().lower()
+        for section in self.sections:
+            if section.title.lower() == wanted or section.path.lower() == wanted:
+                return section
+        return None
+
+    def text(self, section: Section = None) -> str:
+        """Body of ``section`` (or the whole file), read through the memory map."""
+        if self.size == 0:
+            return ""
+        if self._map is None:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if section is None:
+            return self._map[:].decode("utf-8", errors="replace")
+        return self._map[section.start:section.end].decode("utf-8", errors="replace")
+
+    def lines(self):
+        """Yield ``(number, text, section, in_fence)`` for every line; see :func:`walk`.
+
+        The file is read rather than mapped: a whole-file scan gains nothing
+        from the map, and a cache of many documents should not hold their
+        descriptors open.
+        """
+        if self.size == 0:
+            return iter(())
+        return walk(self.path.read_bytes(), self.sections)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def _cells(line: bytes) -> tuple:
+    text = line.decode("utf-8", errors="replace").strip()
+    if text.startswith("|"):
+        text = text[1:]
+    if text.endswith("|") and not text.endswith("\\|"):
+        text = text[:-1]
+    if "\\|" not in text:
+        return tuple(cell.strip() for cell in text.split("|"))
+    return tuple(cell.strip().replace("\\|", "|") for cell in CELL_SPLIT_RE.split(text))
+
+
+def fence_after(line: bytes, fence: bytes = None):
+    """The code fence open after ``line``, given the one open before it (None: not in a fence)."""
+    match = FENCE_RE.match(line)
+    if not match:
+        return fence
+    marker = match.group(1)
+    if fence is None:
+        # A backtick fence's info string cannot contain backticks; that is inline code
+        return None if marker[:1] == b"`" and b"`" in line[match.end():] else marker
+    if marker[:1] == fence[:1] and len(marker) >= len(fence) and not line[match.end():].strip():
+        return None
+    return fence
+
+
+def build_sections(records) -> list:
+    """:class:`Section` objects from the records of :func:`parse`."""
+    return [
+        Section(level, title, heading_path, line, end_line, start, end,
+                tuple(Table(*table) for table in tables) if tables else ())
+        for level, title, heading_path, line, end_line, start, end, tables in records
+    ]
+
+
+def walk(data: bytes, sections: list):
+    """Yield ``(number, text, section, in_fence)`` for every line of ``data``.
+
+    ``sections`` are those parsed from ``data``; a heading line belongs to
+    its own section, so it is the line where ``number == section.line``
+    and ``section.level`` is set. ``in_fence`` is true inside fenced code,
+    delimiter lines included. Lines keep their line ending.
+    """
+    # newline="" splits at the same \n, \r and \r\n boundaries as bytes.splitlines
+    lines = io.StringIO(data.decode("utf-8", errors="replace"), newline="")
+    stops = [section.line - 1 for section in sections[1:]] + [None]
+    number, fence = 0, None
+    for section, stop in zip(sections, stops):
+        for text in lines if stop is None else itertools.islice(lines, stop - number):
+            number += 1
+            if fence is None and "```" not in text and "~~~" not in text:
+                yield number, text, section, False
+                continue
+            opened, fence = fence, fence_after(text.encode(), fence)
+            yield number, text, section, bool(opened or fence)
+
+
+def parse(data: bytes) -> list:
+    """Parse markdown bytes into section records (plain tuples, ready for ``marshal``).
+
+    Each record is ``(level, title, path, line, end_line, start, end, tables)``
+    with tables as ``(line, header, rows)``. Headings and tables inside fenced
+    code blocks are ignored.
+    """
+    lines = data.splitlines(keepends=True)
+    total = len(lines)
+    starts = [0, *itertools.accumulate(map(len, lines))]
+    sections = []
+    trail = []
+    level, title, path, first, start, tables = 0, "", "", 1, 0, []
+    fence = None
+    taken = 0  # lines before this one are already part of a heading, fence or table
+    # Only lines that may open a block are visited; the rest are plain text.
+    # The leading newline lets the first line match, and puts each match's
+    # start at the offset of its line in ``data``.
+    for candidate in BLOCK_START_RE.finditer(b"\n" + data):
+        i = bisect.bisect_right(starts, candidate.start()) - 1
+        if i < taken:
+            continue
+        line = lines[i]
+        if fence or b"```" in line or b"~~~" in line:
+            opened = fence
+            fence = fence_after(line, fence)
+            if opened or fence:
+                taken = i + 1
+                continue
+        match = HEADING_RE.match(line) if b"#" in line[:4] else None
+        if match:
+            if level or starts[i] > start:
+                sections.append((level, title, path, first, i, start, starts[i], tuple(tables)))
+            level = len(match.group(1))
+            title = match.group(2).decode("utf-8", errors="replace")
+            trail = [entry for entry in trail if entry[0] < level] + [(level, title)]
+            path = HEADING_PATH_SEPARATOR.join(t for _, t in trail)
+            first, start, tables, taken = i + 1, starts[i + 1], [], i + 1
+        elif i > taken and b"|" in lines[i - 1] and TABLE_SEPARATOR_RE.match(line):
+            header = _cells(lines[i - 1])
+            number = i
+            i += 1
+            rows = []
+            # A table ends at a blank line, or a line that starts another block
+            while (i < total and b"|" in lines[i] and lines[i].strip()
+                   and not (lines[i].lstrip(b" ")[:1] in b"#`~"
+                            and (HEADING_RE.match(lines[i]) or FENCE_RE.match(lines[i])))):
+                rows.append(_cells(lines[i]))
+                i += 1
+            tables.append((number, header, tuple(rows)))
+            taken = i
+    if level or len(data) > start:
+        sections.append((level, title, path, first, max(total, first), start, len(data), tuple(tables)))
+    return sections
+
+
+def _digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class MdCache:
+    """Two-tier (memory LRU, then disk) cache of parsed markdown files.
+
+    ``cache_dir`` holds the on-disk records, one file per source directory;
+    ``None`` keeps the cache in memory only. Records of newly parsed files
+    are written by :meth:`save`. The in-memory tier holds documents whose
+    sources total at most ``max_bytes``, evicting the least recently used.
+    """
+
+    def __init__(self, cache_dir: Path = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max_bytes
+        self._documents = OrderedDict()
+        self._bytes = 0
+        self._shards = {}
+        self._dirty = set()
+        self.stats = {"memory": 0, "disk": 0, "rehashed": 0, "parsed": 0, "evicted": 0}
+
+    @classmethod
+    def for_repo(cls, repo_root: Path, **options):
+        return cls(Path(repo_root) / CACHE_DIR, **options)
+
+    def _shard_path(self, directory: str) -> Path:
+        key = hashlib.sha1(directory.encode()).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.marshal"
+
+    def _shard(self, directory: str) -> dict:
+        """Records of the files in ``directory`` by name, read from disk on first use."""
+        shard = self._shards.get(directory)
+        if shard is not None:
+            return shard
+        shard = {}
+        if self.cache_dir is not None:
+            try:
+                stored = marshal.loads(self._shard_path(directory).read_bytes())
+            except (OSError, EOFError, ValueError, TypeError):
+                stored = None
+            if (isinstance(stored, tuple) and len(stored) == 3 and stored[0] == CACHE_VERSION
+                    and stored[1] == directory and isinstance(stored[2], dict)):
+                shard = stored[2]
+        self._shards[directory] = shard
+        return shard
+
+    def _remember(self, key: str, document: Document):
+        old = self._documents.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+            old.close()
+        self._documents[key] = document
+        self._bytes += document.size
+        while self._bytes > self.max_bytes and len(self._documents) > 1:
+            _, evicted = self._documents.popitem(last=False)
+            self._bytes -= evicted.size
+            evicted.close()
+            self.stats["evicted"] += 1
+
+    @traced("mdcache.load")
+    def load(self, path, data: bytes = None) -> Document:
+        """Structure of ``path``, parsing it only if it changed since last cached.
+
+        ``data`` is the file's content when the caller has already read it.
+        """
+        key = os.path.abspath(path)
+        path = Path(key)
+        st = path.stat()
+        document = self._documents.get(key)
+        if document is not None and document.size == st.st_size and document.mtime_ns == st.st_mtime_ns:
+            self._documents.move_to_end(key)
+            self.stats["memory"] += 1
+            return document
+
+        directory, name = os.path.split(key)
+        shard = self._shard(directory)
+        record = shard.get(name)
+        if record is not None and record[0] == st.st_size and record[1] == st.st_mtime_ns:
+            document = Document(path, *record)
+            self.stats["disk"] += 1
+            self._remember(key, document)
+            return document
+
+        if data is None:
+            data = path.read_bytes()
+        digest = _digest(data)
+        if record is not None and record[0] == len(data) and record[2] == digest:
+            records = record[3]
+            self.stats["rehashed"] += 1
+        else:
+            records = parse(data)
+            self.stats["parsed"] += 1
+        document = Document(path, len(data), st.st_mtime_ns, digest, records)
+        shard[name] = (document.size, document.mtime_ns, digest, records)
+        self._dirty.add(directory)
+        self._remember(key, document)
+        return document
+
+    def save(self):
+        """Write the records of directories with files parsed or rehashed since the last save."""
+        if self.cache_dir is not None:
+            for directory in self._dirty:
+                target = self._shard_path(directory)
+                try:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                    tmp.write_bytes(marshal.dumps((CACHE_VERSION, directory, self._shards[directory])))
+                    os.replace(tmp, target)
+                except OSError:
+                    pass
+        self._dirty.clear()
+
+    def clear(self):
+        """Drop the in-memory tier (the disk tier is left for the next process)."""
+        for document in self._documents.values():
+            document.close()
+        self._documents.clear()
+        self._bytes = 0
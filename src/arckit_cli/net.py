@@ -0,0 +1,288 @@
+"""Shared HTTP clients, created on first network use.
+
+Importing httpx and building a truststore SSL context is comparatively
+expensive, so nothing here runs until a command actually asks for a client.
+
+:func:`get_client` is the plain synchronous client. :class:`Transport` is
+the shared async layer for fetching remote guidance, documentation and
+catalogue lookups: one lazily created ``httpx.AsyncClient``, a global and a
+per-host concurrency bound, retries with exponential backoff, and the
+private disk cache in :mod:`arckit_cli.httpcache`.
+"""
+
+import asyncio
+import importlib.util
+import random
+import time
+from dataclasses import dataclass, field
+
+_ssl_context = None
+_client = None
+_async_client = None
+_async_loop = None
+
+TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+MAX_CONNECTIONS = 16
+MAX_PER_HOST = 4
+RETRIES = 3
+BACKOFF = 0.5
+BACKOFF_MAX = 10.0
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def get_ssl_context():
+    """Return the shared truststore-backed SSL context."""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+        import truststore
+
+        _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_client():
+    """Return the shared synchronous HTTP client.
+
+    Connections are pooled and kept alive between requests, over HTTP/2
+    when ``h2`` is installed.
+    """
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.Client(
+            verify=get_ssl_context(),
+            http2=http2_available(),
+            timeout=httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT),
+            follow_redirects=True,
+        )
+    return _client
+
+
+def get_async_client():
+    """Return the shared async HTTP client for the running event loop.
+
+    An ``AsyncClient``'s connection pool belongs to the loop it was first
+    used on, so a new client is created when called from a different loop.
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        import httpx
+
+        _async_client = httpx.AsyncClient(
+            verify=get_ssl_context(),
+            http2=http2_available(),
+            timeout=httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            follow_redirects=True,
+        )
+        _async_loop = loop
+    return _async_client
+
+
+async def close_async_client():
+    global _async_client, _async_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+    _async_client = _async_loop = None
+
+
+def backoff_delay(attempt: int, retry_after: str = None, base: float = BACKOFF) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based).
+
+    Exponential with full jitter, unless the server sent ``Retry-After``
+    as seconds or an HTTP date; either way capped at ``BACKOFF_MAX``.
+    """
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+        from .httpcache import _http_date
+
+        when = _http_date(retry_after)
+        if when:
+            return min(max(0.0, when - time.time()), BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, base * 2 ** attempt))
+
+
+@dataclass
+class Metrics:
+    """Counters for one :class:`Transport`; ``latencies`` are in seconds."""
+
+    requests: int = 0
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stale: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    latencies: list = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests answered from the cache, fresh or revalidated."""
+        return (self.hits + self.revalidated) / self.requests if self.requests else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def to_json(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stale": self.stale,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "hit_rate": round(self.hit_rate, 3),
+            "p50_ms": round(self.percentile(0.5) * 1000, 1),
+            "p95_ms": round(self.percentile(0.95) * 1000, 1),
+        }
+
+
+class Transport:
+    """Cached, bounded, retrying ``GET`` over the shared async client.
+
+    Every response carries ``response.extensions["cache"]``: ``hit`` (fresh
+    from disk, no request made), ``revalidated`` (304 from the origin),
+    ``stale`` (origin unreachable, stored copy served) or ``miss``.
+    Pass ``cache=False`` to bypass the disk cache.
+    """
+
+    def __init__(self, cache=None, max_concurrency: int = MAX_CONNECTIONS, per_host: int = MAX_PER_HOST,
+                 retries: int = RETRIES, backoff: float = BACKOFF, client=None):
+        if cache is None:
+            from .httpcache import HttpCache
+
+            cache = HttpCache()
+        self.cache = cache or None
+        self.retries = retries
+        self.backoff = backoff
+        self.per_host = per_host
+        self.metrics = Metrics()
+        self._client = client
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._hosts = {}
+
+    @property
+    def client(self):
+        return self._client or get_async_client()
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return self._hosts[host]
+
+    async def _send(self, url: str, headers: dict):
+        """One GET under the concurrency bounds, retried on transient failures.
+
+        The per-host slot is taken before the global one, so requests queued
+        for a busy host do not hold global slots other hosts could use, and
+        both are released while backing off.
+        """
+        import httpx
+
+        host = httpx.URL(url).host
+        for attempt in range(self.retries + 1):
+            async with self._host_limit(host), self._limit:
+                try:
+                    response = await self.client.get(url, headers=headers)
+                except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError):
+                    if attempt == self.retries:
+                        raise
+                    delay = backoff_delay(attempt, base=self.backoff)
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                        return response
+                    delay = backoff_delay(attempt, response.headers.get("retry-after"), base=self.backoff)
+            self.metrics.retries += 1
+            await asyncio.sleep(delay)
+
+    def _cached_response(self, entry, state: str):
+        import httpx
+
+        response = httpx.Response(entry.status, headers=entry.headers, content=entry.read(),
+                                  request=httpx.Request("GET", entry.url))
+        response.extensions["cache"] = state
+        return response
+
+    async def get(self, url: str, headers: dict = None):
+        """GET ``url``, answering from or revalidating the disk cache where allowed."""
+        import httpx
+
+        headers = dict(headers or {})
+        start = time.perf_counter()
+        self.metrics.requests += 1
+        entry = self.cache.lookup(url, headers) if self.cache else None
+        try:
+            if entry and entry.state(headers) == "fresh":
+                self.metrics.hits += 1
+                return self._cached_response(entry, "hit")
+            try:
+                response = await self._send(url, {**headers, **(entry.validators() if entry else {})})
+            except httpx.HTTPError:
+                if entry and entry.may_serve_stale():
+                    self.metrics.stale += 1
+                    return self._cached_response(entry, "stale")
+                self.metrics.errors += 1
+                raise
+            if entry and response.status_code == 304:
+                self.cache.refresh(entry, response.headers)
+                self.metrics.revalidated += 1
+                return self._cached_response(entry, "revalidated")
+            if response.status_code >= 500 and entry and entry.may_serve_stale():
+                self.metrics.stale += 1
+                return self._cached_response(entry, "stale")
+            self.metrics.misses += 1
+            self.metrics.bytes_received += len(response.content)
+            if self.cache:
+                self.cache.store(url, response.status_code, dict(response.headers), response.content, headers)
+            response.extensions["cache"] = "miss"
+            return response
+        finally:
+            self.metrics.latencies.append(time.perf_counter() - start)
+
+    async def get_many(self, urls, headers: dict = None, return_exceptions: bool = True) -> list:
+        """Fetch ``urls`` concurrently within the limits, in input order."""
+        return await asyncio.gather(*(self.get(url, headers) for url in urls), return_exceptions=return_exceptions)
+
+    def close(self):
+        """Persist the metrics into the cache's counters and release it."""
+        if self.cache:
+            self.cache.add_counters({
+                **{name: getattr(self.metrics, name) for name in ("requests", "hits", "revalidated", "misses",
+                                                                   "stale", "errors")},
+                "latency_ms": sum(self.metrics.latencies) * 1000,
+            })
+            self.cache.close()
+            self.cache = None
+
+
+def fetch_many(urls, headers: dict = None, **options):
+    """Synchronous entry point for commands: ``(responses, metrics)`` for ``urls``.
+
+    Failed URLs yield the exception in place of a response.
+    """
+
+    async def run():
+        transport = Transport(**options)
+        try:
+            return await transport.get_many(urls, headers), transport.metrics
+        finally:
+            transport.close()
+            await close_async_client()
+
+    return asyncio.run(run())
@@ -0,0 +1,195 @@
+"""Location of the templates, scripts and commands bundled with ArcKit.
+
+The data root is found by trying a series of probes (wheel install, uv tool,
+site-packages, platformdirs, source checkout). The winning root is cached on
+disk keyed by package version and interpreter prefix, so later invocations
+validate it with a single stat instead of probing again.
+"""
+
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import traced
+
+PACKAGE_NAME = "arckit-cli"
+CACHE_FILE = "data-paths.json"
+
+
+@dataclass
+class Resolution:
+    """How the data root was found."""
+
+    root: Path
+    probe: str
+    elapsed: float
+    attempts: list = field(default_factory=list)
+
+    @property
+    def paths(self) -> dict:
+        return data_paths_for(self.root)
+
+
+def data_paths_for(root: Path) -> dict:
+    """Return the data path mapping for a data root."""
+    return {
+        "templates": root / ".arckit" / "templates",
+        "scripts": root / "scripts",
+        "claude_commands": root / ".claude" / "commands",
+        "gemini_commands": root / ".gemini" / "commands",
+    }
+
+
+def _package_version() -> str:
+    """Installed version, read from the dist-info directory name.
+
+    Cheaper than ``importlib.metadata.version()``, which imports the email
+    parser and scans every ``sys.path`` entry. Source checkouts and editable
+    installs report ``"source"``.
+    """
+    package_parent = Path(__file__).parent.parent
+    prefix = PACKAGE_NAME.replace("-", "_") + "-"
+    try:
+        with os.scandir(package_parent) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".dist-info"):
+                    return entry.name[len(prefix):-len(".dist-info")]
+    except OSError:
+        pass
+    return "source"
+
+
+def _cache_key() -> str:
+    return f"{_package_version()}:{sys.prefix}"
+
+
+def _cache_path() -> Path:
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("arckit")) / CACHE_FILE
+
+
+def _read_cache(key: str):
+    try:
+        data = json.loads(_cache_path().read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return data.get("root"), data.get("probe")
+
+
+def _write_cache(key: str, root: Path, probe: str):
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"key": key, "root": str(root), "probe": probe}))
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only cache directory only costs us the probe next time
+        pass
+
+
+def _wheel_root():
+    """Shared data of a wheel install, located from the package via importlib.resources.
+
+    Wheels install ``share/arckit`` under the data path of the same install
+    scheme as the package, so there is no need to scan every site directory.
+    """
+    import sysconfig
+    from importlib.resources import files
+
+    package_parent = Path(str(files("arckit_cli"))).parent
+    schemes = [sysconfig.get_default_scheme()]
+    if hasattr(sysconfig, "get_preferred_scheme"):
+        schemes.append(sysconfig.get_preferred_scheme("user"))
+    for scheme in schemes:
+        scheme_paths = sysconfig.get_paths(scheme)
+        if package_parent in (Path(scheme_paths["purelib"]), Path(scheme_paths["platlib"])):
+            yield Path(scheme_paths["data"]) / "share" / "arckit"
+
+
+def _uv_tool_root():
+    # uv installs tools in ~/.local/share/uv/tools/{package-name}/share/{package}/
+    yield Path.home() / ".local" / "share" / "uv" / "tools" / PACKAGE_NAME / "share" / "arckit"
+
+
+def _site_roots():
+    import site
+
+    site_dirs = list(site.getsitepackages()) if hasattr(site, "getsitepackages") else []
+    site_dirs.append(site.getusersitepackages())
+    for site_dir in filter(None, site_dirs):
+        # site-packages/share/arckit, then ../../../share/arckit for system installs
+        yield Path(site_dir) / "share" / "arckit"
+        yield Path(site_dir).parent.parent.parent / "share" / "arckit"
+
+
+def _platformdirs_root():
+    import platformdirs
+
+    yield Path(platformdirs.user_data_dir("arckit"))
+
+
+PROBES = [
+    ("wheel", _wheel_root),
+    ("uv-tool", _uv_tool_root),
+    ("site-packages", _site_roots),
+    ("platformdirs", _platformdirs_root),
+]
+
+
+def source_root() -> Path:
+    """Repository root when running from a source checkout (development mode)."""
+    return Path(__file__).parent.parent.parent
+
+
+@traced("get_data_paths")
+def resolve_data_root(use_cache: bool = True) -> Resolution:
+    """Find the data root, recording which probe won and how long it took.
+
+    ``attempts`` lists ``(probe, path, outcome)`` for every candidate checked,
+    where outcome is ``"found"``, ``"missing"`` or an error message.
+    """
+    start = time.perf_counter()
+    attempts = []
+
+    key = _cache_key()
+    if use_cache:
+        cached = _read_cache(key)
+        if cached and cached[0]:
+            root = Path(cached[0])
+            if root.is_dir():
+                attempts.append(("cache", root, "found"))
+                return Resolution(root, f"cache ({cached[1]})", time.perf_counter() - start, attempts)
+            attempts.append(("cache", root, "missing"))
+
+    seen = set()
+    for probe, candidates in PROBES:
+        try:
+            for root in candidates():
+                if root in seen:
+                    continue
+                seen.add(root)
+                if root.is_dir():
+                    attempts.append((probe, root, "found"))
+                    _write_cache(key, root, probe)
+                    return Resolution(root, probe, time.perf_counter() - start, attempts)
+                attempts.append((probe, root, "missing"))
+        except (OSError, ImportError, KeyError) as e:
+            attempts.append((probe, None, f"error: {e}"))
+
+    # Fallback to source directory (development mode)
+    root = source_root()
+    attempts.append(("source", root, "found" if root.is_dir() else "missing"))
+    _write_cache(key, root, "source")
+    return Resolution(root, "source", time.perf_counter() - start, attempts)
+
+
+def get_data_paths():
+    """Get paths to templates, scripts, and commands from installed package or source."""
+    return resolve_data_root().paths
@@ -0,0 +1,200 @@
+"""Opt-in timing spans, written out as a Chrome trace.
+
+Instrumented code wraps the work it wants measured::
+
+    from .profiling import span
+
+    with span("install", files=len(entries)):
+        ...
+
+Nothing is recorded unless profiling is on (``arckit --profile ...`` or
+``ARCKIT_PROFILE=1``). Otherwise :func:`span` returns a shared no-op
+context manager, so an instrumented call costs a global lookup and a
+function call. ``ARCKIT_PROFILE`` may also name the output file, which
+defaults to ``arckit-trace.json`` in the working directory. When the
+process exits the trace is written in the Chrome trace event format (open
+it in ``chrome://tracing`` or https://ui.perfetto.dev) and the slowest
+spans are summarised on stderr.
+
+Spans from threads are kept apart by thread id. Spans recorded in worker
+processes (``lint`` and ``init --batch`` pools) are not collected.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_OUTPUT = "arckit-trace.json"
+ENV_VAR = "ARCKIT_PROFILE"
+FALSE_VALUES = ("", "0", "false", "no", "off")
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+_recorder = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed region; :meth:`set` attaches results (counts, sizes) to it."""
+
+    __slots__ = ("recorder", "name", "cat", "args", "start")
+
+    def __init__(self, recorder, name: str, cat: str, args: dict):
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.recorder.add(self.name, self.cat, self.start, end, self.args)
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class Recorder:
+    """Collects finished spans; appends are atomic under the GIL, so threads need no lock."""
+
+    def __init__(self, output: Path = None):
+        self.output = Path(output) if output else None
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events = []
+        self.threads = {}
+
+    def add(self, name: str, cat: str, start: int, end: int, args: dict):
+        tid = threading.get_ident()
+        if tid not in self.threads:
+            self.threads[tid] = threading.current_thread().name
+        self.events.append((name, cat, start, end, tid, args))
+
+    def trace(self) -> dict:
+        """The recorded spans as a Chrome trace (``X`` events, microsecond timestamps)."""
+        events = [{"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": "arckit"}}]
+        events += [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                   for tid, name in self.threads.items()]
+        for name, cat, start, end, tid, args in self.events:
+            event = {"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": tid,
+                     "ts": (start - self.origin) / 1000, "dur": (end - start) / 1000}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"argv": sys.argv, "python": sys.version.split()[0]}}
+
+    def summary(self) -> list:
+        """``(name, count, total_ms, max_ms)`` per span name, slowest total first."""
+        totals = {}
+        for name, _, start, end, _, _ in self.events:
+            count, total, longest = totals.get(name, (0, 0, 0))
+            totals[name] = (count + 1, total + end - start, max(longest, end - start))
+        rows = [(name, count, total / 1e6, longest / 1e6) for name, (count, total, longest) in totals.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def write(self, path: Path = None) -> Path:
+        import json
+
+        path = Path(path or self.output or DEFAULT_OUTPUT)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.trace(), separators=(",", ":")))
+        os.replace(tmp, path)
+        return path
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def enable(output: Path = None, report: bool = True) -> Recorder:
+    """Start recording; with ``report``, write the trace and a summary at exit."""
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder(output)
+        if report:
+            import atexit
+
+            atexit.register(_finish, _recorder)
+    elif output:
+        _recorder.output = Path(output)
+    return _recorder
+
+
+def disable() -> Recorder:
+    """Stop recording and return what was recorded (``None`` if profiling was off)."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def enable_from_environment():
+    """Turn profiling on if ``ARCKIT_PROFILE`` asks for it (``1`` or an output path)."""
+    value = os.environ.get(ENV_VAR, "")
+    if value.lower() not in FALSE_VALUES:
+        enable(None if value.lower() in TRUE_VALUES else value)
+
+
+def span(name: str, cat: str = "arckit", **args):
+    """Context manager timing a region; a shared no-op when profiling is off."""
+    recorder = _recorder
+    if recorder is None:
+        return NULL_SPAN
+    return Span(recorder, name, cat, args)
+
+
+def traced(name: str = None, cat: str = "arckit"):
+    """Decorator form of :func:`span`, named after the function by default."""
+
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return function(*args, **kwargs)
+            with Span(_recorder, label, cat, {}):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _finish(recorder: Recorder, limit: int = 15):
+    if _recorder is not recorder or not recorder.events:
+        return
+    try:
+        path = recorder.write()
+    except OSError as e:
+        print(f"arckit: could not write profile: {e}", file=sys.stderr)
+        return
+    rows = recorder.summary()
+    width = min(48, max(len(row[0]) for row in rows[:limit]))
+    print(f"\n{'span':<{width}} {'count':>6} {'total ms':>10} {'max ms':>9}", file=sys.stderr)
+    for name, count, total, longest in rows[:limit]:
+        print(f"{name[:width]:<{width}} {count:>6} {total:>10.2f} {longest:>9.2f}", file=sys.stderr)
+    print(f"Trace written to {path} ({len(recorder.events)} spans; open in ui.perfetto.dev)", file=sys.stderr)
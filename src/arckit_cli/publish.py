@@ -0,0 +1,589 @@
+"""Publish a project's artifacts as one board pack in ``final/``.
+
+:func:`publish_project` collects the project's markdown in dependency order
+(the ``DEPENDENCY-MATRIX.md`` schedule, then any remaining documents) and
+streams it into ``final/board-pack.html`` - self-contained, with inline CSS
+and Wardley maps drawn as inline SVG - and ``final/board-pack.md``. Both
+have a generated table of contents, links from every requirement ID to its
+definition in ``requirements.md``, links from every document ID
+(``ARC-NNN-TYPE-vX.Y``) to that document's section, links between
+documents rewritten to point inside the pack, and a requirement
+cross-reference listing the sections that cite each requirement.
+
+Sections are rendered independently and cached under
+``.arckit/cache/publish/`` with the source file's hash. Cross-references
+are left in the cached fragments as markers and resolved while the pack is
+written, so editing one document re-renders only that section, and a
+project whose sources are unchanged is not rewritten at all.
+:func:`publish_projects` publishes many projects in a process pool.
+"""
+
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import span, traced
+
+CACHE_DIR = ".arckit/cache/publish"
+CACHE_VERSION = 1
+FORMATS = ("html", "md")
+# Relative to the project directory; lint, trace and the index skip these
+BUNDLE_FILES = {"html": "final/board-pack.html", "md": "final/board-pack.md"}
+
+# Cross-reference markers left in cached fragments: MARK, kind, payload, END
+MARK, END = "\ue000", "\ue001"
+MARK_RE = re.compile(f"{MARK}([RrDL])([^{END}]*){END}")
+SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+# Inline code, links/images and HTML tags are copied into the markdown pack untouched
+MD_SKIP_RE = re.compile(r"(`+)[^`]*?\1|(!?\[[^\]]*\]\()([^)\s]+)((?:\s[^)]*)?\))|<[^>]+>")
+INLINE_MARKUP_RE = re.compile(r"[*_`]|\[([^\]]*)\]\([^)]*\)")
+
+STYLE = """
+body{font:15px/1.55 -apple-system,"Segoe UI",Helvetica,Arial,sans-serif;color:#1b1b1b;max-width:1080px;margin:0 auto;padding:24px 32px}
+h1,h2,h3,h4{line-height:1.25}h1{font-size:2em}section>h2:first-of-type{border-bottom:2px solid #1d70b8;padding-bottom:4px}
+nav.toc{background:#f3f2f1;padding:12px 24px;margin:16px 0 32px}nav.toc ol{padding-left:20px}nav.toc li{margin:2px 0}
+table{border-collapse:collapse;margin:12px 0;font-size:.93em}th,td{border:1px solid #b1b4b6;padding:4px 8px;vertical-align:top}
+th{background:#f3f2f1;text-align:left}pre{background:#f8f8f8;padding:10px;overflow-x:auto}code{font-size:.92em}
+a.xref{color:#1d70b8;text-decoration:none;border-bottom:1px dotted #1d70b8}.docid,.source{color:#505a5f;font-size:.85em}
+[id^="req-"]:target{background:#fff7bf}figure.wardley svg{max-width:100%;height:auto;border:1px solid #ddd}
+@media print{section{break-before:page}nav.toc{break-after:page}}
+""".strip()
+
+
+class PublishError(RuntimeError):
+    """Raised when a project cannot be published."""
+
+
+@dataclass
+class Section:
+    """One source document, rendered; fragments hold unresolved markers."""
+
+    path: str
+    anchor: str
+    title: str
+    doc_id: str = None
+    digest: str = ""
+    # (level, text, anchor) of the document's top two heading levels
+    toc: list = field(default_factory=list)
+    defines: list = field(default_factory=list)
+    references: list = field(default_factory=list)
+    fragments: dict = field(default_factory=dict)
+
+    def to_json(self) -> dict:
+        return {"path": self.path, "anchor": self.anchor, "title": self.title, "doc_id": self.doc_id,
+                "digest": self.digest, "toc": self.toc, "defines": self.defines,
+                "references": self.references, "fragments": self.fragments}
+
+
+@dataclass
+class PublishResult:
+    project: str
+    sections: int = 0
+    rebuilt: int = 0
+    reused: int = 0
+    requirements: int = 0
+    written: list = field(default_factory=list)
+    elapsed: float = 0.0
+    error: str = None
+
+    def to_json(self) -> dict:
+        return {"project": self.project, "sections": self.sections, "rebuilt": self.rebuilt, "reused": self.reused,
+                "requirements": self.requirements, "written": self.written,
+                "elapsed_ms": round(self.elapsed * 1000, 1), "error": self.error}
+
+
+def slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "section"
+
+
+def requirement_anchor(requirement_id: str) -> str:
+    return f"req-{slug(requirement_id)}"
+
+
+def document_anchor(document_id: str) -> str:
+    return f"doc-{slug(document_id)}"
+
+
+def is_bundle(relative: str) -> bool:
+    """Whether a project-relative path is one of the packs this module writes."""
+    return relative in BUNDLE_FILES.values()
+
+
+def _plain(text: str) -> str:
+    return INLINE_MARKUP_RE.sub(lambda m: m.group(1) or "", text).strip()
+
+
+def artifact_order(repo_root: Path, matrix: Path = None) -> list:
+    """Producing commands in dependency order (``DEPENDENCY-MATRIX.md`` schedule)."""
+    from .graph import GraphError, OUTPUTS, find_matrix, load_graph, schedule
+
+    try:
+        graph = load_graph(matrix or find_matrix(repo_root))
+        ordered = [command for level in schedule(graph) for command in level]
+    except (GraphError, OSError) as e:
+        raise PublishError(f"cannot order artifacts: {e}") from None
+    return ordered + [command for command in OUTPUTS if command not in ordered]
+
+
+def source_files(state, order: list) -> list:
+    """Project markdown in publishing order: each command's outputs, then the rest."""
+    seen = set()
+    ordered = []
+    for command in order:
+        for path in state.outputs(command):
+            if path.startswith("/") or not path.endswith(".md") or path in seen or is_bundle(path):
+                continue
+            seen.add(path)
+            ordered.append(path)
+    ordered += sorted(path for path in state.files
+                      if path.endswith(".md") and not path.startswith("/") and path not in seen and not is_bundle(path))
+    return ordered
+
+
+class _Marker:
+    """Turns requirement and document IDs in text into cross-reference markers."""
+
+    def __init__(self, defining: bool, heading_definitions: bool):
+        from .index import DOCUMENT_ID_RE
+        from .trace import REQUIREMENT_ID_RE
+
+        self.pattern = re.compile(f"(?P<doc>{DOCUMENT_ID_RE.pattern})|{REQUIREMENT_ID_RE.pattern}")
+        self.defining = defining
+        self.heading_definitions = heading_definitions
+        self.defined = []
+        self.references = set()
+
+    def mark(self, text: str, heading: bool = False) -> str:
+        def replace(match):
+            found = match.group(0)
+            if match.group("doc"):
+                return f"{MARK}D{found}{END}"
+            if (self.defining and found not in self.defined
+                    and (heading or not self.heading_definitions)):
+                self.defined.append(found)
+                return f"{MARK}r{found}{END}"
+            self.references.add(found)
+            return f"{MARK}R{found}{END}"
+
+        return self.pattern.sub(replace, text)
+
+
+def _link_marker(target: str, relative: str) -> str:
+    """A marker for a project-relative link target, or ``target`` if it is absolute."""
+    if not target or target.startswith(("#", "/")) or SCHEME_RE.match(target):
+        return target
+    path, _, fragment = target.partition("#")
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(relative), path)) if path else relative
+    return f"{MARK}L{resolved}{'#' + fragment if fragment else ''}{END}"
+
+
+def _markdown_fragment(lines, relative: str, anchor: str, marker: _Marker):
+    """The document with headings shifted down a level and IDs marked; plus its headings.
+
+    ``lines`` is a :func:`~arckit_cli.mdcache.walk` over the document.
+    Headings are keyed by 0-based line, as markdown-it maps its tokens.
+    """
+    out, headings, anchors = [], {}, {}
+    for number, line, section, in_fence in lines:
+        line = line.rstrip("\r\n")
+        if in_fence:
+            out.append(line)
+        elif section.level and number == section.line:
+            level, title = section.level, section.title
+            base = f"{anchor}--{slug(_plain(title))}"
+            count = anchors.get(base, 0)
+            anchors[base] = count + 1
+            heading_anchor = base if count == 0 else f"{base}-{count}"
+            headings[number - 1] = (level, _plain(title), heading_anchor)
+            prefix = f'<a id="{heading_anchor}"></a>' if level <= 2 else ""
+            out.append(f"{'#' * min(6, level + 1)} {prefix}{_mark_markdown(title, relative, marker, True)}")
+        else:
+            out.append(_mark_markdown(line, relative, marker))
+    return "\n".join(out).rstrip() + "\n", headings
+
+
+def _mark_markdown(line: str, relative: str, marker: _Marker, heading: bool = False) -> str:
+    parts, position = [], 0
+    for match in MD_SKIP_RE.finditer(line):
+        parts.append(marker.mark(line[position:match.start()], heading))
+        if match.group(2):
+            parts.append(match.group(2) + _link_marker(match.group(3), relative) + match.group(4))
+        else:
+            parts.append(match.group(0))
+        position = match.end()
+    parts.append(marker.mark(line[position:], heading))
+    return "".join(parts)
+
+
+def _markdown_it():
+    from markdown_it import MarkdownIt
+    from markdown_it.common.utils import escapeHtml
+
+    md = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+    default_fence = md.renderer.rules["fence"]
+
+    def text(self, tokens, index, options, env):
+        token = tokens[index]
+        escaped = escapeHtml(token.content)
+        if token.meta.get("xref"):
+            return env["marker"].mark(escaped, token.meta.get("heading", False))
+        return escaped
+
+    def fence(self, tokens, index, options, env):
+        token = tokens[index]
+        if token.info.strip().lower() in ("wardley", "owm"):
+            from .wardley import parse, render_svg
+
+            source = default_fence(tokens, index, options, env)
+            svg = render_svg(parse(token.content))
+            return (f'<figure class="wardley">{svg}</figure>\n'
+                    f"<details><summary>Map source</summary>\n{source}</details>\n")
+        return default_fence(tokens, index, options, env)
+
+    md.add_render_rule("text", text)
+    md.add_render_rule("fence", fence)
+    return md
+
+
+_MD = None
+
+
+def _html_fragment(text: str, relative: str, headings: dict, marker: _Marker) -> str:
+    global _MD
+    if _MD is None:
+        _MD = _markdown_it()
+    tokens = _MD.parse(text, {})
+    heading = False
+    for token in tokens:
+        if token.type == "heading_open":
+            level = int(token.tag[1])
+            token.tag = f"h{min(6, level + 1)}"
+            found = headings.get(token.map[0]) if token.map else None
+            if found:
+                token.attrSet("id", found[2])
+            heading = True
+        elif token.type == "heading_close":
+            token.tag = f"h{min(6, int(token.tag[1]) + 1)}"
+            heading = False
+        elif token.type == "inline" and token.children:
+            depth = 0
+            for child in token.children:
+                if child.type == "link_open":
+                    depth += 1
+                    child.attrSet("href", _link_marker(child.attrGet("href") or "", relative))
+                elif child.type == "link_close":
+                    depth -= 1
+                elif child.type == "image":
+                    child.attrSet("src", _link_marker(child.attrGet("src") or "", relative))
+                elif child.type == "text" and depth == 0:
+                    child.meta = {"xref": True, "heading": heading}
+    return _MD.renderer.render(tokens, _MD.options, {"marker": marker})
+
+
+@traced("publish.section")
+def render_section(data: bytes, sections: list, relative: str, formats=FORMATS) -> Section:
+    """Render one document into pack fragments with unresolved cross-reference markers.
+
+    ``sections`` are the document's :class:`~arckit_cli.mdcache.Section` list.
+    """
+    from .mdcache import walk
+    from .trace import REQUIREMENTS_FILE, REQUIREMENT_ID_RE
+
+    text = data.decode("utf-8", errors="replace")
+    anchor = f"sec-{slug(relative)}"
+    defining = relative == REQUIREMENTS_FILE
+    heading_definitions = defining and any(
+        section.level and REQUIREMENT_ID_RE.search(section.title) for section in sections)
+
+    marker = _Marker(defining, heading_definitions)
+    markdown, headings = _markdown_fragment(walk(data, sections), relative, anchor, marker)
+    title = next((title for level, title, _ in headings.values() if level == 1), None)
+    toc = [list(entry) for entry in headings.values() if entry[0] == 2]
+    section = Section(relative, anchor, title or Path(relative).stem.replace("-", " ").title(),
+                      toc=toc, defines=list(marker.defined), references=sorted(marker.references))
+    from .index import DOCUMENT_ID_RE
+
+    head = "\n".join(text.splitlines()[:40])
+    match = DOCUMENT_ID_RE.search(head)
+    section.doc_id = match.group(0) if match else None
+    if "md" in formats:
+        section.fragments["md"] = markdown
+    if "html" in formats:
+        section.fragments["html"] = _html_fragment(text, relative, headings, _Marker(defining, heading_definitions))
+    return section
+
+
+class _Resolver:
+    """Resolves fragment markers against the sections in this pack."""
+
+    def __init__(self, sections: list):
+        self.sections = {section.path: section.anchor for section in sections}
+        self.requirements = {}
+        self.documents = {}
+        self.families = {}
+        for section in sections:
+            for requirement_id in section.defines:
+                self.requirements.setdefault(requirement_id, section)
+            if section.doc_id:
+                self.documents.setdefault(section.doc_id, section.anchor)
+                self.families.setdefault(section.doc_id.rsplit("-v", 1)[0], section.anchor)
+
+    def document(self, document_id: str):
+        return self.documents.get(document_id) or self.families.get(document_id.rsplit("-v", 1)[0])
+
+    def link(self, payload: str) -> str:
+        path, _, fragment = payload.partition("#")
+        if path in self.sections:
+            return f"#{self.sections[path]}"
+        return posixpath.relpath(path, "final") + (f"#{fragment}" if fragment else "")
+
+    def resolve(self, fragment: str, fmt: str, section: Section) -> str:
+        as_html = fmt == "html"
+
+        def replace(match):
+            kind, payload = match.groups()
+            if kind == "L":
+                target = self.link(payload)
+                return html.escape(target) if as_html else target
+            if kind == "D":
+                target = self.document(payload)
+            elif kind == "r":
+                if self.requirements.get(payload) is section:
+                    anchor = requirement_anchor(payload)
+                    return f'<span id="{anchor}">{payload}</span>' if as_html else f'<a id="{anchor}"></a>{payload}'
+                target = None
+            else:
+                target = self.requirements.get(payload) and requirement_anchor(payload)
+            if target is None:
+                return payload
+            return f'<a class="xref" href="#{target}">{payload}</a>' if as_html else f"[{payload}](#{target})"
+
+        return MARK_RE.sub(replace, fragment)
+
+
+def _project_title(project_dir: Path) -> str:
+    number, _, name = project_dir.name.partition("-")
+    return f"Project {number}: {name.replace('-', ' ').title()}" if name else project_dir.name
+
+
+def _cross_reference(sections: list, resolver: _Resolver) -> list:
+    """``(requirement ID, [citing sections])`` for every defined requirement, in ID order."""
+    from .trace import id_sort_key
+
+    cited = {}
+    for section in sections:
+        for requirement_id in section.references:
+            if resolver.requirements.get(requirement_id) is not section:
+                cited.setdefault(requirement_id, []).append(section)
+    return [(requirement_id, cited.get(requirement_id, []))
+            for requirement_id in sorted(resolver.requirements, key=id_sort_key)]
+
+
+def _write_html(out, title: str, sections: list, resolver: _Resolver):
+    out.write(f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+              f"<title>{html.escape(title)} - Architecture Pack</title>\n<style>\n{STYLE}\n</style>\n</head>\n<body>\n")
+    out.write(f"<header><h1>{html.escape(title)}</h1>\n<p class=\"source\">Architecture pack of "
+              f"{len(sections)} documents, published by arckit.</p></header>\n")
+    out.write('<nav class="toc"><h2>Contents</h2>\n<ol>\n')
+    for section in sections:
+        doc_id = f' <span class="docid">{section.doc_id}</span>' if section.doc_id else ""
+        out.write(f'<li><a href="#{section.anchor}">{html.escape(section.title)}</a>{doc_id}')
+        if section.toc:
+            out.write("<ol>" + "".join(f'<li><a href="#{anchor}">{html.escape(text)}</a></li>'
+                                       for _, text, anchor in section.toc) + "</ol>")
+        out.write("</li>\n")
+    xref = _cross_reference(sections, resolver)
+    if xref:
+        out.write('<li><a href="#requirement-cross-reference">Requirement cross-reference</a></li>\n')
+    out.write("</ol>\n</nav>\n")
+    for section in sections:
+        document = f'<span id="{document_anchor(section.doc_id)}"></span>' if section.doc_id else ""
+        out.write(f'<section id="{section.anchor}">{document}\n<p class="source">Source: {html.escape(section.path)}'
+                  f"{' · ' + section.doc_id if section.doc_id else ''}</p>\n")
+        out.write(resolver.resolve(section.fragments["html"], "html", section))
+        out.write("</section>\n")
+    if xref:
+        out.write('<section id="requirement-cross-reference">\n<h2>Requirement cross-reference</h2>\n'
+                  "<table>\n<thead><tr><th>Requirement</th><th>Cited in</th></tr></thead>\n<tbody>\n")
+        for requirement_id, citing in xref:
+            links = ", ".join(f'<a href="#{s.anchor}">{html.escape(s.title)}</a>' for s in citing) or "-"
+            out.write(f'<tr><td><a class="xref" href="#{requirement_anchor(requirement_id)}">{requirement_id}</a>'
+                      f"</td><td>{links}</td></tr>\n")
+        out.write("</tbody>\n</table>\n</section>\n")
+    out.write("</body>\n</html>\n")
+
+
+def _write_markdown(out, title: str, sections: list, resolver: _Resolver):
+    out.write(f"# {title}\n\nArchitecture pack of {len(sections)} documents, published by arckit.\n\n## Contents\n\n")
+    for number, section in enumerate(sections, start=1):
+        doc_id = f" ({section.doc_id})" if section.doc_id else ""
+        out.write(f"{number}. [{section.title}](#{section.anchor}){doc_id}\n")
+        for _, text, anchor in section.toc:
+            out.write(f"    - [{text}](#{anchor})\n")
+    xref = _cross_reference(sections, resolver)
+    if xref:
+        out.write(f"{len(sections) + 1}. [Requirement cross-reference](#requirement-cross-reference)\n")
+    for section in sections:
+        document = f'<a id="{document_anchor(section.doc_id)}"></a>' if section.doc_id else ""
+        out.write(f'\n---\n\n<a id="{section.anchor}"></a>{document}\n\n'
+                  f"*Source: `{section.path}`{' · ' + section.doc_id if section.doc_id else ''}*\n\n")
+        out.write(resolver.resolve(section.fragments["md"], "md", section))
+    if xref:
+        out.write('\n---\n\n<a id="requirement-cross-reference"></a>\n\n## Requirement cross-reference\n\n'
+                  "| Requirement | Cited in |\n|-------------|----------|\n")
+        for requirement_id, citing in xref:
+            links = ", ".join(f"[{s.title}](#{s.anchor})" for s in citing) or "-"
+            out.write(f"| [{requirement_id}](#{requirement_anchor(requirement_id)}) | {links} |\n")
+
+
+WRITERS = {"html": _write_html, "md": _write_markdown}
+
+
+class _SectionCache:
+    """Rendered sections of one project, keyed by path and validated by content hash."""
+
+    def __init__(self, repo_root: Path, project: str):
+        self.path = Path(repo_root) / CACHE_DIR / f"{project}.json"
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != CACHE_VERSION:
+            data = {}
+        self.entries = data.get("sections", {})
+        self.bundles = data.get("bundles", {})
+        self.dirty = False
+
+    def get(self, relative: str, stat: tuple, formats):
+        """The cached section, if the file's size and mtime are unchanged and it has these formats."""
+        entry = self.entries.get(relative)
+        if entry is None or entry["stat"] != list(stat):
+            return None
+        if not all(fmt in entry["section"]["fragments"] for fmt in formats):
+            return None
+        return Section(**entry["section"])
+
+    def by_digest(self, relative: str, digest: str, stat: tuple, formats):
+        """A cached section whose contents match although its mtime changed."""
+        entry = self.entries.get(relative)
+        if entry is None or entry["section"]["digest"] != digest:
+            return None
+        if not all(fmt in entry["section"]["fragments"] for fmt in formats):
+            return None
+        entry["stat"] = list(stat)
+        self.dirty = True
+        return Section(**entry["section"])
+
+    def put(self, section: Section, stat: tuple):
+        self.entries[section.path] = {"stat": list(stat), "section": section.to_json()}
+        self.dirty = True
+
+    def prune(self, keep):
+        for relative in set(self.entries) - set(keep):
+            del self.entries[relative]
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "sections": self.entries, "bundles": self.bundles}),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+        self.dirty = False
+
+
+@traced("publish.project")
+def publish_project(project_dir: Path, repo_root: Path, order: list, formats=FORMATS,
+                    force: bool = False) -> PublishResult:
+    """Publish one project's pack, re-rendering only sections whose sources changed."""
+    from .graph import read_project
+    from .mdcache import MdCache
+
+    start = time.perf_counter()
+    project_dir, repo_root = Path(project_dir), Path(repo_root)
+    result = PublishResult(project_dir.name)
+    state = read_project(project_dir, repo_root)
+    paths = source_files(state, order)
+    if not paths:
+        raise PublishError(f"{project_dir.name} has no documents to publish")
+
+    cache = _SectionCache(repo_root, project_dir.name)
+    markdown = MdCache.for_repo(repo_root)
+    sections = []
+    for relative in paths:
+        stat = state.files[relative]
+        section = None if force else cache.get(relative, stat, formats)
+        if section is None:
+            data = (project_dir / relative).read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            section = None if force else cache.by_digest(relative, digest, stat, formats)
+            if section is None:
+                with span("publish.render", path=relative):
+                    document = markdown.load(project_dir / relative, data)
+                    section = render_section(data, document.sections, relative, formats)
+                section.digest = digest
+                cache.put(section, stat)
+                result.rebuilt += 1
+            else:
+                result.reused += 1
+        else:
+            result.reused += 1
+        sections.append(section)
+    cache.prune(paths)
+    markdown.save()
+
+    result.sections = len(sections)
+    resolver = _Resolver(sections)
+    result.requirements = len(resolver.requirements)
+    title = _project_title(project_dir)
+    pack = hashlib.sha256(f"{CACHE_VERSION}\0{title}\0".encode()
+                          + "\0".join(f"{s.path}:{s.digest}" for s in sections).encode()).hexdigest()
+    for fmt in formats:
+        target = project_dir / BUNDLE_FILES[fmt]
+        if not force and cache.bundles.get(fmt) == pack and target.is_file():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with span("publish.write", format=fmt), open(tmp, "w", encoding="utf-8") as out:
+            WRITERS[fmt](out, title, sections, resolver)
+        os.replace(tmp, target)
+        cache.bundles[fmt] = pack
+        cache.dirty = True
+        result.written.append(BUNDLE_FILES[fmt])
+    cache.save()
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _publish_worker(task) -> PublishResult:
+    project_dir, repo_root, order, formats, force = task
+    try:
+        return publish_project(project_dir, repo_root, order, formats, force)
+    except (PublishError, OSError) as e:
+        return PublishResult(Path(project_dir).name, error=str(e))
+
+
+@traced("publish.projects")
+def publish_projects(project_dirs, repo_root: Path, formats=FORMATS, force: bool = False,
+                     jobs: int = None) -> list:
+    """Publish several projects, in a process pool when there are enough of them."""
+    order = artifact_order(repo_root)
+    tasks = [(str(project_dir), str(repo_root), order, tuple(formats), force) for project_dir in project_dirs]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks) or 1))
+    if jobs > 1 and len(tasks) > 2:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(_publish_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    return [_publish_worker(task) for task in tasks]
@@ -0,0 +1,305 @@
+"""Registry of allocated project numbers and document IDs.
+
+:func:`~arckit_cli.workspace.next_project_number` picks one more than the
+highest ``projects/NNN-*`` directory, so two agents creating projects at
+the same time can pick the same number. The registry in
+``.arckit/registry/`` hands out numbers under an exclusive file lock
+instead:
+
+- ``log.jsonl`` is an append-only journal with one JSON line per
+  allocation. It is the source of truth, and each line is on disk before
+  the allocation is returned;
+- ``head.json`` holds the last project number and the journal offset it
+  covers, and ``documents/NNN.json`` holds the current version of each
+  document type in project NNN.
+
+An allocation reads and rewrites only those two small files, so its cost
+does not grow with the number of documents or projects. ``projects/`` is
+only listed to seed the registry on first use and by :meth:`Registry.rebuild`,
+which picks up directories made outside the registry (by hand, or by
+``create-project.sh`` when the ``arckit`` CLI is not installed). If a process dies
+between appending to the journal and updating the state files, the next
+allocation replays the journal from the offset in ``head.json``. A torn
+final line (the write itself interrupted) is dropped, since that
+allocation was never returned.
+"""
+
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from .profiling import span, traced
+from .workspace import document_id, next_project_number
+
+REGISTRY_DIR = ".arckit/registry"
+LOCK_FILE = "lock"
+LOG_FILE = "log.jsonl"
+HEAD_FILE = "head.json"
+DOCUMENTS_DIR = "documents"
+REGISTRY_VERSION = 1
+VERSION_RE = re.compile(r"^([0-9]+)\.([0-9]+)$")
+
+
+class RegistryError(RuntimeError):
+    """Raised when an allocation cannot be made or the registry is inconsistent."""
+
+
+try:
+    import fcntl
+
+    def _lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:  # LK_LOCK gives up after ~10 seconds
+                continue
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _project_key(project) -> str:
+    try:
+        return f"{int(str(project), 10):03d}"
+    except ValueError:
+        raise RegistryError(f"invalid project number: {project}") from None
+
+
+def _read_json(path: Path, default):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return default
+    except ValueError as e:
+        raise RegistryError(f"{path} is corrupt ({e}); run 'arckit projects registry --rebuild'") from None
+
+
+def _write_json(path: Path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _empty_head() -> dict:
+    return {"version": REGISTRY_VERSION, "seq": 0, "offset": 0, "last_project": None}
+
+
+def bump(version: str, major: bool = False) -> str:
+    """``1.2`` -> ``1.3``, or ``2.0`` with ``major``."""
+    match = VERSION_RE.match(version)
+    if not match:
+        raise RegistryError(f"invalid version: {version} (expected MAJOR.MINOR)")
+    if major:
+        return f"{int(match.group(1)) + 1}.0"
+    return f"{match.group(1)}.{int(match.group(2)) + 1}"
+
+
+class _Transaction:
+    """State loaded under the lock; :meth:`append` journals and applies one entry."""
+
+    def __init__(self, registry, log_fd: int, head: dict):
+        self.registry = registry
+        self.log_fd = log_fd
+        self.head = head
+        self.documents = {}
+        self.dirty = set()
+
+    def versions(self, project: str) -> dict:
+        if project not in self.documents:
+            self.documents[project] = _read_json(self.registry.documents_path(project), {})
+        return self.documents[project]
+
+    def apply(self, entry: dict):
+        op = entry["op"]
+        if op in ("seed", "project"):
+            last = self.head["last_project"] or 0
+            self.head["last_project"] = max(last, int(entry["number"], 10))
+        elif op in ("document", "version"):
+            self.versions(entry["project"])[entry["type"]] = entry["version"]
+            self.dirty.add(entry["project"])
+        self.head["seq"] = entry["seq"]
+
+    def append(self, op: str, **fields) -> dict:
+        entry = {"seq": self.head["seq"] + 1, "op": op, **fields,
+                 "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "pid": os.getpid()}
+        data = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+        written = 0
+        while written < len(data):
+            written += os.write(self.log_fd, data[written:])
+        os.fsync(self.log_fd)
+        self.head["offset"] += len(data)
+        self.apply(entry)
+        return entry
+
+    def save(self):
+        for project in self.dirty:
+            _write_json(self.registry.documents_path(project), self.documents[project])
+        self.dirty.clear()
+        _write_json(self.registry.path / HEAD_FILE, self.head)
+
+
+class Registry:
+    """Lock-protected allocator for project numbers, document IDs and versions."""
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = Path(repo_root)
+        self.path = self.repo_root / REGISTRY_DIR
+
+    def documents_path(self, project: str) -> Path:
+        return self.path / DOCUMENTS_DIR / f"{project}.json"
+
+    def _replay(self, txn: _Transaction, data: bytes, start: int = 0):
+        for line in data.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                raise RegistryError(f"{self.path / LOG_FILE} has a corrupt entry ({e})") from None
+            txn.apply(entry)
+        txn.head["offset"] = start + len(data)
+
+    def _recover(self, txn: _Transaction):
+        """Bring the state files up to date with the journal."""
+        size = os.fstat(txn.log_fd).st_size
+        offset = txn.head["offset"]
+        if size == offset:
+            return
+        if size < offset:
+            raise RegistryError(f"{self.path / LOG_FILE} is shorter than the registry state; "
+                                "run 'arckit projects registry --rebuild'")
+        os.lseek(txn.log_fd, offset, os.SEEK_SET)
+        tail = b""
+        while len(tail) < size - offset:
+            chunk = os.read(txn.log_fd, size - offset - len(tail))
+            if not chunk:
+                break
+            tail += chunk
+        complete = tail[: tail.rfind(b"\n") + 1]
+        if len(complete) < len(tail):
+            os.ftruncate(txn.log_fd, offset + len(complete))
+        self._replay(txn, complete, offset)
+        txn.save()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the registry lock; yields the journal's file descriptor."""
+        (self.path / DOCUMENTS_DIR).mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(self.path / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            with span("registry.lock"):
+                _lock(lock_fd)
+            try:
+                log_fd = os.open(self.path / LOG_FILE, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    yield log_fd
+                finally:
+                    os.close(log_fd)
+            finally:
+                _unlock(lock_fd)
+        finally:
+            os.close(lock_fd)
+
+    @contextmanager
+    def _transaction(self):
+        with self._locked() as log_fd:
+            txn = _Transaction(self, log_fd, _read_json(self.path / HEAD_FILE, None) or _empty_head())
+            self._recover(txn)
+            if txn.head["last_project"] is None:
+                # First use: carry on from the projects that already exist
+                txn.append("seed", number=f"{int(next_project_number(self.repo_root)) - 1:03d}")
+            yield txn
+            txn.save()
+
+    @traced("registry.allocate_project")
+    def allocate_project(self, name: str = "", number: str = None) -> str:
+        """Reserve the next project number (``NNN``), or record ``number`` if the caller chose one."""
+        with self._transaction() as txn:
+            number = _project_key(number) if number else f"{txn.head['last_project'] + 1:03d}"
+            txn.append("project", number=number, name=name)
+        return number
+
+    @traced("registry.register_document")
+    def register_document(self, project, doc_type: str, version: str = "1.0") -> str:
+        """Register ``ARC-NNN-TYPE`` at ``version``; if already registered, return its current ID."""
+        project = _project_key(project)
+        if not VERSION_RE.match(version):
+            raise RegistryError(f"invalid version: {version} (expected MAJOR.MINOR)")
+        with self._transaction() as txn:
+            current = txn.versions(project).get(doc_type)
+            if current is None:
+                txn.append("document", project=project, type=doc_type, version=version)
+                current = version
+        return document_id(project, doc_type, current)
+
+    @traced("registry.bump_version")
+    def bump_version(self, project, doc_type: str, major: bool = False) -> str:
+        """Move a registered document to its next minor (or major) version and return the new ID."""
+        project = _project_key(project)
+        with self._transaction() as txn:
+            current = txn.versions(project).get(doc_type)
+            if current is None:
+                raise RegistryError(f"ARC-{project}-{doc_type} is not registered")
+            version = bump(current, major)
+            txn.append("version", project=project, type=doc_type, version=version)
+        return document_id(project, doc_type, version)
+
+    def current_version(self, project, doc_type: str):
+        """Registered version of a document, or ``None``; read without taking the lock."""
+        return _read_json(self.documents_path(_project_key(project)), {}).get(doc_type)
+
+    def entries(self):
+        """Journal entries, oldest first."""
+        try:
+            with open(self.path / LOG_FILE, "rb") as f:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def rebuild(self) -> dict:
+        """Regenerate the state files from the journal and the projects directory."""
+        with self._locked() as log_fd:
+            for stale in (self.path / DOCUMENTS_DIR).glob("*.json"):
+                stale.unlink()
+            txn = _Transaction(self, log_fd, _empty_head())
+            self._recover(txn)
+            highest = int(next_project_number(self.repo_root)) - 1
+            if txn.head["last_project"] is None or txn.head["last_project"] < highest:
+                # Projects made outside the registry (create-project.sh, by hand)
+                txn.append("seed", number=f"{highest:03d}")
+            txn.save()
+        return self.status()
+
+    def status(self) -> dict:
+        head = _read_json(self.path / HEAD_FILE, None)
+        documents = sum(len(_read_json(path, {})) for path in (self.path / DOCUMENTS_DIR).glob("*.json"))
+        try:
+            log_bytes = (self.path / LOG_FILE).stat().st_size
+        except FileNotFoundError:
+            log_bytes = 0
+        last = head["last_project"] if head else None
+        return {
+            "path": str(self.path),
+            "initialised": head is not None,
+            "last_project": f"{last:03d}" if last is not None else None,
+            "next_project": f"{last + 1:03d}" if last is not None else next_project_number(self.repo_root),
+            "documents": documents,
+            "entries": head["seq"] if head else 0,
+            "log_bytes": log_bytes,
+            "pending_bytes": log_bytes - head["offset"] if head else log_bytes,
+        }
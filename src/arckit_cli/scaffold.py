@@ -0,0 +1,158 @@
+"""Building blocks for scaffolding an ArcKit project.
+
+Shared by ``arckit init`` and batch provisioning; nothing here prompts or
+prints, so it is safe to call from worker processes.
+"""
+
+from pathlib import Path
+
+from .config import AGENT_CONFIG
+
+CODEX_IGNORE_ENTRIES = [
+    "# Codex CLI - exclude auth tokens but include prompts",
+    ".codex/*",
+    "!.codex/prompts/",
+    "",
+    "# direnv",
+    ".envrc.local",
+]
+
+
+def project_directories(ai_assistant: str) -> list:
+    """Directories every ArcKit project starts with."""
+    agent_folder = AGENT_CONFIG[ai_assistant]["folder"]
+    return [
+        ".arckit/memory",
+        ".arckit/scripts/bash",
+        ".arckit/templates",
+        "projects",
+        f"{agent_folder}commands",
+    ]
+
+
+def asset_groups(data_paths: dict, ai_assistant: str) -> list:
+    """Bundled assets to install, as (description, source dir, glob, destination prefix)."""
+    agent_folder = AGENT_CONFIG[ai_assistant]["folder"]
+    if ai_assistant in ["claude", "codex"]:
+        commands = ("Claude commands", data_paths["claude_commands"], "arckit.*.md")
+    else:
+        commands = ("Gemini commands", data_paths["gemini_commands"], "**/*")
+    return [
+        ("templates", data_paths["templates"], "*.md", ".arckit/templates"),
+        ("scripts", data_paths["scripts"], "**/*", ".arckit/scripts"),
+        commands + (f"{agent_folder}commands",),
+    ]
+
+
+def project_readme(project_name: str, ai_assistant: str) -> str:
+    """README written at the root of a new project."""
+    return f"""# {project_name}
+
+Enterprise Architecture Governance Project
+
+## Getting Started
+
+This project uses ArcKit for enterprise architecture governance and vendor procurement.
+
+### Available Commands
+
+Once you start your AI assistant, you'll have access to these commands:
+
+#### Project Planning
+- `/arckit.plan` - Create project plan with timeline, phases, and gates
+
+#### Core Workflow
+- `/arckit.principles` - Create or update architecture principles
+- `/arckit.stakeholders` - Analyze stakeholder drivers, goals, and outcomes
+- `/arckit.risk` - Create comprehensive risk register (Orange Book)
+- `/arckit.sobc` - Create Strategic Outline Business Case (Green Book 5-case)
+- `/arckit.requirements` - Define comprehensive requirements
+- `/arckit.data-model` - Create data model with ERD, GDPR compliance, data governance
+- `/arckit.research` - Research technology, services, and products with build vs buy analysis
+- `/arckit.wardley` - Create strategic Wardley Maps for build vs buy and procurement strategy
+
+#### Vendor Procurement
+- `/arckit.sow` - Generate Statement of Work (RFP)
+- `/arckit.dos` - Digital Outcomes and Specialists (DOS) procurement (UK Digital Marketplace)
+- `/arckit.gcloud-search` - Search G-Cloud services on UK Digital Marketplace
+- `/arckit.gcloud-clarify` - Validate G-Cloud services and generate clarification questions
+- `/arckit.evaluate` - Create vendor evaluation framework and score vendors
+
+#### Design Review
+- `/arckit.hld-review` - Review High-Level Design
+- `/arckit.dld-review` - Review Detailed Design
+
+#### Architecture Diagrams
+- `/arckit.diagram` - Generate visual architecture diagrams using Mermaid
+
+#### Sprint Planning
+- `/arckit.backlog` - Generate prioritised product backlog with GDS user stories
+
+#### Service Management
+- `/arckit.servicenow` - Generate ServiceNow service design (CMDB, SLAs, incident/change management)
+
+#### Traceability & Quality
+- `/arckit.traceability` - Generate requirements traceability matrix
+- `/arckit.analyze` - Comprehensive governance quality analysis
+
+#### UK Government Compliance
+- `/arckit.service-assessment` - GDS Service Standard assessment preparation
+- `/arckit.tcop` - Technology Code of Practice assessment (all 13 points)
+- `/arckit.ai-playbook` - AI Playbook compliance for responsible AI
+- `/arckit.atrs` - Algorithmic Transparency Recording Standard (ATRS) record
+
+#### Security Assessment
+- `/arckit.secure` - UK Government Secure by Design (NCSC CAF, Cyber Essentials, UK GDPR)
+- `/arckit.mod-secure` - MOD Secure by Design (JSP 440, IAMM, security clearances)
+- `/arckit.jsp-936` - MOD JSP 936 AI assurance documentation
+
+## Project Structure
+
+```
+{project_name}/
+├── .arckit/
+│   ├── memory/
+│   │   └── architecture-principles.md (global principles)
+│   ├── scripts/
+│   │   └── bash/
+│   └── templates/
+├── projects/
+│   └── 001-project-name/
+│       ├── requirements.md
+│       ├── sow.md
+│       └── vendors/
+└── {AGENT_CONFIG[ai_assistant]['folder']}commands/
+```
+
+## Next Steps
+
+1. Start your AI assistant ({AGENT_CONFIG[ai_assistant]['name']})
+2. Run `/arckit.principles` to establish architecture governance
+3. Create your first project with `/arckit.requirements`
+
+## Documentation
+
+- [ArcKit Documentation](https://github.com/github/arc-kit)
+- [Architecture Principles Guide](https://github.com/github/arc-kit/docs/principles.md)
+- [Vendor Procurement Guide](https://github.com/github/arc-kit/docs/procurement.md)
+"""
+
+
+def write_codex_environment(project_path: Path):
+    """Create .envrc and .gitignore entries so Codex finds project prompts."""
+    envrc_content = f"""# Auto-generated by arckit CLI for Codex CLI support
+# This file sets CODEX_HOME so Codex can discover project-specific prompts
+# See: https://developers.openai.com/codex/cli/
+
+export CODEX_HOME="$PWD/.codex"
+"""
+    (project_path / ".envrc").write_text(envrc_content)
+
+    gitignore_path = project_path / ".gitignore"
+    if gitignore_path.exists():
+        existing_content = gitignore_path.read_text()
+        if ".codex" not in existing_content:
+            with open(gitignore_path, 'a') as f:
+                f.write("\n" + "\n".join(CODEX_IGNORE_ENTRIES) + "\n")
+    else:
+        gitignore_path.write_text("\n".join(CODEX_IGNORE_ENTRIES) + "\n")
@@ -0,0 +1,257 @@
+"""Heading trees for ArcKit templates, and chunked document generation.
+
+A template is parsed into a tree of sections by its markdown headings
+(headings inside fenced code blocks are ignored). Sections are numbered
+``1``, ``1.2``, ``1.2.3``...; when a document has a single level-1 title,
+its children are numbered from the top and the title with any preamble is
+section ``0``.
+
+:func:`chunks` cuts a tree into consecutive pieces at a given depth, so a
+large document can be generated section by section (in parallel, re-running
+only a failed piece) and :func:`merge_chunks` stitches the generated files
+back into the final artifact atomically.
+"""
+
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SECTIONS_DIR = ".sections"
+
+
+class TemplateError(ValueError):
+    """Raised when a template or section cannot be found or merged."""
+
+
+@dataclass
+class Section:
+    """A node of the heading tree.
+
+    ``start`` and ``end`` are 0-based line indexes: the heading line and the
+    line after the last one belonging to the section (subsections included).
+    ``body_end`` is where the section's own text stops and its first
+    subsection begins.
+    """
+
+    id: str
+    title: str
+    level: int
+    start: int
+    end: int = 0
+    body_end: int = 0
+    children: list = field(default_factory=list)
+
+    @property
+    def slug(self) -> str:
+        return slugify(self.title) or "preamble"
+
+    @property
+    def depth(self) -> int:
+        return 0 if self.id == "0" else self.id.count(".") + 1
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class Template:
+    """A parsed template: its lines and heading tree."""
+
+    name: str
+    lines: list
+    root: Section
+
+    def text(self, start: int, end: int) -> str:
+        return "".join(self.lines[start:end])
+
+    def section_text(self, section: Section) -> str:
+        return self.text(section.start, section.end)
+
+    def sections(self) -> list:
+        """Every section in document order, the ``0`` preamble first."""
+        return list(self.root.walk())
+
+    def find(self, key: str) -> Section:
+        """Look a section up by id (``3.2``), slug, or unique title substring."""
+        sections = self.sections()
+        for section in sections:
+            if key == section.id or key == section.slug:
+                return section
+        needle = key.lower()
+        matches = [s for s in sections if needle in s.title.lower()]
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            options = ", ".join(f"{s.id} ({s.title})" for s in matches[:8])
+            raise TemplateError(f"section '{key}' is ambiguous: {options}")
+        raise TemplateError(f"no section '{key}' in {self.name}")
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def parse_template(text: str, name: str = "") -> Template:
+    """Parse markdown into a :class:`Template` heading tree."""
+    from .mdcache import parse
+
+    # Split at \n, \r and \r\n only, as mdcache numbers lines
+    lines = list(io.StringIO(text, newline=""))
+    headings = [(line - 1, level, title) for level, title, _, line, *_ in parse(text.encode("utf-8")) if level]
+
+    # A single leading title becomes the preamble; everything else nests under it
+    root = Section("0", "", 0, 0)
+    top_levels = [level for _, level, _ in headings]
+    if headings and top_levels.count(1) == 1 and headings[0][1] == 1:
+        root.title = headings[0][2]
+        headings = headings[1:]
+
+    stack = [root]
+    for number, level, title in headings:
+        while len(stack) > 1 and stack[-1].level >= level:
+            stack.pop().end = number
+        parent = stack[-1]
+        prefix = "" if parent is root else f"{parent.id}."
+        section = Section(f"{prefix}{len(parent.children) + 1}", title, level, number)
+        if not parent.children:
+            parent.body_end = number
+        parent.children.append(section)
+        stack.append(section)
+    for section in stack:
+        section.end = len(lines)
+    for section in root.walk():
+        if not section.children:
+            section.body_end = section.end
+    return Template(name=name, lines=lines, root=root)
+
+
+def find_template(name: str, repo_root: Path = None):
+    """Locate ``.arckit/templates/<name>`` in the workspace or the ArcKit install."""
+    from .paths import resolve_data_root, source_root
+
+    for root in (repo_root, resolve_data_root().root, source_root()):
+        if root and (Path(root) / ".arckit" / "templates" / name).is_file():
+            return Path(root) / ".arckit" / "templates" / name
+    return None
+
+
+def template_file_name(name: str) -> str:
+    """Normalise ``sobc``, ``sobc-template`` or ``sobc-template.md``."""
+    name = name.removesuffix(".md")
+    if not name.endswith("-template"):
+        name += "-template"
+    return f"{name}.md"
+
+
+def load_template(name: str, repo_root: Path = None) -> Template:
+    file_name = template_file_name(name)
+    path = find_template(file_name, repo_root)
+    if path is None:
+        raise TemplateError(f"template '{file_name}' not found")
+    return parse_template(path.read_text(encoding="utf-8"), file_name)
+
+
+def artifact_name(template: Template) -> str:
+    """Default project file for a template: ``sobc-template.md`` -> ``sobc.md``."""
+    return template.name.replace("-template", "")
+
+
+def fill_placeholders(text: str, values: dict) -> str:
+    for key, value in values.items():
+        text = text.replace(f"[{key}]", value)
+    return text
+
+
+@dataclass
+class Chunk:
+    """A consecutive piece of a template, generated and stored on its own."""
+
+    id: str
+    title: str
+    start: int
+    end: int
+
+    @property
+    def file_name(self) -> str:
+        return f"{self.id.replace('.', '-')}-{slugify(self.title) or 'preamble'}.md"
+
+
+def chunks(template: Template, depth: int = 1) -> list:
+    """Cut the template into chunks at sections of ``depth``.
+
+    Sections at ``depth`` (or leaf sections above it) become one chunk with
+    their subsections; shallower sections contribute their own text up to
+    their first subsection. Concatenating the chunks in order reproduces the
+    template exactly.
+    """
+    result = []
+
+    def visit(section: Section):
+        if section.depth >= depth or not section.children:
+            result.append(Chunk(section.id, section.title, section.start, section.end))
+            return
+        if section.body_end > section.start or section is template.root:
+            result.append(Chunk(section.id, section.title, section.start, section.body_end))
+        for child in section.children:
+            visit(child)
+
+    visit(template.root)
+    return [chunk for chunk in result if chunk.end > chunk.start]
+
+
+def sections_dir(project_dir: Path, template: Template) -> Path:
+    """Where generated chunks of ``template`` are stored for a project."""
+    return Path(project_dir) / SECTIONS_DIR / artifact_name(template).removesuffix(".md")
+
+
+@dataclass
+class MergeResult:
+    path: Path
+    chunks: int
+    bytes_written: int
+    warnings: list = field(default_factory=list)
+
+
+def merge_chunks(template: Template, chunk_dir: Path, destination: Path, depth: int = 1) -> MergeResult:
+    """Stitch generated chunk files into ``destination`` atomically.
+
+    Every chunk of the plan must exist; the error lists the missing ones so
+    only they need generating again. A chunk that does not start with its
+    template heading is merged but reported as a warning.
+    """
+    plan = chunks(template, depth)
+    chunk_dir = Path(chunk_dir)
+    missing = [chunk for chunk in plan if not (chunk_dir / chunk.file_name).is_file()]
+    if missing:
+        raise TemplateError("missing sections: " + ", ".join(f"{c.id} ({c.file_name})" for c in missing))
+
+    parts = []
+    warnings = []
+    for chunk in plan:
+        text = (chunk_dir / chunk.file_name).read_text(encoding="utf-8")
+        expected = template.lines[chunk.start]
+        if chunk.title and not text.lstrip().startswith(expected.strip()):
+            warnings.append(f"{chunk.file_name} does not start with '{expected.strip()}'")
+        if not text.endswith("\n"):
+            text += "\n"
+        if parts and not parts[-1].endswith("\n\n") and not text.startswith("\n"):
+            text = "\n" + text
+        parts.append(text)
+
+    content = "".join(parts).encode("utf-8")
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, destination)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return MergeResult(destination, len(plan), len(content), warnings)
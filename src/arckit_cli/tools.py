@@ -0,0 +1,14 @@
+"""Detection of external tools used by ArcKit."""
+
+import shutil
+from pathlib import Path
+
+
+def check_tool(tool: str) -> bool:
+    """Check if a tool is installed."""
+    # Special handling for Claude CLI
+    claude_local_path = Path.home() / ".claude" / "local" / "claude"
+    if tool == "claude" and claude_local_path.exists() and claude_local_path.is_file():
+        return True
+
+    return shutil.which(tool) is not None
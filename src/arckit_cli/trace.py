@@ -0,0 +1,279 @@
+"""Requirements traceability from requirement IDs found in project markdown.
+
+Every relevant markdown file of a project is walked line by line once,
+with headings taken from the :mod:`~arckit_cli.mdcache` structure, building
+an inverted index from requirement ID (``BR-1``, ``FR-001``,
+``NFR-SEC-2``, ``INT-1``) to the ``(file, heading, line)`` locations that
+mention it. Requirements are the IDs defined in ``requirements.md``
+headings; coverage is judged from where else they are referenced.
+
+Work is linear in the size of the scanned corpus and nothing is sent to an
+LLM.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .profiling import traced
+from .publish import is_bundle
+
+REQUIREMENT_ID_RE = re.compile(r"\b(?:BR|FR|INT|NFR(?:-[A-Z]{1,4})?)-\d+\b")
+PREFIX_ORDER = {"BR": 0, "FR": 1, "NFR": 2, "INT": 3}
+
+REQUIREMENTS_FILE = "requirements.md"
+
+# Categories referencing requirements, in matrix column order
+CATEGORIES = ["design", "review", "backlog", "sow", "vendor"]
+DESIGN_CATEGORIES = {"design", "review", "vendor"}
+
+COVERED = "covered"
+PARTIAL = "partial"
+GAP = "gap"
+
+
+def classify(relative: str):
+    """Return the trace category of a project file, or None to skip it."""
+    name = relative.rsplit("/", 1)[-1]
+    if not name.endswith(".md") or is_bundle(relative):
+        return None
+    if relative == REQUIREMENTS_FILE:
+        return "requirements"
+    if "review" in name:
+        return "review"
+    if relative in ("backlog.md", "sow.md"):
+        return relative[:-3]
+    if relative.startswith("final/") or name.startswith(("hld", "dld")):
+        return "design"
+    if relative.startswith("vendors/"):
+        return "vendor"
+    return None
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """Where a requirement ID appears."""
+
+    file: str
+    heading: str
+    line: int
+    category: str
+
+
+@dataclass
+class Requirement:
+    """A requirement defined in requirements.md and where it is referenced."""
+
+    id: str
+    title: str = ""
+    defined_at: Occurrence = None
+    references: list = field(default_factory=list)
+
+    @property
+    def categories(self) -> set:
+        return {reference.category for reference in self.references}
+
+    @property
+    def status(self) -> str:
+        if not self.references:
+            return GAP
+        if self.categories & DESIGN_CATEGORIES:
+            return COVERED
+        return PARTIAL
+
+
+@dataclass
+class TraceIndex:
+    """Requirement definitions and references for one project."""
+
+    project: str
+    requirements: dict = field(default_factory=dict)
+    # IDs referenced outside requirements.md but never defined
+    orphans: dict = field(default_factory=dict)
+    files_scanned: int = 0
+    bytes_scanned: int = 0
+
+    def sorted_requirements(self) -> list:
+        return [self.requirements[key] for key in sorted(self.requirements, key=id_sort_key)]
+
+    def summary(self) -> dict:
+        counts = {COVERED: 0, PARTIAL: 0, GAP: 0}
+        for requirement in self.requirements.values():
+            counts[requirement.status] += 1
+        total = len(self.requirements)
+        return {
+            "requirements": total,
+            **counts,
+            "coverage_percentage": round(counts[COVERED] * 100 / total) if total else 0,
+            "orphans": len(self.orphans),
+            "files_scanned": self.files_scanned,
+            "bytes_scanned": self.bytes_scanned,
+        }
+
+
+def id_sort_key(requirement_id: str):
+    parts = requirement_id.split("-")
+    return (PREFIX_ORDER.get(parts[0], 9), "-".join(parts[1:-1]), int(parts[-1]))
+
+
+def scan_document(document, file: str, category: str):
+    """Yield ``(id, occurrence, heading_title)`` for every ID in an :class:`~arckit_cli.mdcache.Document`.
+
+    ``heading_title`` is the heading text when the ID appears in a heading,
+    else None.
+    """
+    for number, line, section, _ in document.lines():
+        if "-" not in line:
+            continue
+        heading = section.title
+        title = heading if section.level and number == section.line else None
+        for requirement_id in REQUIREMENT_ID_RE.findall(line):
+            yield requirement_id, Occurrence(file, heading, number, category), title
+
+
+def project_files(project_dir: Path):
+    """Yield ``(relative path, category)`` for the project files to scan."""
+    for directory, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        relative_dir = os.path.relpath(directory, project_dir)
+        prefix = "" if relative_dir == "." else relative_dir.replace(os.sep, "/") + "/"
+        for filename in sorted(filenames):
+            category = classify(prefix + filename)
+            if category:
+                yield prefix + filename, category
+
+
+@traced("trace.build_index")
+def build_index(project_dir: Path, cache=None) -> TraceIndex:
+    """Scan every relevant file of a project into a :class:`TraceIndex`.
+
+    ``cache`` is the :class:`~arckit_cli.mdcache.MdCache` to read files
+    through; commands pass ``MdCache.for_repo(repo_root)``.
+    """
+    from .mdcache import MdCache
+
+    project_dir = Path(project_dir)
+    cache = cache or MdCache()
+    index = TraceIndex(project=project_dir.name)
+    mentioned = {}
+    references = {}
+
+    for relative, category in project_files(project_dir):
+        index.files_scanned += 1
+        document = cache.load(project_dir / relative)
+        index.bytes_scanned += document.size
+        for requirement_id, occurrence, title in scan_document(document, relative, category):
+            if category == "requirements":
+                if title is not None and requirement_id not in index.requirements:
+                    name = title.split(requirement_id, 1)[-1].lstrip(" :-–—").strip()
+                    index.requirements[requirement_id] = Requirement(requirement_id, name, occurrence)
+                mentioned.setdefault(requirement_id, occurrence)
+            else:
+                references.setdefault(requirement_id, []).append(occurrence)
+
+    # Requirements documents that list IDs in tables rather than headings
+    if not index.requirements:
+        for requirement_id, occurrence in mentioned.items():
+            index.requirements[requirement_id] = Requirement(requirement_id, "", occurrence)
+
+    for requirement_id, occurrences in references.items():
+        if requirement_id in index.requirements:
+            index.requirements[requirement_id].references = occurrences
+        elif requirement_id not in mentioned:
+            index.orphans[requirement_id] = occurrences
+    cache.save()
+    return index
+
+
+STATUS_LABELS = {COVERED: "✅ Covered", PARTIAL: "⚠️ Partial", GAP: "❌ Gap"}
+
+
+def _cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+def _locations(occurrences, limit: int = 3) -> str:
+    files = []
+    for occurrence in occurrences:
+        location = f"{occurrence.file}:{occurrence.line}"
+        if location not in files:
+            files.append(location)
+    shown = ", ".join(files[:limit])
+    return f"{shown} (+{len(files) - limit})" if len(files) > limit else shown
+
+
+def render_markdown(index: TraceIndex, gaps_only: bool = False) -> str:
+    """Render the traceability matrix, coverage gaps and orphans as markdown."""
+    summary = index.summary()
+    out = [
+        f"# Traceability Matrix: {index.project}",
+        "",
+        f"- Requirements: {summary['requirements']}",
+        f"- Covered: {summary[COVERED]} ({summary['coverage_percentage']}%)",
+        f"- Partial: {summary[PARTIAL]}",
+        f"- Gaps: {summary[GAP]}",
+        f"- Orphan references: {summary['orphans']}",
+        "",
+    ]
+    requirements = index.sorted_requirements()
+    if not gaps_only:
+        out += [
+            "## Matrix",
+            "",
+            "| ID | Requirement | " + " | ".join(c.upper() if c == "sow" else c.title() for c in CATEGORIES) + " | Status |",
+            "|----|-------------|" + "|".join("-" * (len(c) + 2) for c in CATEGORIES) + "|--------|",
+        ]
+        for requirement in requirements:
+            cells = []
+            for category in CATEGORIES:
+                hits = [r for r in requirement.references if r.category == category]
+                cells.append(_cell(_locations(hits)) if hits else "-")
+            out.append(f"| {requirement.id} | {_cell(requirement.title)} | {' | '.join(cells)} "
+                       f"| {STATUS_LABELS[requirement.status]} |")
+        out.append("")
+
+    out += ["## Coverage Gaps", ""]
+    gaps = [r for r in requirements if r.status != COVERED]
+    if gaps:
+        out += ["| ID | Requirement | Status | Referenced In |", "|----|-------------|--------|---------------|"]
+        for requirement in gaps:
+            out.append(f"| {requirement.id} | {_cell(requirement.title)} | {STATUS_LABELS[requirement.status]} "
+                       f"| {_cell(_locations(requirement.references)) or '-'} |")
+    else:
+        out.append("No gaps: every requirement is referenced by a design, review or vendor document.")
+    out.append("")
+
+    if index.orphans:
+        out += ["## Orphan References", "",
+                "IDs referenced in project documents but not defined in requirements.md:", ""]
+        for requirement_id in sorted(index.orphans, key=id_sort_key):
+            out.append(f"- **{requirement_id}**: {_locations(index.orphans[requirement_id])}")
+        out.append("")
+    return "\n".join(out)
+
+
+def _occurrence_json(occurrence: Occurrence) -> dict:
+    return {"file": occurrence.file, "heading": occurrence.heading, "line": occurrence.line,
+            "category": occurrence.category}
+
+
+def to_json(index: TraceIndex) -> dict:
+    return {
+        "project": index.project,
+        "summary": index.summary(),
+        "requirements": [
+            {
+                "id": requirement.id,
+                "title": requirement.title,
+                "status": requirement.status,
+                "defined_at": _occurrence_json(requirement.defined_at),
+                "references": [_occurrence_json(r) for r in requirement.references],
+            }
+            for requirement in index.sorted_requirements()
+        ],
+        "orphans": {
+            requirement_id: [_occurrence_json(r) for r in index.orphans[requirement_id]]
+            for requirement_id in sorted(index.orphans, key=id_sort_key)
+        },
+    }
@@ -0,0 +1,35 @@
+"""Console output helpers shared by ArcKit commands."""
+
+from rich.console import Console
+
+BANNER = """
+ █████╗ ██████╗  ██████╗██╗  ██╗██╗████████╗
+██╔══██╗██╔══██╗██╔════╝██║ ██╔╝██║╚══██╔══╝
+███████║██████╔╝██║     █████╔╝ ██║   ██║
+██╔══██║██╔══██╗██║     ██╔═██╗ ██║   ██║
+██║  ██║██║  ██║╚██████╗██║  ██╗██║   ██║
+╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝╚═╝  ╚═╝╚═╝   ╚═╝
+"""
+
+TAGLINE = "Enterprise Architecture Governance & Vendor Procurement"
+
+console = Console()
+err_console = Console(stderr=True)
+
+
+def show_banner():
+    """Display the ASCII art banner."""
+    from rich.align import Align
+    from rich.text import Text
+
+    banner_lines = BANNER.strip().split('\n')
+    colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
+
+    styled_banner = Text()
+    for i, line in enumerate(banner_lines):
+        color = colors[i % len(colors)]
+        styled_banner.append(line + "\n", style=color)
+
+    console.print(Align.center(styled_banner))
+    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    console.print()
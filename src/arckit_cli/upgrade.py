@@ -0,0 +1,195 @@
+"""Three-way upgrade of installed ArcKit assets.
+
+Each project's ``.arckit/install-manifest.json`` records what was installed
+(the *base*); the bundled assets are the *new* version; the files on disk are
+the *local* version. Comparing the three gives, per file:
+
+- ``add``: new upstream and not present locally
+- ``update``: changed upstream and untouched locally
+- ``remove``: dropped upstream and untouched locally
+- ``conflict``: changed upstream and edited locally; the local file is kept
+  and the new version is written beside it as ``<file>.arckit-new``
+- ``keep``: deleted locally, or edited locally and dropped upstream; left alone
+
+Only files whose upstream content changed are read from disk, so planning a
+project that is already current costs one manifest read.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import AGENT_CONFIG
+from .installer import MANIFEST_FILE, ManifestEntry, file_sha256, install, read_manifest, write_manifest
+from .profiling import traced
+
+CONFLICT_SUFFIX = ".arckit-new"
+ACTIONS = ("add", "update", "remove", "conflict", "keep")
+
+
+class UpgradeError(RuntimeError):
+    """Raised when a project cannot be upgraded."""
+
+
+@dataclass
+class Change:
+    action: str
+    path: str
+
+
+@dataclass
+class UpgradeReport:
+    """Planned or applied changes for one project."""
+
+    path: Path
+    ai: str = None
+    has_manifest: bool = True
+    changes: list = field(default_factory=list)
+    unchanged: int = 0
+    error: str = None
+    elapsed: float = 0.0
+
+    def counts(self) -> dict:
+        counts = dict.fromkeys(ACTIONS, 0)
+        for change in self.changes:
+            counts[change.action] += 1
+        return counts
+
+    def to_json(self) -> dict:
+        return {
+            "path": str(self.path),
+            "ai": self.ai,
+            "has_manifest": self.has_manifest,
+            "counts": {**self.counts(), "unchanged": self.unchanged},
+            "changes": [{"action": c.action, "path": c.path} for c in self.changes],
+            "error": self.error,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+        }
+
+
+def detect_ai(project_path: Path, installed: dict) -> str:
+    """The assistant a project was set up for, from its manifest or folders."""
+    for ai, config in AGENT_CONFIG.items():
+        prefix = f"{config['folder']}commands/"
+        if any(path.startswith(prefix) for path in installed):
+            return ai
+    for ai, config in AGENT_CONFIG.items():
+        if (project_path / config["folder"] / "commands").is_dir():
+            return ai
+    raise UpgradeError(f"cannot tell which AI assistant {project_path} uses (pass --ai)")
+
+
+def _matches(path: Path, size: int, sha256: str) -> bool:
+    try:
+        if path.stat().st_size != size:
+            return False
+    except FileNotFoundError:
+        return False
+    return file_sha256(path) == sha256
+
+
+def plan(project_path: Path, installed: dict, entries: list) -> tuple:
+    """Compare base, new and local versions; return ``(changes, unchanged)``."""
+    changes = []
+    unchanged = 0
+    new = {entry.path: entry for entry in entries}
+    for path in sorted(set(installed) | set(new)):
+        base = installed.get(path)
+        entry = new.get(path)
+        if base and entry and base["sha256"] == entry.sha256:
+            unchanged += 1
+            continue
+        local = project_path / path
+        if entry is None:
+            if not local.exists():
+                continue
+            action = "remove" if _matches(local, base["size"], base["sha256"]) else "keep"
+        elif not local.exists():
+            action = "keep" if base else "add"
+        elif _matches(local, entry.size, entry.sha256):
+            action = None
+        elif base and _matches(local, base["size"], base["sha256"]):
+            action = "update"
+        else:
+            action = "conflict"
+        if action:
+            changes.append(Change(action, path))
+        else:
+            unchanged += 1
+    return changes, unchanged
+
+
+def apply(project_path: Path, changes: list, entries: list, contents: dict = None):
+    """Carry out planned changes and record ``entries`` as the new base."""
+    new = {entry.path: entry for entry in entries}
+    writes = [new[c.path] for c in changes if c.action in ("add", "update")]
+    writes += [ManifestEntry(c.path + CONFLICT_SUFFIX, new[c.path].source, new[c.path].size, new[c.path].sha256)
+               for c in changes if c.action == "conflict"]
+    if contents is not None:
+        contents = {**contents, **{c.path + CONFLICT_SUFFIX: contents[c.path]
+                                   for c in changes if c.action == "conflict" and c.path in contents}}
+    install(writes, project_path, workers=4, contents=contents)
+    for change in changes:
+        if change.action == "remove":
+            (project_path / change.path).unlink(missing_ok=True)
+    write_manifest(entries, project_path / MANIFEST_FILE)
+
+
+@traced("upgrade.project")
+def upgrade_project(project_path: Path, assets: dict, ai: str = None, dry_run: bool = False,
+                    contents: dict = None) -> UpgradeReport:
+    """Plan, and unless ``dry_run`` apply, the upgrade of one project.
+
+    ``assets`` maps an AI assistant to its bundled manifest entries.
+    """
+    start = time.perf_counter()
+    project_path = Path(project_path).resolve()
+    report = UpgradeReport(project_path)
+    try:
+        if not project_path.is_dir():
+            raise UpgradeError(f"{project_path} is not a directory")
+        manifest_path = project_path / MANIFEST_FILE
+        report.has_manifest = manifest_path.exists()
+        installed = read_manifest(manifest_path)
+        if not report.has_manifest and not (project_path / ".arckit").is_dir():
+            raise UpgradeError(f"{project_path} is not an ArcKit project (no .arckit directory)")
+        report.ai = ai or detect_ai(project_path, installed)
+        entries = assets[report.ai]
+        report.changes, report.unchanged = plan(project_path, installed, entries)
+        if not dry_run:
+            apply(project_path, report.changes, entries, contents)
+    except (UpgradeError, OSError, ValueError) as e:
+        report.error = str(e)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def upgrade_projects(paths, data_paths: dict, ai: str = None, dry_run: bool = False, jobs: int = None,
+                     on_result=None) -> list:
+    """Upgrade many projects concurrently; reports are returned in input order.
+
+    Bundled assets are hashed, and for a real upgrade read, once for all
+    projects. ``on_result`` is called with each report, in input order.
+    """
+    from .installer import build_manifest, default_workers, load_contents
+    from .scaffold import asset_groups
+
+    assets = {name: build_manifest((src, pattern, prefix) for _, src, pattern, prefix in asset_groups(data_paths, name))
+              for name in ([ai] if ai else AGENT_CONFIG)}
+    contents = None
+    if not dry_run:
+        contents = {}
+        for entries in assets.values():
+            contents.update(load_contents(entry for entry in entries if entry.path not in contents))
+
+    paths = list(paths)
+    jobs = max(1, min(jobs or default_workers(), len(paths) or 1))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(upgrade_project, path, assets, ai, dry_run, contents) for path in paths]
+        reports = []
+        for future in futures:
+            reports.append(future.result())
+            if on_result:
+                on_result(reports[-1])
+    return reports
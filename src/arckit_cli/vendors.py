@@ -0,0 +1,560 @@
+"""Vendor proposal corpora and deterministic criterion coverage scoring.
+
+``projects/NNN/vendors/<vendor>/`` holds each supplier's response as
+markdown or plain text. :func:`ingest` extracts every proposal file once,
+in a process pool with memory-mapped reads, into a per-vendor corpus cached
+in ``.arckit/cache/vendors/<project>/<vendor>.json``: text, sections,
+section terms and the requirement IDs cited. Files are only read again when
+their size or mtime changed.
+
+:func:`score` matches each evaluation subcriterion (``1.1 Architecture
+Quality``, 10 points...) against every vendor's corpus: keyword coverage of
+the best-matching section, and coverage of the requirement IDs relevant to
+the criterion. Cells with clear strong or weak evidence are settled; the
+middle band is marked ambiguous, so only those need an evaluator or an LLM
+to read the proposal.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .trace import REQUIREMENT_ID_RE, id_sort_key
+
+CACHE_DIR = ".arckit/cache/vendors"
+CORPUS_VERSION = 3
+PROPOSAL_SUFFIXES = (".md", ".txt")
+# ArcKit's own assessments of a vendor are not part of the vendor's response
+EXCLUDED_NAMES = ("review", "scoring", "evaluation")
+CRITERIA_FILE = "evaluation-criteria.md"
+CRITERIA_TEMPLATE = "evaluation-criteria-template.md"
+
+# Plain-text proposals: "3.2 Security Approach" style numbered headings
+TXT_HEADING_RE = re.compile(rb"^(\d+(?:\.\d+)*)\.?\s+([A-Z][^.!?]{2,80})$")
+WORD_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+CATEGORY_RE = re.compile(r"^#{2,4}\s+.*?Category\s+\d+:\s*(.+?)\s*(?:\((\d+)\s*points?\))?\s*$", re.I)
+CRITERION_RE = re.compile(r"^\|\s*\**\s*(\d+\.\d+)\s+([^|*]+?)\s*\**\s*\|\s*(\d+)\s*\|([^|]*)\|")
+
+STOPWORDS = frozenset("""
+    and are any approach been but can clear does for from has have how into its not our proposed the their
+    there these they this those use used using was what when where which while who will with would your
+    all also appropriate etc well
+    project vendor vendors
+""".split())
+
+# Requirement ID families and the criterion words they evidence
+REQUIREMENT_FAMILIES = {
+    "NFR-SEC": "security", "NFR-P": "performance", "NFR-S": "scalability", "NFR-A": "availability",
+    "NFR-C": "compliance", "NFR-I": "integration", "INT": "integration", "NFR-U": "usability",
+    "NFR-M": "maintainability", "NFR-Q": "quality",
+}
+
+STRONG = "strong"
+WEAK = "weak"
+AMBIGUOUS = "ambiguous"
+# Combined coverage at or above HIGH is strong evidence, at or below LOW weak
+HIGH = 0.6
+LOW = 0.25
+# Keyword and requirement evidence further apart than this need a human look
+DISAGREEMENT = 0.5
+
+
+class VendorError(ValueError):
+    """Raised when vendors or evaluation criteria cannot be found."""
+
+
+def term(word: str) -> str:
+    """Crudely normalise a lowercase word: ``risks`` -> ``risk``, ``identified`` -> ``identify``."""
+    if len(word) > 4:
+        if word.endswith(("ies", "ied")):
+            return word[:-3] + "y"
+        if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            return word[:-1]
+    if len(word) > 5:
+        if word.endswith("ing"):
+            return word[:-3]
+        if word.endswith("ed"):
+            return word[:-2]
+    return word
+
+
+def terms(text: str) -> set:
+    return {term(word) for word in WORD_RE.findall(text.lower()) if word not in STOPWORDS}
+
+
+# Too common in requirement titles to tie one to a criterion
+GENERIC_TERMS = frozenset(term(word) for word in """
+    approach data experience expertise management quality requirement service solution system technology user
+""".split())
+
+
+# --- ingestion ---------------------------------------------------------------
+
+def vendor_dirs(project_dir: Path) -> list:
+    root = Path(project_dir) / "vendors"
+    if not root.is_dir():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+
+def proposal_files(vendor_dir: Path):
+    """Yield ``(relative path, absolute path, stat)`` for a vendor's proposal files."""
+    for directory, dirnames, filenames in os.walk(vendor_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        relative_dir = os.path.relpath(directory, vendor_dir)
+        prefix = "" if relative_dir == "." else relative_dir.replace(os.sep, "/") + "/"
+        for filename in sorted(filenames):
+            lower = filename.lower()
+            if filename.startswith(".") or not lower.endswith(PROPOSAL_SUFFIXES):
+                continue
+            if any(marker in lower for marker in EXCLUDED_NAMES):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            yield prefix + filename, path, stat
+
+
+def _markdown_sections(data: bytes) -> list:
+    """``(heading, line, text)`` for each :mod:`~arckit_cli.mdcache` section, heading line included."""
+    from .mdcache import parse
+
+    sections, start = [], 0
+    for _, title, _, line, _, _, end, _ in parse(data):
+        sections.append((title, line, data[start:end]))
+        start = end
+    return sections
+
+
+def _text_sections(lines) -> list:
+    """``(heading, line, text)`` for a plain-text proposal, split at numbered headings."""
+    sections = [("", 1, [])]
+    in_fence = False
+    for number, raw in enumerate(lines, start=1):
+        stripped = raw.strip()
+        if stripped.startswith((b"```", b"~~~")):
+            in_fence = not in_fence
+        elif not in_fence and stripped:
+            match = TXT_HEADING_RE.match(stripped)
+            if match:
+                sections.append((match.group(2).decode("utf-8", "replace"), number, []))
+        sections[-1][2].append(raw)
+    return [(heading, line, b"".join(text)) for heading, line, text in sections]
+
+
+def extract(path: str) -> dict:
+    """Read one proposal file through mmap into sections and cited IDs.
+
+    Runs in a worker process, so it takes and returns plain picklable data.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            sections = []
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+                if path.lower().endswith(".txt"):
+                    sections = _text_sections(iter(data.readline, b""))
+                else:
+                    sections = _markdown_sections(data[:])
+
+    result = []
+    ids = set()
+    for heading, line, text in sections:
+        body = text.decode("utf-8", "replace")
+        if not body.strip():
+            continue
+        found = set(REQUIREMENT_ID_RE.findall(body))
+        ids |= found
+        result.append({"heading": heading, "line": line, "terms": sorted(terms(body)),
+                       "ids": sorted(found, key=id_sort_key)})
+    return {"sha256": digest.hexdigest(), "sections": result, "ids": sorted(ids, key=id_sort_key)}
+
+
+def try_extract(path: str) -> dict:
+    """``extract``, returning ``{"error": ...}`` for a file that cannot be read."""
+    try:
+        return extract(path)
+    except (OSError, ValueError) as e:
+        return {"error": e.strerror if isinstance(e, OSError) and e.strerror else str(e)}
+
+
+@dataclass
+class Corpus:
+    """Everything extracted from one vendor's proposal files."""
+
+    vendor: str
+    files: list = field(default_factory=list)
+
+    @property
+    def bytes(self) -> int:
+        return sum(entry["size"] for entry in self.files)
+
+    @property
+    def ids(self) -> set:
+        return {i for entry in self.files for i in entry["ids"]}
+
+    def sections(self):
+        """Yield ``(file, section)`` for every section of every file."""
+        for entry in self.files:
+            for section in entry["sections"]:
+                yield entry["path"], section
+
+    def to_json(self) -> dict:
+        return {"version": CORPUS_VERSION, "vendor": self.vendor, "files": self.files}
+
+
+def cache_path(repo_root: Path, project_dir: Path, vendor: str) -> Path:
+    return Path(repo_root) / CACHE_DIR / Path(project_dir).name / f"{vendor}.json"
+
+
+def load_corpus(path: Path, vendor: str) -> Corpus:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return Corpus(vendor)
+    if data.get("version") != CORPUS_VERSION:
+        return Corpus(vendor)
+    return Corpus(vendor, data.get("files", []))
+
+
+def save_corpus(path: Path, corpus: Corpus):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(corpus.to_json()), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+@dataclass
+class IngestStats:
+    vendors: int = 0
+    files: int = 0
+    extracted: int = 0
+    bytes_read: int = 0
+    elapsed: float = 0.0
+    # (vendor/path, reason) for files that vanished or could not be read
+    skipped: list = field(default_factory=list)
+
+
+def ingest(project_dir: Path, repo_root: Path, jobs: int = None, rebuild: bool = False):
+    """Bring every vendor corpus of a project up to date.
+
+    Returns ``({vendor: Corpus}, IngestStats)``. Unchanged files are taken
+    from the cache; the rest are extracted in parallel across vendors. A
+    file that cannot be read is left out of its corpus and listed in
+    ``stats.skipped`` rather than failing the whole ingest.
+    """
+    import time
+
+    start = time.perf_counter()
+    stats = IngestStats()
+    corpora = {}
+    pending = []
+    for vendor_dir in vendor_dirs(project_dir):
+        vendor = vendor_dir.name
+        cached = {} if rebuild else {
+            entry["path"]: entry for entry in load_corpus(cache_path(repo_root, project_dir, vendor), vendor).files
+        }
+        corpus = corpora[vendor] = Corpus(vendor)
+        for relative, absolute, stat in proposal_files(vendor_dir):
+            entry = cached.get(relative)
+            if entry and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                corpus.files.append(entry)
+            else:
+                entry = {"path": relative, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                corpus.files.append(entry)
+                pending.append((corpus, entry, absolute))
+        stats.vendors += 1
+        stats.files += len(corpus.files)
+
+    if pending:
+        paths = [absolute for _, _, absolute in pending]
+        jobs = jobs or os.cpu_count() or 1
+        # Process start-up only pays off for more than a handful of files
+        if jobs > 1 and len(pending) > 4:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+                results = list(pool.map(try_extract, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+        else:
+            results = [try_extract(path) for path in paths]
+        changed = set()
+        for (corpus, entry, _), result in zip(pending, results):
+            changed.add(corpus.vendor)
+            if "error" in result:
+                corpus.files.remove(entry)
+                stats.skipped.append((f"{corpus.vendor}/{entry['path']}", result["error"]))
+                continue
+            entry.update(result)
+            stats.bytes_read += entry["size"]
+            stats.extracted += 1
+        stats.files -= len(stats.skipped)
+        for vendor in changed:
+            save_corpus(cache_path(repo_root, project_dir, vendor), corpora[vendor])
+
+    for vendor, corpus in corpora.items():
+        path = cache_path(repo_root, project_dir, vendor)
+        if not corpus.files and path.exists():
+            path.unlink(missing_ok=True)
+
+    stats.elapsed = time.perf_counter() - start
+    return corpora, stats
+
+
+# --- criteria ----------------------------------------------------------------
+
+@dataclass
+class Criterion:
+    """A scored subcriterion, e.g. ``1.4 Security & Compliance`` worth 6 points."""
+
+    id: str
+    name: str
+    points: int
+    category: str = ""
+    questions: list = field(default_factory=list)
+
+    @property
+    def name_terms(self) -> set:
+        return terms(self.name)
+
+    @property
+    def question_terms(self) -> set:
+        return terms(" ".join(self.questions)) - self.name_terms
+
+
+def parse_criteria(text: str) -> list:
+    """Subcriteria rows (``| **1.1 Name** | 10 | questions |``) with their category."""
+    criteria = {}
+    category = ""
+    for line in text.splitlines():
+        if line.startswith("#"):
+            match = CATEGORY_RE.match(line)
+            if match:
+                category = match.group(1).strip()
+            continue
+        if not line.startswith("|"):
+            continue
+        match = CRITERION_RE.match(line)
+        if match and match.group(1) not in criteria:
+            questions = [q.strip(" •*") for q in re.split(r"<br\s*/?>", match.group(4))]
+            criteria[match.group(1)] = Criterion(match.group(1), match.group(2).strip(), int(match.group(3)),
+                                                 category, [q for q in questions if q])
+    return list(criteria.values())
+
+
+def load_criteria(project_dir: Path, repo_root: Path):
+    """Criteria from the project's evaluation criteria, else the template's defaults.
+
+    Returns ``(criteria, source path)``.
+    """
+    from .template import find_template
+
+    candidates = [Path(project_dir) / CRITERIA_FILE, find_template(CRITERIA_TEMPLATE, repo_root)]
+    for path in candidates:
+        if path and path.is_file():
+            criteria = parse_criteria(path.read_text(encoding="utf-8", errors="replace"))
+            if criteria:
+                return criteria, path
+    raise VendorError(f"no evaluation subcriteria found in {CRITERIA_FILE} or {CRITERIA_TEMPLATE}")
+
+
+def relevant_requirements(criterion: Criterion, requirements: dict) -> list:
+    """Requirement IDs a criterion should see addressed.
+
+    A requirement is relevant when its title shares a word with the
+    criterion name, or its ID family (``NFR-SEC``) maps to one; a criterion
+    about requirements themselves covers all of them.
+    """
+    names = criterion.name_terms
+    if "requirement" in names:
+        return sorted(requirements, key=id_sort_key)
+    specific = names - GENERIC_TERMS
+    relevant = []
+    for requirement_id, requirement in requirements.items():
+        family = REQUIREMENT_FAMILIES.get(requirement_id.rsplit("-", 1)[0])
+        if (family and term(family) in names) or terms(requirement.title) & specific:
+            relevant.append(requirement_id)
+    return sorted(relevant, key=id_sort_key)
+
+
+# --- scoring -----------------------------------------------------------------
+
+@dataclass
+class Cell:
+    """Evidence for one criterion in one vendor's proposal."""
+
+    vendor: str
+    criterion: str
+    keyword_coverage: float
+    requirement_coverage: float = None
+    coverage: float = 0.0
+    status: str = WEAK
+    evidence: str = ""
+    missing_terms: list = field(default_factory=list)
+    missing_requirements: list = field(default_factory=list)
+    indicative_score: float = 0.0
+
+    def to_json(self) -> dict:
+        return {
+            "criterion": self.criterion,
+            "keyword_coverage": round(self.keyword_coverage, 2),
+            "requirement_coverage": None if self.requirement_coverage is None else round(self.requirement_coverage, 2),
+            "coverage": round(self.coverage, 2),
+            "status": self.status,
+            "indicative_score": self.indicative_score,
+            "evidence": self.evidence,
+            "missing_terms": self.missing_terms,
+            "missing_requirements": self.missing_requirements,
+        }
+
+
+@dataclass
+class ScoreMatrix:
+    project: str
+    criteria: list
+    vendors: list
+    cells: dict = field(default_factory=dict)
+    criteria_source: str = ""
+    requirements: int = 0
+
+    def cell(self, vendor: str, criterion: str) -> Cell:
+        return self.cells[(vendor, criterion)]
+
+    def totals(self) -> dict:
+        return {vendor: round(sum(self.cell(vendor, c.id).indicative_score for c in self.criteria), 1)
+                for vendor in self.vendors}
+
+    def ambiguous(self) -> list:
+        return [cell for cell in self.cells.values() if cell.status == AMBIGUOUS]
+
+
+def _keyword_match(criterion: Criterion, corpus: Corpus):
+    """Weighted share of criterion terms found in the best single section.
+
+    Name terms count twice as much as terms from the evaluation questions,
+    so a section titled "Security and Compliance" beats one that merely
+    mentions encryption.
+    """
+    names = criterion.name_terms
+    questions = criterion.question_terms
+    total = 2 * len(names) + len(questions)
+    if not total:
+        return 0.0, "", []
+    best = (-1.0, "", names | questions)
+    for file, section in corpus.sections():
+        present = set(section["terms"])
+        matched = 2 * len(names & present) + len(questions & present)
+        if matched > best[0]:
+            where = f"{file}:{section['line']}" + (f" ({section['heading']})" if section["heading"] else "")
+            best = (matched, where, (names | questions) - present)
+    matched, where, missing = best
+    return max(matched, 0) / total, where, sorted(missing)
+
+
+def classify_cell(keyword: float, requirement) -> tuple:
+    """Combine the two signals into ``(coverage, status)``."""
+    coverage = keyword if requirement is None else (keyword + requirement) / 2
+    if requirement is not None and abs(keyword - requirement) > DISAGREEMENT:
+        return coverage, AMBIGUOUS
+    if coverage >= HIGH:
+        return coverage, STRONG
+    if coverage <= LOW:
+        return coverage, WEAK
+    return coverage, AMBIGUOUS
+
+
+def score(project_dir: Path, corpora: dict, criteria: list, requirements: dict = None) -> ScoreMatrix:
+    """Build the criterion-by-vendor coverage matrix."""
+    requirements = requirements or {}
+    matrix = ScoreMatrix(Path(project_dir).name, criteria, sorted(corpora), requirements=len(requirements))
+    relevant = {criterion.id: relevant_requirements(criterion, requirements) for criterion in criteria}
+    for vendor in matrix.vendors:
+        corpus = corpora[vendor]
+        cited = corpus.ids
+        for criterion in criteria:
+            keyword, evidence, missing_terms = _keyword_match(criterion, corpus)
+            wanted = relevant[criterion.id]
+            requirement = len(cited.intersection(wanted)) / len(wanted) if wanted else None
+            coverage, status = classify_cell(keyword, requirement)
+            matrix.cells[(vendor, criterion.id)] = Cell(
+                vendor, criterion.id, keyword, requirement, coverage, status, evidence, missing_terms,
+                [i for i in wanted if i not in cited],
+                round(criterion.points * coverage * 2) / 2,
+            )
+    return matrix
+
+
+STATUS_MARKS = {STRONG: "✅", WEAK: "❌", AMBIGUOUS: "❓"}
+
+
+def render_markdown(matrix: ScoreMatrix) -> str:
+    lines = [
+        f"# Vendor Coverage Matrix: {matrix.project}",
+        "",
+        f"Criteria: `{matrix.criteria_source}` | Vendors: {len(matrix.vendors)} | "
+        f"Requirements: {matrix.requirements} | Ambiguous cells: {len(matrix.ambiguous())}",
+        "",
+        "Coverage is keyword and requirement-ID evidence found in each proposal, not a final score. "
+        f"{STATUS_MARKS[STRONG]} strong, {STATUS_MARKS[WEAK]} weak, "
+        f"{STATUS_MARKS[AMBIGUOUS]} ambiguous (needs evaluator review).",
+        "",
+        "| Criterion | Points | " + " | ".join(matrix.vendors) + " |",
+        "|-----------|--------|" + "|".join("-" * max(len(v) + 2, 5) for v in matrix.vendors) + "|",
+    ]
+    for criterion in matrix.criteria:
+        cells = [matrix.cell(vendor, criterion.id) for vendor in matrix.vendors]
+        lines.append(f"| {criterion.id} {criterion.name} | {criterion.points} | " + " | ".join(
+            f"{STATUS_MARKS[c.status]} {c.coverage:.0%} ({c.indicative_score:g})" for c in cells) + " |")
+    totals = matrix.totals()
+    lines.append(f"| **Indicative total** | **{sum(c.points for c in matrix.criteria)}** | "
+                 + " | ".join(f"**{totals[vendor]:g}**" for vendor in matrix.vendors) + " |")
+
+    ambiguous = matrix.ambiguous()
+    if ambiguous:
+        names = {criterion.id: criterion.name for criterion in matrix.criteria}
+        lines += ["", "## Cells to Review", ""]
+        for cell in sorted(ambiguous, key=lambda c: (c.vendor, [int(p) for p in c.criterion.split(".")])):
+            detail = f"keywords {cell.keyword_coverage:.0%}"
+            if cell.requirement_coverage is not None:
+                detail += f", requirements {cell.requirement_coverage:.0%}"
+            lines.append(f"- **{cell.vendor} / {cell.criterion} {names[cell.criterion]}** ({detail}): "
+                         f"best match {cell.evidence or 'none'}")
+            if cell.missing_requirements:
+                lines.append(f"  - Requirements not cited: {', '.join(cell.missing_requirements[:10])}"
+                             + (" ..." if len(cell.missing_requirements) > 10 else ""))
+            if cell.missing_terms:
+                lines.append(f"  - Terms not found: {', '.join(cell.missing_terms[:10])}")
+    return "\n".join(lines) + "\n"
+
+
+def to_json(matrix: ScoreMatrix) -> dict:
+    return {
+        "project": matrix.project,
+        "criteria_source": matrix.criteria_source,
+        "criteria": [{"id": c.id, "name": c.name, "points": c.points, "category": c.category}
+                     for c in matrix.criteria],
+        "vendors": {
+            vendor: {
+                "indicative_total": matrix.totals()[vendor],
+                "cells": [matrix.cell(vendor, c.id).to_json() for c in matrix.criteria],
+            }
+            for vendor in matrix.vendors
+        },
+        "summary": {
+            "vendors": len(matrix.vendors),
+            "criteria": len(matrix.criteria),
+            "requirements": matrix.requirements,
+            "ambiguous": len(matrix.ambiguous()),
+        },
+    }
@@ -0,0 +1,837 @@
+"""Wardley maps: parse, validate, render and compare without an LLM.
+
+``/arckit.wardley`` writes maps in the OnlineWardleyMaps (OWM) text format
+inside ```` ```wardley ```` fences in ``projects/NNN-*/wardley-maps/*.md``;
+``.owm`` and ``.wardley`` files holding bare map text are read too.
+:func:`parse` turns one map into a :class:`WardleyMap`, whose
+:meth:`~WardleyMap.graph` is a compact index-based component/link graph.
+:func:`check` validates it: syntax, coordinates outside ``[0, 1]``,
+undefined or duplicate components, dependency cycles, orphan components,
+and evolve/pipeline targets.
+
+:func:`render_svg` draws a map as a self-contained SVG with no external
+fonts or scripts, and :class:`RenderCache` keeps rendered maps under
+``.arckit/cache/wardley/`` keyed by a hash of the map text, so re-rendering
+an unchanged map is a file read. :func:`diff` compares two versions of a
+map: components added, removed, renamed or moved (with the evolution
+stage they moved between), links, and evolve targets.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+from .profiling import traced
+
+CACHE_DIR = ".arckit/cache/wardley"
+RENDERER_VERSION = 1  # bump when render_svg output changes, to invalidate cached renders
+MAP_SUFFIXES = (".md", ".owm", ".wardley")
+FENCE_RE = re.compile(r"^\s*```+\s*(wardley|owm)\s*$", re.IGNORECASE)
+FENCE_END_RE = re.compile(r"^\s*```+\s*$")
+
+# Evolution axis: stage boundaries as drawn by OnlineWardleyMaps
+STAGE_BOUNDARIES = (0.174, 0.4, 0.7)
+DEFAULT_STAGES = ("Genesis", "Custom-Built", "Product (+rental)", "Commodity (+utility)")
+DEFAULT_SIZE = (900, 620)
+MOVE_TOLERANCE = 0.005
+
+ELEMENT_KINDS = ("component", "anchor", "market", "ecosystem", "submap")
+DECORATORS = ("build", "buy", "outsource", "inertia", "market", "ecosystem")
+
+NUMBER = r"-?(?:\d+(?:\.\d*)?|\.\d+)"
+COORDS_RE = re.compile(rf"^\s*({NUMBER})\s*,\s*({NUMBER})\s*$")
+ELEMENT_RE = re.compile(rf"^({'|'.join(ELEMENT_KINDS)})\s+(.+?)\s*\[([^\]]*)\](.*)$")
+LABEL_RE = re.compile(rf"\blabel\s*\[\s*({NUMBER})\s*,\s*({NUMBER})\s*\]")
+DECORATOR_RE = re.compile(rf"\(({'|'.join(DECORATORS)})\)")
+LINK_RE = re.compile(r"^(.+?)\s*(->|\+<>|\+<|\+'[^']*'>|\+>)\s*(.+?)\s*(?:;\s*(.*))?$")
+EVOLVE_RE = re.compile(rf"^evolve\s+(.+?)\s+({NUMBER})(?:\s+label\s+(.*))?\s*$")
+PIPELINE_RE = re.compile(r"^pipeline\s+(.+?)\s*(?:\[([^\]]*)\])?\s*(\{)?\s*$")
+PIPELINE_MEMBER_RE = re.compile(rf"^component\s+(.+?)\s*\[\s*({NUMBER})\s*\]")
+ANNOTATION_RE = re.compile(r"^annotation\s+(\d+)\s*(\[\s*\[.*?\]\s*\]|\[[^\]]*\])\s*(.*)$")
+POINT_RE = re.compile(rf"\[\s*({NUMBER})\s*,\s*({NUMBER})\s*\]")
+NOTE_RE = re.compile(r"^note\s+(.+?)\s*\[([^\]]*)\]\s*$")
+MARKER_RE = re.compile(r"^(accelerator|deaccelerator)\s+(.+?)\s*\[([^\]]*)\]")
+PLACEHOLDER_RE = re.compile(r"\{[^}]*\}")
+
+
+class WardleyError(ValueError):
+    """Raised when a map file cannot be read or a map cannot be found in it."""
+
+
+@dataclass(frozen=True, slots=True)
+class Component:
+    """A point on the map: a component, anchor, market, ecosystem or submap."""
+
+    name: str
+    kind: str
+    visibility: float
+    maturity: float
+    line: int
+    decorators: tuple = ()
+    label: tuple = None
+
+
+@dataclass(frozen=True, slots=True)
+class Link:
+    source: str
+    target: str
+    line: int
+    kind: str = "dependency"
+    label: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Evolve:
+    name: str
+    maturity: float
+    line: int
+    new_name: str = None
+    label: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class Pipeline:
+    name: str
+    start: float
+    end: float
+    line: int
+    visibility: float = None
+
+
+@dataclass(frozen=True, slots=True)
+class Note:
+    """A free-text note, numbered annotation (``number``) or accelerator marker (``kind``)."""
+
+    text: str
+    points: tuple
+    line: int
+    number: int = None
+    kind: str = "note"
+
+
+@dataclass(frozen=True)
+class Problem:
+    """One issue found by :func:`check`; ``line`` is relative to the file."""
+
+    level: str
+    code: str
+    line: int
+    message: str
+
+    def to_json(self) -> dict:
+        return {"level": self.level, "code": self.code, "line": self.line, "message": self.message}
+
+
+@dataclass
+class Graph:
+    """Components as indexes into ``names``, dependency links as index pairs."""
+
+    names: tuple
+    edges: tuple
+
+    @cached_property
+    def index(self) -> dict:
+        return {name: i for i, name in enumerate(self.names)}
+
+    @cached_property
+    def successors(self) -> tuple:
+        out = [[] for _ in self.names]
+        for source, target in self.edges:
+            out[source].append(target)
+        return tuple(tuple(targets) for targets in out)
+
+    def cycle_path(self, members) -> list:
+        """A shortest cycle through the first of ``members`` (a strongly connected component)."""
+        members = set(members)
+        start = min(members)
+        previous = {}
+        frontier = [start]
+        while frontier:
+            following = []
+            for node in frontier:
+                for target in self.successors[node]:
+                    if target == start:
+                        path = [node]
+                        while path[-1] != start:
+                            path.append(previous[path[-1]])
+                        return path[::-1]
+                    if target in members and target not in previous:
+                        previous[target] = node
+                        following.append(target)
+            frontier = following
+        return [start]
+
+    def cycles(self) -> list:
+        """Strongly connected components of more than one node, or with a self-link."""
+        index, low, on_stack, stack, found = {}, {}, set(), [], []
+        self_linked = {source for source, target in self.edges if source == target}
+        counter = 0
+        for root in range(len(self.names)):
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                targets = self.successors[node]
+                if child < len(targets):
+                    work.append((node, child + 1))
+                    target = targets[child]
+                    if target not in index:
+                        work.append((target, 0))
+                    elif target in on_stack:
+                        low[node] = min(low[node], index[target])
+                    continue
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    if len(members) > 1 or node in self_linked:
+                        found.append(sorted(members))
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        return found
+
+
+@dataclass
+class WardleyMap:
+    """One parsed map. Line numbers are relative to the file it came from."""
+
+    title: str = ""
+    path: Path = None
+    block: int = 1
+    text: str = ""
+    components: dict = field(default_factory=dict)
+    links: list = field(default_factory=list)
+    evolves: list = field(default_factory=list)
+    pipelines: list = field(default_factory=list)
+    notes: list = field(default_factory=list)
+    decorators: dict = field(default_factory=dict)
+    stages: tuple = DEFAULT_STAGES
+    style: str = "wardley"
+    size: tuple = None
+    legend: tuple = None
+    problems: list = field(default_factory=list)
+    duplicates: list = field(default_factory=list)
+
+    @cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def graph(self) -> Graph:
+        names = tuple(self.components)
+        index = {name: i for i, name in enumerate(names)}
+        edges = tuple((index[link.source], index[link.target]) for link in self.links
+                      if link.kind == "dependency" and link.source in index and link.target in index)
+        return Graph(names, edges)
+
+    @property
+    def label(self) -> str:
+        name = str(self.path) if self.path else "<map>"
+        return f"{name}#{self.block}" if self.block > 1 else name
+
+    def stage(self, maturity: float) -> str:
+        return stage_name(maturity, self.stages)
+
+
+def stage_name(maturity: float, stages=DEFAULT_STAGES) -> str:
+    for boundary, stage in zip(STAGE_BOUNDARIES, stages):
+        if maturity < boundary:
+            return stage
+    return stages[-1]
+
+
+def _coords(text: str, count: int = 2):
+    """Floats from ``"0.5, 0.7"``; ``None`` if the text is not ``count`` numbers."""
+    parts = [part.strip() for part in text.split(",")]
+    if len(parts) != count:
+        return None
+    try:
+        return tuple(float(part) for part in parts)
+    except ValueError:
+        return None
+
+
+def parse(text: str, path: Path = None, block: int = 1, first_line: int = 1) -> WardleyMap:
+    """Parse OWM map text. Unparseable lines become ``syntax`` problems, not exceptions."""
+    wmap = WardleyMap(path=Path(path) if path else None, block=block, text=text)
+    problems = wmap.problems
+    pipeline = None
+    for number, raw in enumerate(text.splitlines(), start=first_line):
+        line = raw.strip()
+        if not line or line.startswith("//"):
+            continue
+        if pipeline is not None:
+            if line == "}":
+                pipeline = None
+                continue
+            match = PIPELINE_MEMBER_RE.match(line)
+            if not match:
+                problems.append(Problem("error", "syntax", number, f"expected 'component Name [maturity]' "
+                                                                   f"in pipeline {pipeline.name}: {line}"))
+                continue
+            name, maturity = match.group(1), float(match.group(2))
+            owner = wmap.components.get(pipeline.name)
+            visibility = owner.visibility if owner else 0.0
+            _add(wmap, Component(name, "component", visibility, maturity, number))
+            continue
+
+        keyword = line.split(None, 1)[0]
+        if keyword == "title":
+            wmap.title = line[5:].strip()
+        elif keyword == "style":
+            wmap.style = line[5:].strip() or "wardley"
+        elif keyword == "size":
+            size = _coords(line[4:].strip().strip("[]"))
+            if size and size[0] > 0 and size[1] > 0:
+                wmap.size = (int(size[0]), int(size[1]))
+            else:
+                problems.append(Problem("error", "syntax", number, f"expected 'size [width, height]': {line}"))
+        elif keyword == "evolution":
+            stages = tuple(stage.strip() for stage in line[9:].split("->") if stage.strip())
+            if len(stages) == 4:
+                wmap.stages = stages
+            else:
+                problems.append(Problem("warning", "syntax", number, f"evolution needs four stages, got {len(stages)}"))
+        elif keyword in ELEMENT_KINDS and ELEMENT_RE.match(line):
+            match = ELEMENT_RE.match(line)
+            kind, name, coords, rest = match.groups()
+            point = _coords(coords)
+            if point is None:
+                if PLACEHOLDER_RE.search(name):
+                    problems.append(Problem("error", "placeholder", number, f"unfilled template placeholder: {line}"))
+                else:
+                    problems.append(Problem("error", "syntax", number,
+                                            f"{kind} {name}: coordinates must be [visibility, evolution], got [{coords}]"))
+                continue
+            label = LABEL_RE.search(rest)
+            decorators = tuple(DECORATOR_RE.findall(rest))
+            _add(wmap, Component(name, kind, point[0], point[1], number, decorators,
+                                 (float(label.group(1)), float(label.group(2))) if label else None))
+        elif keyword == "pipeline":
+            match = PIPELINE_RE.match(line)
+            if not match:
+                problems.append(Problem("error", "syntax", number, f"expected 'pipeline Name [start, end]': {line}"))
+                continue
+            name, coords, brace = match.groups()
+            if coords is None:
+                span = (None, 0.0, 1.0)
+            else:
+                values = _coords(coords, 3) or _coords(coords, 2)
+                if values is None:
+                    problems.append(Problem("error", "syntax", number,
+                                            f"pipeline {name}: expected [start, end] or [visibility, start, end]"))
+                    continue
+                span = values if len(values) == 3 else (None, *values)
+            pipeline_entry = Pipeline(name, span[1], span[2], number, span[0])
+            wmap.pipelines.append(pipeline_entry)
+            if brace:
+                pipeline = pipeline_entry
+        elif keyword == "evolve":
+            match = EVOLVE_RE.match(line)
+            if not match:
+                problems.append(Problem("error", "syntax", number, f"expected 'evolve Name maturity': {line}"))
+                continue
+            name, maturity, label = match.groups()
+            new_name = None
+            if "->" in name:
+                name, new_name = (part.strip() for part in name.split("->", 1))
+            wmap.evolves.append(Evolve(name, float(maturity), number, new_name, label.strip() if label else None))
+        elif keyword == "annotation":
+            match = ANNOTATION_RE.match(line)
+            points = tuple((float(v), float(m)) for v, m in POINT_RE.findall(match.group(2))) if match else ()
+            if not points:
+                problems.append(Problem("error", "syntax", number, f"expected 'annotation N [visibility, evolution] text': {line}"))
+                continue
+            wmap.notes.append(Note(match.group(3).strip(), points, number, int(match.group(1)), "annotation"))
+        elif keyword == "annotations":
+            wmap.legend = _coords(line[11:].strip().strip("[]"))
+        elif keyword == "note":
+            match = NOTE_RE.match(line)
+            point = _coords(match.group(2)) if match else None
+            if point is None:
+                problems.append(Problem("error", "syntax", number, f"expected 'note text [visibility, evolution]': {line}"))
+                continue
+            wmap.notes.append(Note(match.group(1), (point,), number))
+        elif keyword in ("accelerator", "deaccelerator"):
+            match = MARKER_RE.match(line)
+            point = _coords(match.group(3)) if match else None
+            if point is None:
+                problems.append(Problem("error", "syntax", number, f"expected '{keyword} Name [visibility, evolution]'"))
+                continue
+            wmap.notes.append(Note(match.group(2), (point,), number, kind=keyword))
+        elif keyword in ("build", "buy", "outsource") and " " in line and "->" not in line:
+            wmap.decorators.setdefault(line.split(None, 1)[1].strip(), []).append(keyword)
+        elif keyword == "url":
+            continue
+        elif LINK_RE.match(line):
+            source, arrow, target, label = LINK_RE.match(line).groups()
+            if arrow == "->":
+                wmap.links.append(Link(source, target, number, "dependency", label))
+            elif arrow == "+<":
+                wmap.links.append(Link(target, source, number, "flow", label))
+            else:
+                flow_label = arrow[2:-2] if arrow.startswith("+'") else label
+                wmap.links.append(Link(source, target, number, "flow", flow_label))
+        else:
+            problems.append(Problem("error", "syntax", number, f"unrecognised line: {line}"))
+    if pipeline is not None:
+        problems.append(Problem("error", "syntax", pipeline.line, f"pipeline {pipeline.name} is missing its closing '}}'"))
+    return wmap
+
+
+def _add(wmap: WardleyMap, component: Component):
+    previous = wmap.components.get(component.name)
+    if previous is not None:
+        wmap.duplicates.append((previous, component))
+        if previous.kind == "anchor" or component.kind != "component":
+            return
+    wmap.components[component.name] = component
+
+
+def extract(text: str):
+    """Yield ``(first_line, map_text)`` for every ```` ```wardley ```` block of a markdown document."""
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        if FENCE_RE.match(lines[i]):
+            start = i + 1
+            i = start
+            while i < len(lines) and not FENCE_END_RE.match(lines[i]):
+                i += 1
+            yield start + 1, "\n".join(lines[start:i]) + "\n"
+        i += 1
+
+
+def load(path: Path) -> list:
+    """Every map in a markdown or bare map file."""
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise WardleyError(f"cannot read {path}: {e}") from None
+    if path.suffix.lower() != ".md":
+        return [parse(text, path)]
+    return [parse(block, path, number, first_line) for number, (first_line, block) in enumerate(extract(text), start=1)]
+
+
+def find_map_files(paths) -> list:
+    """Map files under ``paths`` (files are taken as given, directories searched)."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found += sorted(p for p in path.rglob("*") if p.suffix.lower() in MAP_SUFFIXES and p.is_file()
+                            and not any(part.startswith(".") for part in p.relative_to(path).parts))
+        elif path.exists():
+            found.append(path)
+        else:
+            raise WardleyError(f"{path} does not exist")
+    return found
+
+
+def workspace_map_files(repo_root: Path) -> list:
+    """Map files in every project's ``wardley-maps/`` directory."""
+    from .workspace import list_project_dirs
+
+    directories = [project / "wardley-maps" for project in list_project_dirs(repo_root)]
+    return find_map_files(directory for directory in directories if directory.is_dir())
+
+
+@traced("wardley.check")
+def check(wmap: WardleyMap) -> list:
+    """Parse problems plus structural problems, sorted by line."""
+    problems = list(wmap.problems)
+
+    def report(level, code, line, message):
+        problems.append(Problem(level, code, line, message))
+
+    def in_range(value):
+        return 0.0 <= value <= 1.0
+
+    for first, second in wmap.duplicates:
+        if {first.kind, second.kind} == {"anchor", "component"}:
+            report("warning", "duplicate", second.line,
+                   f"'{second.name}' is both an anchor and a component (line {first.line})")
+        else:
+            report("error", "duplicate", second.line, f"'{second.name}' is already defined on line {first.line}")
+
+    for component in wmap.components.values():
+        if PLACEHOLDER_RE.search(component.name):
+            report("error", "placeholder", component.line, f"unfilled template placeholder: {component.name}")
+        if not (in_range(component.visibility) and in_range(component.maturity)):
+            report("error", "range", component.line, f"{component.name} [{component.visibility:g}, "
+                                                     f"{component.maturity:g}] is outside the map (0-1)")
+    for note in wmap.notes:
+        for visibility, maturity in note.points:
+            if not (in_range(visibility) and in_range(maturity)):
+                report("warning", "range", note.line, f"{note.kind} at [{visibility:g}, {maturity:g}] is outside the map")
+
+    linked = set()
+    for link in wmap.links:
+        for end in (link.source, link.target):
+            if end not in wmap.components:
+                level, what = ("error", "undefined") if not PLACEHOLDER_RE.search(end) else ("error", "placeholder")
+                report(level, what, link.line, f"link {link.source} -> {link.target}: '{end}' is not defined"
+                       if what == "undefined" else f"unfilled template placeholder: {end}")
+        linked.update((link.source, link.target))
+        source, target = wmap.components.get(link.source), wmap.components.get(link.target)
+        if (link.kind == "dependency" and source and target and source.kind != "anchor"
+                and target.visibility > source.visibility + 0.05):
+            report("warning", "value-chain", link.line,
+                   f"{link.source} ({source.visibility:g}) depends on the more visible {link.target} "
+                   f"({target.visibility:g})")
+
+    graph = wmap.graph
+    for members in graph.cycles():
+        names = [graph.names[i] for i in graph.cycle_path(members)]
+        line = min(wmap.components[graph.names[i]].line for i in members)
+        report("error", "cycle", line, "dependency cycle: " + " -> ".join(names + names[:1]))
+
+    if len(wmap.components) > 1:
+        for component in wmap.components.values():
+            if component.name not in linked:
+                report("warning", "orphan", component.line, f"{component.name} is not linked to anything")
+
+    for evolve in wmap.evolves:
+        component = wmap.components.get(evolve.name)
+        if component is None:
+            report("error", "undefined", evolve.line, f"evolve: '{evolve.name}' is not defined")
+            continue
+        if not in_range(evolve.maturity):
+            report("error", "range", evolve.line, f"evolve {evolve.name} to {evolve.maturity:g} is outside the map")
+        elif evolve.maturity < component.maturity:
+            report("warning", "evolve", evolve.line,
+                   f"{evolve.name} evolves backwards ({component.maturity:g} -> {evolve.maturity:g})")
+        elif evolve.maturity == component.maturity:
+            report("warning", "evolve", evolve.line, f"evolve {evolve.name} does not move it")
+
+    for pipeline in wmap.pipelines:
+        component = wmap.components.get(pipeline.name)
+        if component is None:
+            report("error", "undefined", pipeline.line, f"pipeline: '{pipeline.name}' is not defined")
+        if pipeline.start > pipeline.end:
+            report("error", "pipeline", pipeline.line,
+                   f"pipeline {pipeline.name} starts after it ends ({pipeline.start:g} > {pipeline.end:g})")
+        elif not (in_range(pipeline.start) and in_range(pipeline.end)):
+            report("error", "range", pipeline.line, f"pipeline {pipeline.name} extends outside the map")
+        elif component and not pipeline.start <= component.maturity <= pipeline.end:
+            report("warning", "pipeline", pipeline.line,
+                   f"{pipeline.name} ({component.maturity:g}) lies outside its pipeline "
+                   f"[{pipeline.start:g}, {pipeline.end:g}]")
+
+    for name in wmap.decorators:
+        if name not in wmap.components:
+            report("error", "undefined", 0, f"build/buy/outsource: '{name}' is not defined")
+
+    numbers = {}
+    for note in wmap.notes:
+        if note.number is not None:
+            if note.number in numbers:
+                report("warning", "duplicate", note.line, f"annotation {note.number} already used on line "
+                                                          f"{numbers[note.number]}")
+            numbers.setdefault(note.number, note.line)
+
+    return sorted(problems, key=lambda problem: (problem.line, problem.level != "error"))
+
+
+# Rendering
+
+def _escape(text: str) -> str:
+    return (str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;"))
+
+
+class _Canvas:
+    """Maps [visibility, evolution] to pixels inside the plot area."""
+
+    LEFT, TOP, RIGHT, BOTTOM = 40, 50, 20, 40
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.plot_width = width - self.LEFT - self.RIGHT
+        self.plot_height = height - self.TOP - self.BOTTOM
+
+    def x(self, maturity: float) -> float:
+        return self.LEFT + maturity * self.plot_width
+
+    def y(self, visibility: float) -> float:
+        return self.TOP + (1 - visibility) * self.plot_height
+
+
+@traced("wardley.render")
+def render_svg(wmap: WardleyMap) -> str:
+    """A standalone SVG drawing of the map; identical input gives identical output."""
+    width, height = wmap.size or DEFAULT_SIZE
+    canvas = _Canvas(width, height)
+    x, y = canvas.x, canvas.y
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="Helvetica, Arial, sans-serif" font-size="11">',
+        "<defs><marker id=\"arrow\" viewBox=\"0 0 10 10\" refX=\"9\" refY=\"5\" markerWidth=\"6\" "
+        "markerHeight=\"6\" orient=\"auto-start-reverse\"><path d=\"M0,0 L10,5 L0,10 z\" fill=\"#d0021b\"/>"
+        "</marker></defs>",
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+    ]
+    if wmap.title:
+        out.append(f'<text x="{canvas.LEFT}" y="28" font-size="16" font-weight="bold">{_escape(wmap.title)}</text>')
+
+    # Axes, stage boundaries and labels
+    left, right, top, bottom = x(0), x(1), y(1), y(0)
+    out.append(f'<line x1="{left:.1f}" y1="{top:.1f}" x2="{left:.1f}" y2="{bottom:.1f}" stroke="#000"/>')
+    out.append(f'<line x1="{left:.1f}" y1="{bottom:.1f}" x2="{right:.1f}" y2="{bottom:.1f}" stroke="#000"/>')
+    for boundary in STAGE_BOUNDARIES:
+        out.append(f'<line x1="{x(boundary):.1f}" y1="{top:.1f}" x2="{x(boundary):.1f}" y2="{bottom:.1f}" '
+                   f'stroke="#bbb" stroke-dasharray="4,4"/>')
+    edges = (0.0, *STAGE_BOUNDARIES)
+    for start, stage in zip(edges, wmap.stages):
+        out.append(f'<text x="{x(start) + 4:.1f}" y="{bottom + 16:.1f}">{_escape(stage)}</text>')
+    out.append(f'<text x="{right:.1f}" y="{bottom + 32:.1f}" text-anchor="end" font-weight="bold">Evolution</text>')
+    out.append(f'<text transform="translate({left - 12:.1f},{(top + bottom) / 2:.1f}) rotate(-90)" '
+               f'text-anchor="middle" font-weight="bold">Value Chain</text>')
+    out.append(f'<text transform="translate({left - 12:.1f},{top + 30:.1f}) rotate(-90)" '
+               f'text-anchor="middle" fill="#777">Visible</text>')
+    out.append(f'<text transform="translate({left - 12:.1f},{bottom - 34:.1f}) rotate(-90)" '
+               f'text-anchor="middle" fill="#777">Invisible</text>')
+
+    components = wmap.components
+    # Pipelines under everything else
+    for pipeline in wmap.pipelines:
+        component = components.get(pipeline.name)
+        visibility = pipeline.visibility if pipeline.visibility is not None else (component.visibility if component else None)
+        if visibility is None:
+            continue
+        out.append(f'<rect x="{x(pipeline.start):.1f}" y="{y(visibility) - 12:.1f}" '
+                   f'width="{max(0.0, x(pipeline.end) - x(pipeline.start)):.1f}" height="24" '
+                   f'fill="none" stroke="#000" stroke-width="1"/>')
+
+    for link in wmap.links:
+        source, target = components.get(link.source), components.get(link.target)
+        if source is None or target is None:
+            continue
+        style = 'stroke="#888" stroke-width="1"' if link.kind == "dependency" else \
+            'stroke="#2a7ae2" stroke-width="2" stroke-dasharray="6,3"'
+        out.append(f'<line x1="{x(source.maturity):.1f}" y1="{y(source.visibility):.1f}" '
+                   f'x2="{x(target.maturity):.1f}" y2="{y(target.visibility):.1f}" {style}/>')
+        if link.label:
+            out.append(f'<text x="{(x(source.maturity) + x(target.maturity)) / 2:.1f}" '
+                       f'y="{(y(source.visibility) + y(target.visibility)) / 2 - 4:.1f}" fill="#2a7ae2" '
+                       f'text-anchor="middle">{_escape(link.label)}</text>')
+
+    for evolve in wmap.evolves:
+        component = components.get(evolve.name)
+        if component is None:
+            continue
+        cy = y(component.visibility)
+        out.append(f'<line x1="{x(component.maturity) + 6:.1f}" y1="{cy:.1f}" x2="{x(evolve.maturity) - 7:.1f}" '
+                   f'y2="{cy:.1f}" stroke="#d0021b" stroke-dasharray="5,5" marker-end="url(#arrow)"/>')
+        out.append(f'<circle cx="{x(evolve.maturity):.1f}" cy="{cy:.1f}" r="5" fill="#fff" stroke="#d0021b"/>')
+        label = evolve.label if evolve.label and not evolve.label.startswith("[") else None
+        text = evolve.new_name or evolve.name
+        out.append(f'<text x="{x(evolve.maturity) + 8:.1f}" y="{cy - 6:.1f}" fill="#d0021b">'
+                   f'{_escape(text)}{" — " + _escape(label) if label else ""}</text>')
+
+    decorator_fill = {"build": "#000000", "buy": "#d6d6d6", "outsource": "#444444"}
+    for component in components.values():
+        cx, cy = x(component.maturity), y(component.visibility)
+        decorators = set(component.decorators) | set(wmap.decorators.get(component.name, ()))
+        for decorator in ("build", "buy", "outsource"):
+            if decorator in decorators:
+                out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="12" fill="{decorator_fill[decorator]}" '
+                           f'fill-opacity="0.25" stroke="none"/>')
+        if "inertia" in decorators:
+            out.append(f'<line x1="{cx + 14:.1f}" y1="{cy - 10:.1f}" x2="{cx + 14:.1f}" y2="{cy + 10:.1f}" '
+                       f'stroke="#000" stroke-width="5"/>')
+        dx, dy = component.label or (8, -6)
+        if component.kind == "anchor":
+            out.append(f'<text x="{cx:.1f}" y="{cy:.1f}" text-anchor="middle" font-weight="bold" '
+                       f'font-size="13">{_escape(component.name)}</text>')
+            continue
+        if component.kind == "market" or "market" in decorators:
+            out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="8" fill="#fff" stroke="#000"/>')
+            out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="2.5" fill="#000"/>')
+        elif component.kind == "ecosystem" or "ecosystem" in decorators:
+            out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="9" fill="#fff" stroke="#000" stroke-width="2"/>')
+            out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="4" fill="#fff" stroke="#000"/>')
+        else:
+            fill = "#000" if component.kind == "submap" else "#fff"
+            out.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="5" fill="{fill}" stroke="#000"/>')
+        out.append(f'<text x="{cx + dx:.1f}" y="{cy + dy:.1f}">{_escape(component.name)}</text>')
+
+    legend = []
+    for note in wmap.notes:
+        if note.kind == "annotation":
+            for visibility, maturity in note.points:
+                out.append(f'<circle cx="{x(maturity):.1f}" cy="{y(visibility):.1f}" r="9" fill="#fff" '
+                           f'stroke="#595959"/>')
+                out.append(f'<text x="{x(maturity):.1f}" y="{y(visibility) + 4:.1f}" text-anchor="middle" '
+                           f'font-size="10">{note.number}</text>')
+            legend.append(f"{note.number}. {note.text}")
+        else:
+            visibility, maturity = note.points[0]
+            prefix = {"accelerator": "» ", "deaccelerator": "« "}.get(note.kind, "")
+            out.append(f'<text x="{x(maturity):.1f}" y="{y(visibility):.1f}" font-weight="bold">'
+                       f'{_escape(prefix + note.text)}</text>')
+    if legend:
+        visibility, maturity = wmap.legend or (0.12, 0.72)
+        lx, ly = x(maturity), y(visibility)
+        box_height = 18 + 14 * len(legend)
+        box_width = min(canvas.plot_width, 20 + 6 * max(len(entry) for entry in legend))
+        out.append(f'<rect x="{lx:.1f}" y="{ly:.1f}" width="{box_width:.1f}" height="{box_height}" fill="#fff" '
+                   f'stroke="#595959"/>')
+        out.append(f'<text x="{lx + 8:.1f}" y="{ly + 14:.1f}" font-weight="bold">Annotations</text>')
+        for i, entry in enumerate(legend, start=1):
+            out.append(f'<text x="{lx + 8:.1f}" y="{ly + 14 + 14 * i:.1f}">{_escape(entry)}</text>')
+
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+class RenderCache:
+    """Rendered SVGs keyed by map hash, under ``.arckit/cache/wardley/`` when a workspace is known."""
+
+    def __init__(self, cache_dir: Path = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats = {"hits": 0, "rendered": 0}
+
+    @classmethod
+    def for_repo(cls, repo_root: Path):
+        return cls(Path(repo_root) / CACHE_DIR)
+
+    def key(self, wmap: WardleyMap) -> str:
+        return hashlib.sha256(f"{RENDERER_VERSION}\0{wmap.digest}".encode()).hexdigest()
+
+    def render(self, wmap: WardleyMap) -> str:
+        path = self.cache_dir / f"{self.key(wmap)}.svg" if self.cache_dir else None
+        if path is not None:
+            try:
+                svg = path.read_text(encoding="utf-8")
+                self.stats["hits"] += 1
+                return svg
+            except FileNotFoundError:
+                pass
+        svg = render_svg(wmap)
+        self.stats["rendered"] += 1
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_text(svg, encoding="utf-8")
+                os.replace(tmp, path)
+            except OSError:
+                pass
+        return svg
+
+
+def output_path(wmap: WardleyMap, count: int, output_dir: Path = None) -> Path:
+    """``<stem>.svg`` beside the source (``<stem>-N.svg`` when the file holds several maps)."""
+    name = f"{wmap.path.stem}.svg" if count == 1 else f"{wmap.path.stem}-{wmap.block}.svg"
+    return (Path(output_dir) if output_dir else wmap.path.parent) / name
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+# Comparison
+
+@dataclass
+class MapDiff:
+    """Differences between two versions of a map."""
+
+    old: WardleyMap
+    new: WardleyMap
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    renamed: list = field(default_factory=list)
+    moved: list = field(default_factory=list)
+    links_added: list = field(default_factory=list)
+    links_removed: list = field(default_factory=list)
+    evolves: list = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.renamed or self.moved or self.links_added
+                    or self.links_removed or self.evolves or self.old.title != self.new.title)
+
+    def to_json(self) -> dict:
+        def point(component):
+            return {"name": component.name, "visibility": component.visibility, "evolution": component.maturity,
+                    "stage": self.new.stage(component.maturity)}
+
+        return {
+            "old": self.old.label,
+            "new": self.new.label,
+            "title": {"old": self.old.title, "new": self.new.title} if self.old.title != self.new.title else None,
+            "added": [point(c) for c in self.added],
+            "removed": [point(c) for c in self.removed],
+            "renamed": [{"old": old.name, "new": new.name} for old, new in self.renamed],
+            "moved": [{"name": new.name, "from": [old.visibility, old.maturity], "to": [new.visibility, new.maturity],
+                       "stage": [self.old.stage(old.maturity), self.new.stage(new.maturity)]}
+                      for old, new in self.moved],
+            "links_added": [[source, target] for source, target in self.links_added],
+            "links_removed": [[source, target] for source, target in self.links_removed],
+            "evolves": [{"name": name, "from": old, "to": new} for name, old, new in self.evolves],
+        }
+
+
+def _same_point(a: Component, b: Component) -> bool:
+    return abs(a.visibility - b.visibility) <= MOVE_TOLERANCE and abs(a.maturity - b.maturity) <= MOVE_TOLERANCE
+
+
+def diff(old: WardleyMap, new: WardleyMap) -> MapDiff:
+    """Components, links and evolve targets that changed from ``old`` to ``new``.
+
+    A component that disappeared while one with a new name appeared at the
+    same position is reported as renamed; links are compared after
+    applying the renames.
+    """
+    result = MapDiff(old, new)
+    removed = [c for name, c in old.components.items() if name not in new.components]
+    added = [c for name, c in new.components.items() if name not in old.components]
+    for gone in list(removed):
+        match = next((c for c in added if _same_point(gone, c)), None)
+        if match is not None:
+            result.renamed.append((gone, match))
+            removed.remove(gone)
+            added.remove(match)
+    result.added, result.removed = added, removed
+    for name, component in new.components.items():
+        before = old.components.get(name)
+        if before is not None and not _same_point(before, component):
+            result.moved.append((before, component))
+
+    renames = {gone.name: match.name for gone, match in result.renamed}
+    old_links = {(renames.get(link.source, link.source), renames.get(link.target, link.target))
+                 for link in old.links}
+    new_links = {(link.source, link.target) for link in new.links}
+    result.links_added = sorted(new_links - old_links)
+    result.links_removed = sorted(old_links - new_links)
+
+    old_evolves = {renames.get(e.name, e.name): e.maturity for e in old.evolves}
+    new_evolves = {e.name: e.maturity for e in new.evolves}
+    for name in sorted(set(old_evolves) | set(new_evolves)):
+        if old_evolves.get(name) != new_evolves.get(name):
+            result.evolves.append((name, old_evolves.get(name), new_evolves.get(name)))
+    return result
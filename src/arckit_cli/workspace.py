@@ -0,0 +1,499 @@
+"""ArcKit workspace layout: repository root, projects and their artifacts.
+
+Python counterpart of the helpers in ``scripts/bash/common.sh`` and the
+scripts built on them (``create-project.sh``, ``check-prerequisites.sh``,
+``list-projects.sh``, ``generate-document-id.sh``); the ``*_json``
+functions reproduce those scripts' ``--json`` output byte for byte.
+Each project is inspected with a single ``os.scandir``
+pass (plus a peek into ``wardley-maps/`` and ``vendors/`` when present), and
+results can be kept in a persistent index that is revalidated with a few
+directory ``stat`` calls, so repeat listings only rescan projects that
+changed.
+"""
+
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .profiling import traced
+
+PROJECT_NUMBER_RE = re.compile(r"^([0-9]{3})-")
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+INDEX_FILE = ".arckit/cache/projects-index.json"
+INDEX_VERSION = 1
+
+# (JSON key, file or directory name, display name) in list-projects.sh order
+ARTIFACTS = [
+    ("stakeholder_drivers", "stakeholder-drivers.md", "Stakeholder Drivers"),
+    ("risk_register", "risk-register.md", "Risk Register"),
+    ("sobc", "sobc.md", "Strategic Outline Business Case"),
+    ("requirements", "requirements.md", "Requirements"),
+    ("data_model", "data-model.md", "Data Model"),
+    ("research_findings", "research-findings.md", "Research Findings"),
+    ("wardley_maps", "wardley-maps/", "Wardley Maps"),
+    ("sow", "sow.md", "Statement of Work"),
+    ("evaluation_criteria", "evaluation-criteria.md", "Evaluation Criteria"),
+    ("vendors", "vendors/", "Vendor Proposals"),
+]
+
+
+# Files and directories reported as AVAILABLE_DOCS by check-prerequisites.sh
+PREREQUISITE_DOCS = [
+    "stakeholder-drivers.md",
+    "risk-register.md",
+    "sobc.md",
+    "requirements.md",
+    "data-model.md",
+    "research-findings.md",
+    "sow.md",
+    "evaluation-criteria.md",
+    "traceability-matrix.md",
+    "servicenow-design.md",
+]
+
+# create-project.sh's next step, by the first artifact still missing
+NEXT_STEPS = [
+    ("stakeholder-drivers.md", ["/arckit.stakeholders - Analyze stakeholder drivers and goals"]),
+    ("risk-register.md", ["/arckit.risk - Create risk register"]),
+    ("sobc.md", ["/arckit.sobc - Create Strategic Outline Business Case"]),
+    ("requirements.md", ["/arckit.requirements - Define business and technical requirements"]),
+    ("data-model.md", ["/arckit.data-model - Design data model"]),
+    ("wardley-maps/", ["/arckit.research - Research technology options", "/arckit.wardley - Create Wardley maps"]),
+    ("sow.md", ["/arckit.sow - Generate Statement of Work for RFP"]),
+]
+FINAL_STEP = ["/arckit.evaluate - Create vendor evaluation framework"]
+
+PRINCIPLES_FILES = (".arckit/memory/architecture-principles.md", "templates/architecture-principles.md")
+
+
+class WorkspaceError(RuntimeError):
+    """Raised when the ArcKit workspace cannot be located."""
+
+
+def find_repo_root(start: Path = None) -> Path:
+    """Walk up from ``start`` to the directory containing ``.arckit``."""
+    current = Path(start or Path.cwd()).resolve()
+    for directory in (current, *current.parents):
+        if (directory / ".arckit").is_dir():
+            return directory
+    raise WorkspaceError("Not in an ArcKit project (no .arckit directory found)")
+
+
+def get_projects_dir(repo_root: Path) -> Path:
+    return Path(repo_root) / "projects"
+
+
+def workspace_paths(repo_root: Path) -> dict:
+    """The path variables check-prerequisites.sh reports, in its order."""
+    repo_root = str(repo_root)
+    return {
+        "REPO_ROOT": repo_root,
+        "ARCKIT_DIR": f"{repo_root}/.arckit",
+        "PROJECTS_DIR": f"{repo_root}/projects",
+        "MEMORY_DIR": f"{repo_root}/memory",
+        "TEMPLATES_DIR": f"{repo_root}/templates",
+    }
+
+
+def slugify(name: str) -> str:
+    """Kebab-case slug, as ``slugify`` in common.sh (only ASCII letters are lowered)."""
+    lowered = "".join(chr(ord(c) + 32) if "A" <= c <= "Z" else c for c in name)
+    return SLUG_RE.sub("-", lowered).strip("-")
+
+
+def next_project_number(repo_root: Path) -> str:
+    """One more than the highest ``NNN-`` project directory, zero-padded."""
+    highest = 0
+    try:
+        with os.scandir(get_projects_dir(repo_root)) as entries:
+            for entry in entries:
+                number = project_number(entry.name)
+                if number and not entry.name.startswith(".") and entry.is_dir():
+                    highest = max(highest, int(number))
+    except FileNotFoundError:
+        pass
+    return f"{highest + 1:03d}"
+
+
+def document_id(project: str, doc_type: str, version: str = "1.0") -> str:
+    """``ARC-NNN-TYPE-vX.Y``, as generate-document-id.sh."""
+    try:
+        number = int(project, 10)
+    except ValueError:
+        raise WorkspaceError(f"invalid project number: {project}") from None
+    return f"ARC-{number:03d}-{doc_type}-v{version}"
+
+
+def project_number(name: str) -> str:
+    """Return the ``NNN`` prefix of a project directory name, or ``""``."""
+    match = PROJECT_NUMBER_RE.match(name)
+    return match.group(1) if match else ""
+
+
+def find_project_dir(repo_root: Path, prefix: str) -> Path:
+    """Find a project by number or name, like ``find_project_dir_by_prefix``.
+
+    An exact match (``001`` or ``001-...``) wins over a substring match
+    (``payment`` for ``001-payment-gateway``).
+    """
+    project_dirs = list_project_dirs(repo_root)
+    if not project_dirs and not get_projects_dir(repo_root).is_dir():
+        raise WorkspaceError("No projects directory found")
+    for project_dir in project_dirs:
+        if project_dir.name == prefix or project_dir.name.startswith(f"{prefix}-"):
+            return project_dir
+    for project_dir in project_dirs:
+        if prefix in project_dir.name:
+            return project_dir
+    raise WorkspaceError(f"No project found matching: {prefix}")
+
+
+@dataclass
+class ProjectStatus:
+    """Artifact status of one project, in list-projects.sh's JSON schema."""
+
+    name: str
+    number: str
+    path: str
+    completion_percentage: int
+    vendor_count: int
+    artifacts: dict = field(default_factory=dict)
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+def _dir_state(path: str):
+    """Return (non-empty?, number of subdirectories) with one scandir."""
+    try:
+        with os.scandir(path) as entries:
+            count = 0
+            non_empty = False
+            for entry in entries:
+                non_empty = True
+                if entry.is_dir():
+                    count += 1
+            return non_empty, count
+    except (FileNotFoundError, NotADirectoryError):
+        return False, 0
+
+
+@traced("workspace.scan_project")
+def scan_project(project_dir: Path) -> ProjectStatus:
+    """Inspect a project directory in a single scandir pass."""
+    project_dir = Path(project_dir)
+    files = set()
+    dirs = set()
+    with os.scandir(project_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.add(entry.name)
+            elif entry.is_file():
+                files.add(entry.name)
+
+    wardley_present = "wardley-maps" in dirs and _dir_state(str(project_dir / "wardley-maps"))[0]
+    vendors_present, vendor_count = (
+        _dir_state(str(project_dir / "vendors")) if "vendors" in dirs else (False, 0)
+    )
+
+    artifacts = {}
+    for key, artifact, _ in ARTIFACTS:
+        if artifact == "wardley-maps/":
+            artifacts[key] = wardley_present
+        elif artifact == "vendors/":
+            artifacts[key] = vendors_present
+        else:
+            artifacts[key] = artifact in files
+
+    completed = sum(1 for present in artifacts.values() if present)
+    return ProjectStatus(
+        name=project_dir.name,
+        number=project_number(project_dir.name),
+        path=str(project_dir),
+        completion_percentage=completed * 100 // len(ARTIFACTS),
+        vendor_count=vendor_count,
+        artifacts=artifacts,
+    )
+
+
+def _mtime_ns(path: str):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _fingerprint(project_dir: str) -> list:
+    # Adding or removing artifacts changes the project directory's mtime;
+    # wardley-maps/ and vendors/ contents change their own mtimes
+    return [
+        _mtime_ns(project_dir),
+        _mtime_ns(os.path.join(project_dir, "wardley-maps")),
+        _mtime_ns(os.path.join(project_dir, "vendors")),
+    ]
+
+
+def _load_index(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("projects", {})
+
+
+def _save_index(path: Path, projects: dict):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "projects": projects}))
+        os.replace(tmp, path)
+    except OSError:
+        # Read-only workspaces still list correctly, just without the index
+        pass
+
+
+def list_project_dirs(repo_root: Path) -> list:
+    """Sorted project directories (non-hidden subdirectories of ``projects/``)."""
+    projects_dir = get_projects_dir(repo_root)
+    try:
+        with os.scandir(projects_dir) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+    except FileNotFoundError:
+        return []
+
+
+@traced("workspace.list_projects")
+def list_projects(repo_root: Path, use_index: bool = True) -> list:
+    """Return a :class:`ProjectStatus` for every project, using the index when allowed.
+
+    Projects whose directory fingerprints match the index are served from it;
+    only changed projects are rescanned.
+    """
+    repo_root = Path(repo_root)
+    index_path = repo_root / INDEX_FILE
+    index = _load_index(index_path) if use_index else {}
+    new_index = {}
+    statuses = []
+    changed = False
+
+    for project_dir in list_project_dirs(repo_root):
+        key = project_dir.name
+        fingerprint = _fingerprint(str(project_dir))
+        cached = index.get(key)
+        if cached and cached.get("fingerprint") == fingerprint and cached["status"]["path"] == str(project_dir):
+            status = ProjectStatus(**cached["status"])
+        else:
+            status = scan_project(project_dir)
+            changed = True
+        new_index[key] = {"fingerprint": fingerprint, "status": status.to_json()}
+        statuses.append(status)
+
+    if use_index and (changed or set(new_index) != set(index)):
+        _save_index(index_path, new_index)
+    return statuses
+
+
+def status_emoji(percentage: int) -> str:
+    if percentage == 100:
+        return "✅"
+    if percentage >= 75:
+        return "🟢"
+    if percentage >= 50:
+        return "🟡"
+    if percentage >= 25:
+        return "🟠"
+    return "🔴"
+
+
+def _json_array(items) -> str:
+    return "[" + ",".join(json.dumps(item, ensure_ascii=False) for item in items) + "]"
+
+
+def _json_string(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def has_principles(repo_root: Path) -> bool:
+    return any((Path(repo_root) / path).is_file() for path in PRINCIPLES_FILES)
+
+
+def next_steps(project_dir: Path) -> list:
+    """create-project.sh's suggested next commands for a project."""
+    project_dir = Path(project_dir)
+    for artifact, steps in NEXT_STEPS:
+        if artifact.endswith("/"):
+            if not _dir_state(str(project_dir / artifact.rstrip("/")))[0]:
+                return steps
+        elif not (project_dir / artifact).is_file():
+            return steps
+    return FINAL_STEP
+
+
+PROJECT_README = """# {name}
+
+Project ID: {number}
+Created: {created}
+
+## Overview
+
+[Project description to be added]
+
+## Workflow
+
+Use ArcKit commands to generate project artifacts in the recommended order:
+
+### Discovery Phase
+1. `/arckit.stakeholders` - Analyze stakeholder drivers and goals
+2. `/arckit.risk` - Create risk register
+3. `/arckit.sobc` - Create Strategic Outline Business Case
+
+### Alpha Phase
+4. `/arckit.requirements` - Define comprehensive requirements
+5. `/arckit.data-model` - Design data model and GDPR compliance
+6. `/arckit.wardley` - Create Wardley maps for strategic planning
+7. `/arckit.research` - Research technology options (if needed)
+8. `/arckit.sow` - Generate Statement of Work for vendor procurement (if needed)
+9. `/arckit.evaluate` - Create vendor evaluation framework (if needed)
+
+### Beta Phase
+10. `/arckit.hld-review` - Review High-Level Design
+11. `/arckit.dld-review` - Review Detailed Design
+12. `/arckit.traceability` - Generate requirements traceability matrix
+
+### Compliance (as needed)
+- `/arckit.secure` - UK Government Secure by Design review
+- `/arckit.tcop` - Technology Code of Practice assessment
+- `/arckit.ai-playbook` - AI Playbook compliance (for AI systems)
+
+## Project Structure
+
+Documents will be created in this directory as you run ArcKit commands:
+
+```
+{dir_name}/
+├── README.md (this file)
+├── stakeholder-analysis.md (from /arckit.stakeholders)
+├── risk-register.md (from /arckit.risk)
+├── sobc.md (from /arckit.sobc)
+├── requirements.md (from /arckit.requirements)
+├── data-model.md (from /arckit.data-model)
+├── sow.md (from /arckit.sow)
+├── evaluation-criteria.md (from /arckit.evaluate)
+├── traceability-matrix.md (from /arckit.traceability)
+├── hld-review-YYYYMMDD.md (from /arckit.hld-review)
+├── dld-review-YYYYMMDD.md (from /arckit.dld-review)
+├── wardley-maps/ (from /arckit.wardley)
+└── vendors/ (vendor proposals)
+```
+
+## Status
+
+Track your progress through the workflow:
+
+**Discovery Phase:**
+- [ ] Stakeholder analysis complete
+- [ ] Risk register created
+- [ ] Business case approved
+
+**Alpha Phase:**
+- [ ] Requirements defined
+- [ ] Data model designed
+- [ ] Vendor procurement started (if needed)
+
+**Beta Phase:**
+- [ ] HLD reviewed and approved
+- [ ] DLD reviewed and approved
+- [ ] Traceability matrix validated
+
+**Live Phase:**
+- [ ] Implementation complete
+- [ ] Production deployment
+"""
+
+
+@dataclass
+class CreatedProject:
+    """A project made by :func:`create_project`."""
+
+    name: str
+    number: str
+    path: Path
+    next_steps: list = field(default_factory=list)
+
+
+@traced("workspace.create_project")
+def create_project(repo_root: Path, name: str, number: str = None) -> CreatedProject:
+    """Create ``projects/NNN-slug`` with vendors/, final/ and a README, like create-project.sh.
+
+    Without ``number``, the next one is allocated from the
+    :class:`~arckit_cli.registry.Registry`, so concurrent callers never share one.
+    An explicit ``number`` is recorded there too, so later allocations skip it.
+    """
+    from .registry import Registry
+
+    number = Registry(repo_root).allocate_project(slugify(name), number)
+    dir_name = f"{number}-{slugify(name)}"
+    project_dir = get_projects_dir(repo_root) / dir_name
+    for directory in (project_dir, project_dir / "vendors", project_dir / "final"):
+        directory.mkdir(parents=True, exist_ok=True)
+    (project_dir / "README.md").write_text(
+        PROJECT_README.format(name=name, number=number, created=time.strftime("%Y-%m-%d"), dir_name=dir_name),
+        encoding="utf-8",
+    )
+    return CreatedProject(name, number, project_dir, next_steps(project_dir))
+
+
+def create_project_json(project: CreatedProject) -> str:
+    """create-project.sh ``--json`` output (without the trailing newline)."""
+    path = str(project.path)
+    fields = [
+        ("project_dir", path),
+        ("project_number", project.number),
+        ("project_name", project.name),
+        ("requirements_file", f"{path}/requirements.md"),
+        ("sow_file", f"{path}/sow.md"),
+        ("evaluation_file", f"{path}/evaluation-criteria.md"),
+        ("vendors_dir", f"{path}/vendors"),
+        ("traceability_file", f"{path}/traceability-matrix.md"),
+    ]
+    lines = ["{", '  "success": true,']
+    lines += [f'  "{key}": {_json_string(value)},' for key, value in fields]
+    lines += [f'  "next_steps": {_json_array(project.next_steps)}', "", "}"]
+    return "\n".join(lines)
+
+
+def available_docs(project_dir: Path) -> list:
+    """Artifacts present in a project, in check-prerequisites.sh's order."""
+    project_dir = Path(project_dir)
+    try:
+        with os.scandir(project_dir) as entries:
+            files = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return []
+    docs = [doc for doc in PREREQUISITE_DOCS if doc in files]
+    for directory in ("wardley-maps", "vendors"):
+        if _dir_state(str(project_dir / directory))[0]:
+            docs.append(f"{directory}/")
+    return docs
+
+
+def prerequisites_json(repo_root: Path, project_dir: Path = None, docs=()) -> str:
+    """check-prerequisites.sh ``--json`` output (without the trailing newline)."""
+    lines = ["{"]
+    lines += [f'  "{key}": {_json_string(value)},' for key, value in workspace_paths(repo_root).items()]
+    if project_dir:
+        lines.append(f'  "PROJECT_DIR": {_json_string(str(project_dir))},')
+        lines.append(f'  "PROJECT_NUMBER": {_json_string(project_number(Path(project_dir).name))},')
+    else:
+        lines += ['  "PROJECT_DIR": null,', '  "PROJECT_NUMBER": null,']
+    lines += [f'  "AVAILABLE_DOCS": {_json_array(docs)}', "", "}"]
+    return "\n".join(lines)
@@ -0,0 +1,131 @@
+"""Benchmark the bash helper scripts against their ``arckit projects`` ports.
+
+Builds a synthetic workspace, then runs each operation through the bash
+script and through ``arckit`` and reports, per invocation:
+
+- wall time (median of ``--rounds``)
+- processes forked, from the system-wide ``processes`` counter in
+  ``/proc/stat`` (Linux only; the machine should otherwise be idle)
+- the in-process cost of the shared Python implementation, which is what
+  other commands pay when they call it directly
+
+``--json`` outputs are compared byte for byte on the way.
+
+Usage: python tools/bench_bash_helpers.py [--projects N] [--rounds N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASH_DIR = Path(__file__).resolve().parent.parent / "scripts" / "bash"
+ARCKIT = [sys.executable, "-c", "import sys; from arckit_cli import main; sys.argv[0] = 'arckit'; main()"]
+
+ARTIFACT_FILES = ("stakeholder-drivers.md", "risk-register.md", "requirements.md", "sow.md")
+
+
+def forks() -> int:
+    try:
+        with open("/proc/stat") as f:
+            for line in f:
+                if line.startswith("processes "):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def run(command, cwd: Path):
+    before = forks()
+    start = time.perf_counter()
+    # ARCKIT_CLI="" keeps create-project.sh on its bash implementation
+    result = subprocess.run(command, cwd=cwd, capture_output=True, env={**os.environ, "ARCKIT_CLI": ""})
+    elapsed = time.perf_counter() - start
+    return elapsed, forks() - before if before >= 0 else None, result.stdout
+
+
+def make_workspace(root: Path, projects: int):
+    (root / ".arckit" / "memory").mkdir(parents=True)
+    (root / ".arckit" / "memory" / "architecture-principles.md").write_text("# Principles\n")
+    (root / "templates").mkdir()
+    (root / "templates" / "architecture-principles.md").write_text("# Principles\n")
+    for i in range(1, projects + 1):
+        project = root / "projects" / f"{i:03d}-project-{i}"
+        (project / "vendors").mkdir(parents=True)
+        for name in ARTIFACT_FILES[: i % (len(ARTIFACT_FILES) + 1)]:
+            (project / name).write_text(f"# {name}\n")
+        if i % 3 == 0:
+            (project / "vendors" / "acme").mkdir()
+        if i % 4 == 0:
+            (project / "wardley-maps").mkdir()
+            (project / "wardley-maps" / "map.md").write_text("map\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    from arckit_cli import workspace
+
+    operations = [
+        ("create-project", ["create-project.sh", "--name", "Bench Project", "--json"],
+         ["projects", "create", "--name", "Bench Project", "--json"],
+         lambda root: workspace.create_project_json(workspace.create_project(root, "Bench Project"))),
+        ("check-prerequisites", ["check-prerequisites.sh", "--json", "--project", "002"],
+         ["projects", "check", "--json", "--project", "002"],
+         lambda root: workspace.prerequisites_json(
+             root, workspace.find_project_dir(root, "002"),
+             workspace.available_docs(workspace.find_project_dir(root, "002")))),
+        ("list-projects", ["list-projects.sh", "--json"], ["projects", "list", "--json", "--no-index"],
+         lambda root: [status.to_json() for status in workspace.list_projects(root, use_index=False)]),
+        ("generate-document-id", ["generate-document-id.sh", "7", "REQ", "1.0"],
+         ["projects", "document-id", "7", "REQ", "1.0"],
+         lambda root: workspace.document_id("7", "REQ", "1.0")),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{args.projects} projects, {args.rounds} rounds, bash {shutil.which('bash')}\n")
+        print(f"{'operation':<22}{'bash ms':>9}{'forks':>7}{'arckit ms':>11}{'forks':>7}{'in-process ms':>15}  json")
+        for name, script, command, in_process in operations:
+            # Separate workspaces so create-project allocates the same numbers on both sides
+            roots = {}
+            for side in ("bash", "arckit", "python"):
+                roots[side] = Path(tmp) / f"{name}-{side}"
+                make_workspace(roots[side], args.projects)
+            results = {"bash": [], "arckit": []}
+            outputs = {}
+            for _ in range(args.rounds):
+                elapsed, forked, out = run(["bash", str(BASH_DIR / script[0]), *script[1:]], roots["bash"])
+                results["bash"].append((elapsed, forked))
+                outputs.setdefault("bash", []).append(out.replace(str(roots["bash"]).encode(), b"ROOT"))
+                elapsed, forked, out = run([*ARCKIT, *command], roots["arckit"])
+                results["arckit"].append((elapsed, forked))
+                outputs.setdefault("arckit", []).append(out.replace(str(roots["arckit"]).encode(), b"ROOT"))
+            samples = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                in_process(roots["python"])
+                samples.append(time.perf_counter() - start)
+
+            def summary(side):
+                wall = statistics.median(e for e, _ in results[side]) * 1000
+                counted = [f for _, f in results[side] if f is not None]
+                return wall, (statistics.median(counted) if counted else "n/a")
+
+            bash_ms, bash_forks = summary("bash")
+            arckit_ms, arckit_forks = summary("arckit")
+            same = "same" if outputs["bash"] == outputs["arckit"] else "DIFFERENT"
+            print(f"{name:<22}{bash_ms:>9.1f}{bash_forks:>7}{arckit_ms:>11.1f}{arckit_forks:>7}"
+                  f"{statistics.median(samples) * 1000:>15.2f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark initial-commit strategies on a freshly initialised ArcKit project.
+
+Compares the previous path (``git rev-parse`` check, then ``os.chdir`` and
+``git init`` / ``git add .`` / ``git commit``) with ``arckit_cli.git``'s
+single-pass ``bootstrap_repo`` (``.git`` walk, ``git init``, one
+``git fast-import``, ``git read-tree``).
+
+Usage: python tools/bench_git_bootstrap.py [--rounds N] [--ai claude|gemini|codex]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from arckit_cli.git import bootstrap_repo, is_git_repo
+from arckit_cli.installer import build_manifest, install
+from arckit_cli.paths import get_data_paths
+from arckit_cli.scaffold import asset_groups, project_directories, project_readme
+
+# Commits need an identity; keep the benchmark independent of user config
+IDENTITY = {
+    "GIT_AUTHOR_NAME": "ArcKit Bench",
+    "GIT_AUTHOR_EMAIL": "bench@arckit.invalid",
+    "GIT_COMMITTER_NAME": "ArcKit Bench",
+    "GIT_COMMITTER_EMAIL": "bench@arckit.invalid",
+}
+
+
+def legacy_bootstrap(project_path):
+    """The pre-bootstrap_repo implementation, kept for comparison."""
+    subprocess.run(["git", "rev-parse", "--is-inside-work-tree"],
+                   capture_output=True, cwd=project_path)
+    original_cwd = Path.cwd()
+    os.chdir(project_path)
+    try:
+        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
+        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
+        subprocess.run(["git", "commit", "-m", "Initial commit from ArcKit"],
+                       check=True, capture_output=True, text=True)
+    finally:
+        os.chdir(original_cwd)
+
+
+def fast_bootstrap(project_path):
+    if not is_git_repo(project_path):
+        bootstrap_repo(project_path)
+
+
+def scaffold(project_path, manifest, ai):
+    for directory in project_directories(ai):
+        (project_path / directory).mkdir(parents=True, exist_ok=True)
+    install(manifest, project_path)
+    (project_path / "README.md").write_text(project_readme(project_path.name, ai))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--ai", default="claude")
+    args = parser.parse_args()
+
+    os.environ.update(IDENTITY)
+    groups = asset_groups(get_data_paths(), args.ai)
+    manifest = build_manifest((src, pattern, prefix) for _, src, pattern, prefix in groups)
+
+    strategies = {"legacy (init/add/commit)": legacy_bootstrap, "fast-import": fast_bootstrap}
+    timings = {name: [] for name in strategies}
+    workdir = Path(tempfile.mkdtemp(prefix="arckit-git-bench-"))
+    try:
+        for round_number in range(args.rounds):
+            # Alternate order so neither strategy always runs with a warmer cache
+            names = list(strategies) if round_number % 2 == 0 else list(reversed(strategies))
+            for name in names:
+                project_path = workdir / f"{round_number}-{len(timings[name])}-{names.index(name)}"
+                scaffold(project_path, manifest, args.ai)
+                start = time.perf_counter()
+                strategies[name](project_path)
+                timings[name].append(time.perf_counter() - start)
+                shutil.rmtree(project_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{len(manifest) + 1} files, {args.rounds} rounds")
+    for name, samples in timings.items():
+        print(f"{name:26} median {statistics.median(samples) * 1000:7.1f} ms"
+              f"  min {min(samples) * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
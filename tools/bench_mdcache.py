@@ -0,0 +1,105 @@
+"""Benchmark cold versus warm markdown parsing with ``arckit_cli.mdcache``.
+
+Parses every file of the template corpus (``.arckit/templates`` by default,
+about 17k lines) and reports the median of several rounds for:
+
+- ``reparse``: reading and parsing every file with no cache, for reference
+- ``cold``: first load into an empty cache (parse + write the records)
+- ``warm disk``: a new process-level cache reading the marshal records
+- ``warm memory``: the same cache again, served from its LRU
+- ``touched``: mtimes changed but content not, so hashes are compared
+  instead of parsing
+- ``one section``: warm load plus the text of one section via mmap
+
+Usage: python tools/bench_mdcache.py [--rounds N] [--corpus DIR]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from arckit_cli.mdcache import MdCache, parse
+
+
+def timed(fn, rounds: int, setup=None) -> float:
+    samples = []
+    for _ in range(rounds):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        fn(state)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--corpus", type=Path, default=Path(".arckit/templates"))
+    args = parser.parse_args()
+
+    files = sorted(args.corpus.glob("*.md"))
+    if not files:
+        parser.error(f"no markdown files in {args.corpus}")
+    lines = sum(f.read_bytes().count(b"\n") for f in files)
+    size = sum(f.stat().st_size for f in files)
+    print(f"{len(files)} files, {lines:,} lines, {size / 1024:.0f} KiB in {args.corpus}\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rounds = iter(range(10 ** 6))
+
+        def reparse(_):
+            for f in files:
+                parse(f.read_bytes())
+
+        def fresh_dir():
+            return MdCache(tmp / f"cold-{next(rounds)}")
+
+        def load_all(cache):
+            for f in files:
+                cache.load(f)
+            cache.save()
+
+        warm_dir = tmp / "warm"
+        load_all(MdCache(warm_dir))
+        memory = MdCache(warm_dir)
+        load_all(memory)
+
+        def touch():
+            now = time.time_ns()
+            for f in files:
+                st = f.stat()
+                os.utime(f, ns=(st.st_atime_ns, now))
+            return MdCache(warm_dir)
+
+        def one_section(cache):
+            document = cache.load(files[len(files) // 2])
+            document.text(document.sections[len(document.sections) // 2])
+
+        originals = {f: f.stat() for f in files}
+        results = [
+            ("reparse", timed(reparse, args.rounds)),
+            ("cold", timed(load_all, args.rounds, fresh_dir)),
+            ("warm disk", timed(load_all, args.rounds, lambda: MdCache(warm_dir))),
+            ("warm memory", timed(load_all, args.rounds, lambda: memory)),
+        ]
+        try:
+            results.append(("touched", timed(load_all, args.rounds, touch)))
+        finally:
+            for f, st in originals.items():
+                os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+        results.append(("one section", timed(one_section, args.rounds, lambda: MdCache(warm_dir))))
+
+        sections = sum(len(MdCache(warm_dir).load(f).sections) for f in files)
+        tables = sum(len(MdCache(warm_dir).load(f).tables) for f in files)
+        print(f"{sections:,} sections, {tables:,} tables\n")
+        cold = results[1][1]
+        for name, seconds in results:
+            print(f"{name:<12} {seconds * 1000:8.2f} ms   {cold / seconds if seconds else 0:6.1f}x vs cold")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Exercise the shared async transport against a local HTTP stand-in.
+
+Serves generated documents from a throwaway HTTP server and checks that:
+
+- a ``max-age`` response is answered from disk without a request,
+- a stale response is revalidated with If-None-Match and a 304,
+- ``no-store`` responses are never cached,
+- a 206 to a ``Range`` request is not stored, and ranged requests are
+  never answered from the cache,
+- 503 + Retry-After is retried with backoff,
+- a request backing off does not hold its host's slot,
+- the origin being down serves the stale copy,
+- no more than the per-host limit of requests are in flight at once,
+- the cache evicts least recently used entries to stay under its size.
+
+Usage: python tools/check_http_transport.py [--documents N]
+"""
+
+import argparse
+import hashlib
+import http.server
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+class DocumentHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = {}
+    retry_after = {}
+    requests = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((self.path, self.headers.get("If-None-Match")))
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            self._respond(cls)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def _respond(self, cls):
+        if cls.failures.get(self.path):
+            cls.failures[self.path] -= 1
+            self.send_response(503)
+            self.send_header("Retry-After", cls.retry_after.get(self.path, "0"))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        time.sleep(0.02)
+        body = (self.path * 64).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "max-age=0")
+            self.end_headers()
+            return
+        if self.headers.get("Range") and self.path.startswith("/ranged"):
+            start, end = (int(n) for n in self.headers["Range"].split("=")[1].split("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+            self.send_header("Cache-Control", "max-age=3600")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            self.wfile.write(body[start:end + 1])
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        if self.path.startswith("/fresh"):
+            self.send_header("Cache-Control", "max-age=3600")
+        elif self.path.startswith("/private"):
+            self.send_header("Cache-Control", "no-store")
+        else:
+            self.send_header("Cache-Control", "max-age=0")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=40)
+    args = parser.parse_args()
+
+    from arckit_cli import net
+    from arckit_cli.httpcache import HttpCache
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), DocumentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    failures = []
+
+    def check(condition, message):
+        print(f"{'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            failures.append(message)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp)
+        fresh = [f"{base}/fresh/{i}" for i in range(args.documents)]
+
+        responses, metrics = net.fetch_many(fresh, cache=HttpCache(cache_path), per_host=4)
+        check(all(r.status_code == 200 for r in responses), f"{len(fresh)} documents fetched")
+        check(DocumentHandler.peak <= 4, f"per-host limit held (peak {DocumentHandler.peak} in flight)")
+
+        seen = len(DocumentHandler.requests)
+        responses, metrics = net.fetch_many(fresh, cache=HttpCache(cache_path))
+        check(len(DocumentHandler.requests) == seen and metrics.hits == len(fresh),
+              f"fresh responses served from disk (hit rate {metrics.hit_rate:.0%}, p95 {metrics.to_json()['p95_ms']} ms)")
+        check(responses[0].content == ("/fresh/0" * 64).encode(), "cached body matches")
+
+        stale = f"{base}/stale/doc"
+        net.fetch_many([stale], cache=HttpCache(cache_path))
+        (response,), metrics = net.fetch_many([stale], cache=HttpCache(cache_path))
+        check(response.extensions["cache"] == "revalidated" and DocumentHandler.requests[-1][1],
+              "stale response revalidated with If-None-Match")
+
+        private = f"{base}/private/doc"
+        net.fetch_many([private], cache=HttpCache(cache_path))
+        (response,), _ = net.fetch_many([private], cache=HttpCache(cache_path))
+        check(response.extensions["cache"] == "miss", "no-store response not cached")
+
+        ranged = f"{base}/ranged/doc"
+        net.fetch_many([ranged], {"Range": "bytes=0-3"}, cache=HttpCache(cache_path))
+        (response,), _ = net.fetch_many([ranged], cache=HttpCache(cache_path))
+        whole = response.extensions["cache"] == "miss" and response.content == ("/ranged/doc" * 64).encode()
+        (response,), _ = net.fetch_many([ranged], {"Range": "bytes=0-3"}, cache=HttpCache(cache_path))
+        check(whole and response.status_code == 206 and response.extensions["cache"] == "miss",
+              "partial content not cached, ranged requests bypass the cache")
+
+        flaky = f"{base}/flaky/doc"
+        DocumentHandler.failures[flaky[len(base):]] = 2
+        (response,), metrics = net.fetch_many([flaky], cache=HttpCache(cache_path), backoff=0.01)
+        check(response.status_code == 200 and metrics.retries == 2, "503 + Retry-After retried until success")
+
+        backing_off = f"{base}/backoff/doc"
+        DocumentHandler.failures[backing_off[len(base):]] = 1
+        DocumentHandler.retry_after[backing_off[len(base):]] = "1"
+        others = [f"{base}/other/{i}" for i in range(3)]
+        seen = len(DocumentHandler.requests)
+        responses, _ = net.fetch_many([backing_off, *others], cache=False, per_host=1)
+        order = [path for path, _ in DocumentHandler.requests[seen:]]
+        check(all(r.status_code == 200 for r in responses) and order[0] == order[-1] == backing_off[len(base):],
+              "per-host slot released while backing off (other requests ran during the wait)")
+
+        server.shutdown()
+        server.server_close()
+        (response,), metrics = net.fetch_many([stale], cache=HttpCache(cache_path), retries=1, backoff=0.01)
+        check(not isinstance(response, Exception) and response.extensions["cache"] == "stale",
+              "stale copy served while the origin is down")
+        (response,), _ = net.fetch_many([f"{base}/missing"], cache=HttpCache(cache_path), retries=1, backoff=0.01)
+        check(isinstance(response, Exception), f"uncached URL fails once retries are exhausted ({type(response).__name__})")
+
+        cache = HttpCache(cache_path)
+        total = cache.stats()["bytes"]
+        cache.lookup(fresh[0])
+        cache.max_bytes = total // 2
+        removed = cache.evict()
+        stats = cache.stats()
+        check(stats["bytes"] <= total // 2 and cache.lookup(fresh[0]) and not cache.lookup(fresh[1]),
+              f"LRU eviction kept the recently used entry ({removed} evicted)")
+        check(stats["requests"] > 0 and stats["hit_rate"] > 0, f"counters persisted (hit rate {stats['hit_rate']:.0%})")
+        cache.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
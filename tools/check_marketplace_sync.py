@@ -0,0 +1,140 @@
+"""Exercise ``arckit marketplace sync`` against a local HTTP stand-in.
+
+Serves a generated catalogue export from a throwaway HTTP server that
+honours ETag/If-None-Match, Last-Modified and Range/If-Range, drops the
+connection halfway through the first download, and checks that:
+
+- the interrupted download is resumed rather than restarted,
+- the stored export decompresses to the served bytes,
+- a second sync is answered with 304 Not Modified,
+- a changed export is downloaded again and reloaded,
+- an export that fails to load keeps the previous services and is
+  fetched again on the next sync rather than answered with 304,
+- ``search`` finds services by text, lot, capability and price.
+
+Usage: python tools/check_marketplace_sync.py [--services N]
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import http.server
+import io
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+
+class CatalogueHandler(http.server.BaseHTTPRequestHandler):
+    body = b""
+    drop_next = False
+    requests = []
+
+    def do_GET(self):
+        cls = type(self)
+        etag = '"' + hashlib.sha256(cls.body).hexdigest()[:16] + '"'
+        cls.requests.append({k: v for k, v in self.headers.items()
+                             if k in ("If-None-Match", "If-Modified-Since", "Range", "If-Range")})
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        data = cls.body
+        status = 200
+        if self.headers.get("Range") and self.headers.get("If-Range") == etag:
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            data = data[start:]
+            status = 206
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if cls.drop_next:
+            cls.drop_next = False
+            self.wfile.write(data[: len(data) // 2])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def catalogue(services: int, seed: str = "") -> bytes:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["Service ID", "Service name", "Supplier name", "Lot", "Service description",
+                     "Service features", "Price"])
+    lots = ("Cloud hosting", "Cloud software", "Cloud support")
+    for i in range(services):
+        writer.writerow([f"{seed}{i}", f"Managed Kubernetes {i}", f"Supplier {i % 97}", lots[i % 3],
+                         "Managed container platform with monitoring", "Kubernetes; Prometheus; Backup",
+                         f"£{i % 500 + 1}.00 to £{i % 500 + 1000}.00 per unit per month"])
+    return out.getvalue().encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, default=20000)
+    args = parser.parse_args()
+
+    from arckit_cli.marketplace import search, source_key, sync
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), CatalogueHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/gcloud.csv"
+    failures = []
+
+    def check(condition, message):
+        print(f"{'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            failures.append(message)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = Path(tmp)
+        CatalogueHandler.body = catalogue(args.services)
+        CatalogueHandler.drop_next = True
+
+        first = sync([url], store, framework="G-Cloud 14")[0]
+        check(first.error is not None, "interrupted download is reported as an error")
+        second = sync(store=store)[0]
+        check(second.status == "resumed" and CatalogueHandler.requests[-1].get("Range"),
+              f"second sync resumes with a Range request ({second.bytes_received:,} bytes)")
+        stored = gzip.decompress((store / "exports" / f"{source_key(url)}.gz").read_bytes())
+        check(stored == CatalogueHandler.body, "stored export matches the served bytes")
+        check(second.services == args.services, f"{second.services:,} services loaded")
+
+        third = sync(store=store)[0]
+        check(third.status == "not-modified", "unchanged export is answered with 304")
+
+        CatalogueHandler.body = catalogue(args.services + 1, seed="v2-")
+        fourth = sync(store=store)[0]
+        check(fourth.status == "downloaded" and fourth.services == args.services + 1,
+              "changed export is downloaded and reloaded")
+
+        CatalogueHandler.body = b'[{"Service ID": "broken", "Service name": '
+        fifth = sync(store=store)[0]
+        kept = search(store, limit=args.services + 10)
+        check(fifth.error is not None and len(kept) == args.services + 1,
+              f"an export that fails to load keeps the previous {len(kept):,} services")
+        sixth = sync(store=store)[0]
+        check(sixth.status == "downloaded" and sixth.error is not None,
+              "the failed export is fetched again, not answered with 304")
+        CatalogueHandler.body = catalogue(args.services + 1, seed="v2-")
+        seventh = sync(store=store)[0]
+        check(seventh.status == "not-modified" and seventh.services == args.services + 1,
+              "restoring the loaded export is answered with 304")
+
+        hits = search(store, "kubernetes", lot="cloud hosting", capabilities=["prometheus"], max_price=10)
+        check(bool(hits) and all(h.lot == "Cloud hosting" and h.price_min <= 10 for h in hits),
+              f"search filters by text, lot, capability and price ({len(hits)} hits)")
+
+    server.shutdown()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Stress the document-ID registry with concurrent allocator processes.
+
+Starts ``--processes`` workers against one workspace, released together,
+each making ``--allocations`` rounds of: a project number, a document
+registration and a version bump of one shared document. Then checks that:
+
+- every project number was handed out exactly once, with no gaps,
+- every version bump of the shared document returned a distinct version,
+- the journal has one line per allocation and rebuilding from it
+  reproduces the state files,
+- a torn journal line and a journal entry missing from the state files
+  (a process killed mid-allocation) are recovered on the next allocation,
+- create-project.sh allocates from the registry when ``ARCKIT_CLI`` is
+  set, ``create_project(number=...)`` records its number, and a
+  directory made by hand is picked up by ``rebuild``, so later
+  allocations skip all three,
+- allocation time does not grow with the size of the registry.
+
+Usage: python tools/check_registry.py [--processes N] [--allocations N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CREATE_PROJECT = Path(__file__).resolve().parent.parent / "scripts" / "bash" / "create-project.sh"
+ARCKIT = [sys.executable, "-c", "import sys; from arckit_cli import main; sys.argv[0] = 'arckit'; main()"]
+
+
+def worker(root: str, allocations: int, start, results):
+    from arckit_cli.registry import Registry
+
+    registry = Registry(Path(root))
+    start.wait()
+    numbers, ids, bumps = [], [], []
+    for _ in range(allocations):
+        number = registry.allocate_project(f"worker-{os.getpid()}")
+        numbers.append(number)
+        ids.append(registry.register_document(number, "REQ"))
+        bumps.append(registry.bump_version("001", "HLD"))
+    results.put((numbers, ids, bumps))
+
+
+def timed(registry, count: int) -> float:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        registry.allocate_project("timing")
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=16)
+    parser.add_argument("--allocations", type=int, default=25)
+    args = parser.parse_args()
+
+    from arckit_cli.registry import DOCUMENTS_DIR, HEAD_FILE, LOG_FILE, Registry
+    from arckit_cli.workspace import create_project
+
+    failures = []
+
+    def check(condition, message):
+        print(f"{'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            failures.append(message)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "projects" / "001-existing").mkdir(parents=True)
+        registry = Registry(root)
+        registry.register_document("001", "HLD")
+
+        context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        start, results = context.Event(), context.Queue()
+        workers = [context.Process(target=worker, args=(tmp, args.allocations, start, results))
+                   for _ in range(args.processes)]
+        for process in workers:
+            process.start()
+        began = time.perf_counter()
+        start.set()
+        collected = []
+        while len(collected) < len(workers):
+            try:
+                collected.append(results.get(timeout=1))
+            except queue.Empty:
+                if not any(process.is_alive() for process in workers):
+                    break
+        elapsed = time.perf_counter() - began
+        for process in workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+        if len(collected) < len(workers):
+            check(False, f"{len(workers) - len(collected)} of {len(workers)} workers failed")
+            sys.exit(1)
+
+        total = args.processes * args.allocations
+        numbers = [n for result in collected for n in result[0]]
+        ids = [i for result in collected for i in result[1]]
+        bumps = [b for result in collected for b in result[2]]
+        print(f"{args.processes} processes x {args.allocations} rounds: {total * 3} allocations "
+              f"in {elapsed:.2f}s ({elapsed / (total * 3) * 1000:.2f} ms each)")
+        check(sorted(numbers) == [f"{n:03d}" for n in range(2, total + 2)],
+              f"{total} project numbers unique and contiguous (002-{total + 1:03d})")
+        check(all(i == f"ARC-{n}-REQ-v1.0" for n, i in zip(numbers, ids)), "documents registered under their projects")
+        check(len(set(bumps)) == total and registry.current_version("001", "HLD") == f"1.{total}",
+              f"{total} version bumps distinct, ending at v1.{total}")
+
+        log_path = root / ".arckit" / "registry" / LOG_FILE
+        lines = log_path.read_bytes().splitlines()
+        check(len(lines) == 2 + total * 3, f"journal has one line per allocation ({len(lines)})")
+        state = {path.name: path.read_bytes() for path in (log_path.parent / DOCUMENTS_DIR).glob("*.json")}
+        head = json.loads((log_path.parent / HEAD_FILE).read_text())
+        registry.rebuild()
+        check(state == {path.name: path.read_bytes() for path in (log_path.parent / DOCUMENTS_DIR).glob("*.json")}
+              and json.loads((log_path.parent / HEAD_FILE).read_text()) == head,
+              "rebuild from the journal reproduces the state files")
+
+        # A process killed after journalling, before updating the state files
+        entry = {"seq": head["seq"] + 1, "op": "project", "number": f"{total + 2:03d}", "name": "killed",
+                 "at": "", "pid": 0}
+        with open(log_path, "ab") as f:
+            f.write(json.dumps(entry).encode() + b"\n")
+            f.write(b'{"seq": 999, "op": "proj')
+        number = registry.allocate_project("after-crash")
+        check(number == f"{total + 3:03d}", f"journalled-but-unapplied entry replayed, torn line dropped (got {number})")
+        check(all(json.loads(line) for line in log_path.read_bytes().splitlines()), "journal is clean after recovery")
+
+        # create-project.sh hands off to the CLI named by ARCKIT_CLI
+        expected = registry.status()["next_project"]
+        wrapper = root / "arckit-cli"
+        wrapper.write_text(f"#!/bin/sh\nexec {' '.join(map(shlex.quote, ARCKIT))} \"$@\"\n")
+        wrapper.chmod(0o755)
+        result = subprocess.run(["bash", str(CREATE_PROJECT), "--name", "From Script", "--json", "--force"],
+                                cwd=root, capture_output=True, env={**os.environ, "ARCKIT_CLI": str(wrapper)})
+        created = json.loads(result.stdout or b"{}").get("project_number")
+        journalled = [entry["number"] for entry in registry.entries() if entry.get("name") == "from-script"]
+        check(created == expected and journalled == [expected],
+              f"create-project.sh allocates from the registry (got {created}, journalled {journalled})")
+        number = registry.allocate_project("after-script")
+        check(number == f"{int(expected) + 1:03d}", f"allocation continues past create-project.sh (got {number})")
+
+        explicit = f"{int(number) + 5:03d}"
+        create_project(root, "explicit", number=explicit)
+        number = registry.allocate_project("after-explicit")
+        check(number == f"{int(explicit) + 1:03d}",
+              f"allocation continues past create_project(number={explicit}) (got {number})")
+
+        by_hand = f"{int(number) + 5:03d}"
+        (root / "projects" / f"{by_hand}-by-hand").mkdir()
+        registry.rebuild()
+        number = registry.allocate_project("after-rebuild")
+        check(number == f"{int(by_hand) + 1:03d}", f"rebuild picks up a directory made by hand (got {number})")
+
+        small = timed(registry, 50)
+        for n in range(2000):
+            registry.register_document(f"{n % 999 + 1}", f"T{n // 999}")
+        for _ in range(2000):
+            registry.allocate_project("filler")
+        large = timed(registry, 50)
+        check(large < small * 3, f"allocation cost flat as the registry grows "
+                                 f"({small:.2f} ms at {total} projects, {large:.2f} ms after 4,000 more entries)")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
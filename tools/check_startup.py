@@ -0,0 +1,76 @@
+"""Enforce import-time budgets for the ArcKit CLI entry points.
+
+Runs ``python -X importtime`` for each entry point in a fresh interpreter and
+fails if it exceeds its cumulative budget or pulls in a module that only
+network or installer code paths should need.
+
+Usage: python tools/check_startup.py [--scale FACTOR]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Modules that must never be imported just to show help or run `arckit check`.
+FORBIDDEN = ("httpx", "truststore", "ssl", "readchar", "platformdirs")
+
+
+def budgets():
+    """Entry point -> (modules it imports, cumulative budget in milliseconds)."""
+    from arckit_cli.cli import COMMANDS
+
+    # Rendering the top-level help loads every subcommand to read its summary
+    help_modules = ("arckit_cli.cli",) + tuple(
+        f"arckit_cli.commands.{module}" for module in dict.fromkeys(COMMANDS.values())
+    )
+    return {
+        "arckit --help": (help_modules, 250),
+        "arckit check": (("arckit_cli.cli", "arckit_cli.commands.check"), 200),
+    }
+
+
+def measure_imports(modules):
+    """Return {module: cumulative_us} for importing modules under -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply every budget (for slow CI runners)")
+    args = parser.parse_args()
+
+    failures = 0
+    for entry_point, (modules, budget_ms) in budgets().items():
+        timings = measure_imports(modules)
+        # Each top-level import's cumulative time already includes its children
+        elapsed_ms = sum(timings.get(name, 0) for name in modules) / 1000
+        limit = budget_ms * args.scale
+        loaded = sorted(name for name in timings if name.split(".")[0] in FORBIDDEN)
+        status = "ok"
+        if elapsed_ms > limit or loaded:
+            status = "FAIL"
+            failures += 1
+        print(f"{status:4} {entry_point}: {elapsed_ms:.1f} ms (budget {limit:.0f} ms)")
+        for name in loaded:
+            print(f"     imports forbidden module: {name}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()